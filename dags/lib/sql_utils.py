@@ -227,6 +227,7 @@ def upsert_model_instances(
     conflict_columns: Optional[List[str]] = None,
     on_conflict_update: bool = False,
     latest_check_column: str = None,
+    returning: bool = True,
 ) -> List[DeclarativeMeta]:
     """
     Bulk upsert SQLAlchemy ORM model instances into SQL database tables, handling
@@ -247,8 +248,11 @@ def upsert_model_instances(
     :param latest_check_column: If specified, only update rows where the value in this
         column is greater than the existing value. Useful for time/version-based
         updates.
+    :param returning: If True, return the persisted instances. Set to False when the
+        result is not needed, e.g. for insert-only time series, to skip the RETURNING
+        clause and the follow-up query that retrieves rows ignored on conflict.
     :return: List of SQLAlchemy model instances as persisted in the database after
-        upsert.
+        upsert, or an empty list if `returning` is False.
     """
 
     if not model_instances:
@@ -275,8 +279,10 @@ def upsert_model_instances(
         conflict_columns=conflict_columns,
         on_conflict_update=on_conflict_update,
         latest_check_column=latest_check_column,
-        returning_columns=model_columns,
+        returning_columns=model_columns if returning else None,
     )
+    if not returning:
+        return []
 
     persisted_instances = [model(**result) for result in results]
 
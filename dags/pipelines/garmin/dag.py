@@ -57,6 +57,9 @@ with dag:
             "data_interval_end": (
                 "{{ dag_run.conf.get('data_interval_end') or data_interval_end }}"
             ),
+            # Concurrent FIT activity downloads. Raise to download in parallel, at
+            # the cost of a proportionally higher request rate to Garmin Connect.
+            "max_workers": 1,
         },
         doc_md=(
             "Download data from Garmin Connect for the specified date range. Files are "
@@ -5,16 +5,21 @@ Extracts FIT activity files and JSON Garmin data from Garmin Connect API and sav
 to the ingest directory for further processing by the ETL pipeline.
 """
 
-import json
+import os
+import shutil
 import time
 import zipfile
 import io
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta, date
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import BinaryIO, Iterator, List, Optional, Union
 
 import fire
+import orjson
 import pendulum
 from airflow.exceptions import AirflowSkipException
 from garminconnect import Garmin
@@ -26,6 +31,50 @@ from dags.pipelines.garmin.constants import (
     GARMIN_DATA_REGISTRY,
 )
 
+# Upper bound for the buffer used to stream FIT files out of downloaded archives.
+FIT_COPY_BUFFER_SIZE = 1 << 20  # 1 MiB.
+
+
+@lru_cache(maxsize=None)
+def _midday_timestamp(file_date: date) -> str:
+    """
+    Get the ISO 8601 UTC midday timestamp used in filenames for a date.
+
+    Cached since every data type and activity saved for the same day shares the same
+    timestamp.
+
+    :param file_date: Date to build the timestamp for.
+    :return: ISO 8601 timestamp string (e.g., 2025-01-01T12:00:00Z).
+    """
+
+    midday_datetime = datetime.combine(file_date, datetime.min.time()).replace(
+        hour=12, minute=0, second=0
+    )
+    return pendulum.instance(midday_datetime, tz="UTC").to_iso8601_string()
+
+
+@contextmanager
+def _atomic_write(filepath: Path) -> Iterator[BinaryIO]:
+    """
+    Open a binary file that only appears at its final path once fully written.
+
+    Data is written to a hidden temporary file in the same directory, which is then
+    renamed over the destination with os.replace(). The temporary file is removed if
+    writing fails.
+
+    :param filepath: Final destination path.
+    :return: Writable binary file object for the temporary file.
+    """
+
+    tmp_path = filepath.with_name(f".{filepath.name}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            yield f
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 class GarminExtractor:
     """
@@ -50,6 +99,7 @@ class GarminExtractor:
         end_date: date,
         ingest_dir: Path,
         data_types: Optional[List[str]] = None,
+        max_workers: int = 1,
     ) -> None:
         """
         Initialize the Garmin extractor with date range and target directory.
@@ -59,12 +109,17 @@ class GarminExtractor:
         :param ingest_dir: Directory to save extracted files.
         :param data_types: Optional list of data type names to extract (e.g., ['SLEEP',
             'HRV']). If None, extracts all available data types.
+        :param max_workers: Maximum number of concurrent FIT activity downloads.
+            Defaults to 1 (serial). Workers share the Garmin client, whose thread
+            safety is not documented, and each worker applies the rate limiting delay
+            on its own, so raising it also raises the request rate.
         """
 
         self.start_date = start_date
         self.end_date = end_date
         self.ingest_dir = ingest_dir
         self.data_types = data_types
+        self.max_workers = max_workers
         self.garmin_client = None
         self.user_id = None
 
@@ -234,9 +289,10 @@ class GarminExtractor:
                 f"Fetching {data_type.emoji} {data_type.name} data for {current_date}."
             )
 
+            date_str = current_date.isoformat()  # YYYY-MM-DD.
+
             # Get API method dynamically.
             api_method = getattr(self.garmin_client, data_type.api_method)
-            date_str = current_date.strftime("%Y-%m-%d")
 
             # Call API method with appropriate parameters based on type.
             if data_type.api_method_time_param == APIMethodTimeParam.DAILY:
@@ -326,22 +382,108 @@ class GarminExtractor:
         """
 
         # Create midday timestamp for consistent grouping.
-        midday_datetime = datetime.combine(file_date, datetime.min.time()).replace(
-            hour=12, minute=0, second=0
-        )
-        timestamp = pendulum.instance(midday_datetime, tz="UTC").to_iso8601_string()
+        timestamp = _midday_timestamp(file_date)
 
         # Generate filename: {user_id}_{DATA_TYPE}_{timestamp}.json.
         filename = f"{self.user_id}_{data_type.name}_{timestamp}.json"
         filepath = self.ingest_dir / filename
 
-        # Save data.
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        # Save data, serialized to UTF-8 bytes natively and written in a single call.
+        # Non-str keys are stringified as json.dump() did. Non-finite floats (NaN,
+        # Infinity) are written as null, keeping the file valid JSON.
+        filepath.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
 
         LOGGER.info(f"✅ Saved {data_type.emoji} {data_type.name}: {filename}.")
         return [filepath]
 
+    def _save_fit_file(
+        self, fit_data: Union[bytes, BinaryIO], filepath: Path, activity_id: str
+    ) -> Optional[int]:
+        """
+        Save a downloaded FIT activity file, unpacking it from its ZIP archive.
+
+        The archive member is streamed straight to the destination file instead of being
+        read into memory first, so peak memory stays bounded by the copy buffer rather
+        than by the decompressed FIT file size. Non-ZIP payloads are written as-is.
+        File-like payloads are read in place rather than copied into a new buffer.
+        Files are written atomically, so an interrupted download never leaves a partial
+        FIT file in the ingest directory.
+
+        :param fit_data: Raw download payload (ZIP archive or bare FIT file), as bytes
+            or a seekable binary file object.
+        :param filepath: Destination path for the FIT file.
+        :param activity_id: Garmin activity ID, used for logging.
+        :return: Size of the saved file in bytes, or None if the archive or its FIT file
+            was empty.
+        """
+
+        fit_stream = io.BytesIO(fit_data) if isinstance(fit_data, bytes) else fit_data
+
+        try:
+            with zipfile.ZipFile(fit_stream, "r") as zip_ref:
+                # Get the first (and typically only) file from the ZIP.
+                zip_members = zip_ref.infolist()
+                if not zip_members:
+                    LOGGER.warning(f"⚠️ Empty ZIP archive for activity {activity_id}.")
+                    return None
+
+                member = zip_members[0]
+                if member.file_size == 0:
+                    LOGGER.warning(f"⚠️ Empty FIT file in archive for {activity_id}.")
+                    return None
+
+                # Stream the FIT file content to disk, buffering at most 1 MiB.
+                buffer_size = min(member.file_size, FIT_COPY_BUFFER_SIZE)
+                with zip_ref.open(member) as src, _atomic_write(filepath) as dst:
+                    shutil.copyfileobj(src, dst, buffer_size)
+                return member.file_size
+        except zipfile.BadZipFile:
+            # If it's not a ZIP file, use the data as-is (fallback).
+            fit_stream.seek(0)
+            with _atomic_write(filepath) as f:
+                shutil.copyfileobj(fit_stream, f, FIT_COPY_BUFFER_SIZE)
+                file_size = f.tell()
+            return file_size
+
+    def _download_and_extract(self, activity: dict) -> Optional[Path]:
+        """
+        Download the FIT file of a single activity and save it to the ingest directory.
+
+        :param activity: Activity summary from get_activities_by_date().
+        :return: Saved FIT file path, or None if the download contained no FIT file.
+        """
+
+        activity_id = activity["activityId"]
+
+        # Generate filename with local timezone date at noon for consistent batching
+        # with ACTIVITIES_LIST file. Uses same midday timestamp approach as
+        # _save_garmin_data().
+        activity_start = pendulum.parse(activity.get("startTimeLocal"))
+        timestamp = _midday_timestamp(activity_start.date())
+        filename = f"{self.user_id}_ACTIVITY_{activity_id}_{timestamp}.fit"
+        filepath = self.ingest_dir / filename
+
+        # Download FIT file.
+        fit_data = self.garmin_client.download_activity(
+            activity_id,
+            dl_fmt=self.garmin_client.ActivityDownloadFormat.ORIGINAL,
+        )
+
+        # Extract FIT file from ZIP archive and save it. The saved size is known from
+        # the write itself, so the file is not stat'ed again afterwards.
+        file_size = self._save_fit_file(fit_data, filepath, activity_id)
+        if file_size is None:
+            return None
+
+        LOGGER.info(f"✅ Saved: {filename} ({file_size / 1024:.1f} KB).")
+
+        # Rate limiting - be respectful to Garmin's servers.
+        time.sleep(0.1)  # 100ms delay between downloads.
+
+        return filepath
+
     def extract_fit_activities(self) -> List[Path]:
         """
         Extract FIT activity files from Garmin Connect.
@@ -372,56 +514,21 @@ class GarminExtractor:
 
         LOGGER.info(f"📊 Found {len(activities)} activities.")
 
-        downloaded_files = []
-
-        for activity in activities:
-            activity_id = activity["activityId"]
-
-            # Generate filename with local timezone date at noon for consistent batching
-            # with ACTIVITIES_LIST file. Uses same midday timestamp approach as
-            # _save_garmin_data().
-            activity_start = pendulum.parse(activity.get("startTimeLocal"))
-            activity_date = activity_start.date()
-            midday_datetime = datetime.combine(
-                activity_date, datetime.min.time()
-            ).replace(hour=12, minute=0, second=0)
-            timestamp = pendulum.instance(midday_datetime, tz="UTC").to_iso8601_string()
-            filename = f"{self.user_id}_ACTIVITY_{activity_id}_{timestamp}.fit"
-            filepath = self.ingest_dir / filename
-
-            # Download FIT file.
-            fit_data = self.garmin_client.download_activity(
-                activity_id,
-                dl_fmt=self.garmin_client.ActivityDownloadFormat.ORIGINAL,
-            )
-
-            # Extract FIT file from ZIP archive.
-            try:
-                with zipfile.ZipFile(io.BytesIO(fit_data), "r") as zip_ref:
-                    # Get the first (and typically only) file from the ZIP.
-                    zip_files = zip_ref.namelist()
-                    if not zip_files:
-                        LOGGER.warning(
-                            f"⚠️ Empty ZIP archive for activity {activity_id}."
-                        )
-                        continue
-
-                    # Extract the FIT file content.
-                    fit_file_content = zip_ref.read(zip_files[0])
-            except zipfile.BadZipFile:
-                # If it's not a ZIP file, use the data as-is (fallback).
-                fit_file_content = fit_data
-
-            # Save to file.
-            with open(filepath, "wb") as f:
-                f.write(fit_file_content)
-
-            file_size = filepath.stat().st_size / 1024  # KB.
-            LOGGER.info(f"✅ Saved: {filename} ({file_size:.1f} KB).")
-            downloaded_files.append(filepath)
-
-            # Rate limiting - be respectful to Garmin's servers.
-            time.sleep(0.1)  # 100ms delay between downloads.
+        # Download serially unless concurrency was explicitly requested. Both paths
+        # preserve the order of the activities list and raise the first failed
+        # download in that order.
+        if self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                try:
+                    results = executor.map(self._download_and_extract, activities)
+                    downloaded_files = [filepath for filepath in results if filepath]
+                except Exception:
+                    # Drop queued downloads, as the serial path stops at the failure.
+                    executor.shutdown(cancel_futures=True)
+                    raise
+        else:
+            results = map(self._download_and_extract, activities)
+            downloaded_files = [filepath for filepath in results if filepath]
 
         LOGGER.info(
             f"🎯 FIT activity extraction complete: {len(downloaded_files)} files saved "
@@ -435,6 +542,7 @@ def extract(
     data_interval_start: Union[str, pendulum.DateTime],
     data_interval_end: Union[str, pendulum.DateTime],
     data_types: Optional[List[str]] = None,
+    max_workers: int = 1,
     **context,
 ) -> None:
     """
@@ -465,6 +573,8 @@ def extract(
         'HRV', 'USER_PROFILE', 'ACTIVITY'], provided in constants.GarminDataRegistry).
         If None, extracts all available data types including FIT activity files.
         If empty list [], skip extraction.
+    :param max_workers: Maximum number of concurrent FIT activity downloads. Defaults
+        to 1 (serial), see GarminExtractor.
     :raises AirflowSkipException: If no data found for extraction.
     :raises ValueError: If any requested data type names are not found in registry.
     """
@@ -509,7 +619,9 @@ def extract(
         end_date = original_end_date  # Inclusive logic for same-day processing.
 
     # Initialize extractor and authenticate.
-    extractor = GarminExtractor(start_date, end_date, ingest_dir, data_types)
+    extractor = GarminExtractor(
+        start_date, end_date, ingest_dir, data_types, max_workers=max_workers
+    )
     extractor.authenticate()
 
     # Extract Garmin data.
@@ -550,6 +662,7 @@ def cli_extract(
     start_date: str,
     end_date: str,
     data_types: List[str] = None,
+    max_workers: int = 1,
 ) -> None:
     """
     CLI wrapper for extract function.
@@ -560,6 +673,7 @@ def cli_extract(
     :param data_types: Optional list of data type names to extract (e.g., ['SLEEP',
         'HRV', 'USER_PROFILE', 'ACTIVITY'], provided in constants.GarminDataRegistry).
         If None, extracts all available data types including FIT activity files.
+    :param max_workers: Maximum number of concurrent FIT activity downloads.
     """
 
     # Convert string dates to pendulum datetime objects.
@@ -575,6 +689,7 @@ def cli_extract(
         data_interval_start=start_pendulum,
         data_interval_end=end_pendulum,
         data_types=data_types,
+        max_workers=max_workers,
     )
 
 
@@ -586,5 +701,6 @@ if __name__ == "__main__":
     #   or
     #   --data_types="[]" to skip extraction.
     #   or don't specify --data_types at all to extract all types.
+    #   --max_workers=4 to download FIT activity files concurrently.
 
     fire.Fire(cli_extract)
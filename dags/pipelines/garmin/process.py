@@ -11,10 +11,12 @@ import json
 import re
 from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import fitdecode
+import orjson
 from sqlalchemy import and_, text
 from sqlalchemy.orm import Session
 
@@ -58,6 +60,27 @@ from dags.pipelines.garmin.sqla_models import (
     VO2Max,
 )
 
+# Position before each capital letter (except the first character) in a camelCase
+# field name, where an underscore is inserted to convert it to snake_case.
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+# Unix epoch, as the origin for converting Garmin epoch millisecond timestamps.
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _epoch_ms_to_datetime(epoch_ms: int) -> datetime:
+    """
+    Convert a Garmin epoch millisecond timestamp to a timezone-aware UTC datetime.
+
+    Offsetting a constant epoch avoids the float division and per-call timezone
+    conversion of `datetime.fromtimestamp()`, and is exact to the millisecond.
+
+    :param epoch_ms: Milliseconds since the Unix epoch.
+    :return: UTC datetime.
+    """
+
+    return _EPOCH + timedelta(milliseconds=epoch_ms)
+
 
 class GarminProcessor(Processor):
     """
@@ -68,6 +91,10 @@ class GarminProcessor(Processor):
     appropriate database tables.
     """
 
+    # Filename patterns, compiled once since they are matched for every ingested file.
+    _FILENAME_RE = re.compile(r"^(\d+)_([A-Z_]+)(?:_\d+)?_([0-9T:\-Z\.]+)\.(json|fit)$")
+    _FIT_FILENAME_RE = re.compile(r"^(\d+)_ACTIVITY_(\d+)_([0-9T:\-Z\.]+)\.fit$")
+
     def __init__(self, *args, **kwargs):
         """
         Initialize GarminProcessor with additional instance attributes.
@@ -130,12 +157,13 @@ class GarminProcessor(Processor):
         # Process all files in the order defined by `file_processors`.
         processed_enum_keys = set()
 
+        # Index the file set's enum keys by name once, rather than scanning them for
+        # every data type.
+        enum_keys_by_name = {key.name: key for key in file_set.files}
+
         for data_type_name, processor_func in file_processors.items():
             # Find the corresponding enum key in file_set for this data type.
-            enum_key = next(
-                (key for key in file_set.files.keys() if key.name == data_type_name),
-                None,
-            )
+            enum_key = enum_keys_by_name.get(data_type_name)
 
             # Process files if they exist for this data type.
             if enum_key:
@@ -172,8 +200,15 @@ class GarminProcessor(Processor):
         :return: Parsed JSON data as a dictionary.
         """
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            content = f.read()
+
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Files written by the standard json module may contain NaN or Infinity,
+            # which orjson rejects.
+            return json.loads(content)
 
     def _parse_filename(self, filename: str) -> Dict[str, str]:
         """
@@ -190,8 +225,7 @@ class GarminProcessor(Processor):
         :raises ValueError: If filename doesn't match expected pattern.
         """
 
-        pattern = r"^(\d+)_([A-Z_]+)(?:_\d+)?_([0-9T:\-Z\.]+)\.(json|fit)$"
-        match = re.match(pattern, filename)
+        match = self._FILENAME_RE.match(filename)
 
         if not match:
             raise ValueError(f"Filename does not match expected pattern: {filename}.")
@@ -206,17 +240,19 @@ class GarminProcessor(Processor):
         }
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _convert_field_name(field_name: str) -> str:
         """
         Convert camelCase field name to snake_case for database storage.
 
+        Results are cached, since the same Garmin JSON keys recur across records.
+
         :param field_name: Field name in camelCase.
         :return: Field name in snake_case.
         """
 
         # Insert underscore before capital letters and convert to lowercase.
-        snake_case = re.sub(r"(?<!^)(?=[A-Z])", "_", field_name).lower()
-        return snake_case
+        return _CAMEL_RE.sub("_", field_name).lower()
 
     def _ensure_user_exists(self, user_id: str, session: Session) -> None:
         """
@@ -224,33 +260,57 @@ class GarminProcessor(Processor):
 
         If no user record exists, creates a minimal user record with only `user_id`.
         Sets `self.must_update_user` to True if the user record has null `full_name`.
+        Creating the record and reading back an existing one happen in a single round
+        trip, unless a concurrent transaction inserted the same user, in which case the
+        record is read back with a second query.
 
         :param user_id: User ID to check and create if necessary.
         :param session: SQLAlchemy Session object.
         """
 
-        # Check if user exists in user table.
-        existing_user = session.query(User).filter(User.user_id == int(user_id)).first()
-
-        if not existing_user:
-            # Create minimal user record with conflict handling.
-            session.execute(
-                text(
-                    """
-                INSERT INTO garmin.user (user_id, full_name, birth_date) 
-                VALUES (:user_id, NULL, NULL) 
-                ON CONFLICT (user_id) DO NOTHING
-            """
-                ),
+        # Insert a minimal user record unless one exists, returning whether it was
+        # created and the `full_name` of the record. The outer SELECT does not see
+        # the row inserted by the CTE, so at most one branch yields a row.
+        row = session.execute(
+            text(
+                """
+                WITH inserted AS (
+                    INSERT INTO garmin.user (user_id, full_name, birth_date)
+                    VALUES (:user_id, NULL, NULL)
+                    ON CONFLICT (user_id) DO NOTHING
+                    RETURNING full_name
+                )
+                SELECT TRUE AS created, full_name FROM inserted
+                UNION ALL
+                SELECT FALSE AS created, full_name
+                FROM garmin.user
+                WHERE user_id = :user_id
+                LIMIT 1
+                """
+            ),
+            {"user_id": int(user_id)},
+        ).first()
+
+        if row is None:
+            # A concurrent transaction inserted the user after this statement's
+            # snapshot was taken, so the INSERT did nothing and the SELECT could not
+            # see the new row. Read it back in a new statement, which can.
+            created = False
+            full_name = session.execute(
+                text("SELECT full_name FROM garmin.user WHERE user_id = :user_id"),
                 {"user_id": int(user_id)},
-            )
+            ).scalar_one()
+        else:
+            created, full_name = row
+
+        if created:
             session.flush()
             self.must_update_user = True
             LOGGER.info(
                 f"No existing user record found. "
                 f"Created minimal user record for user {user_id}."
             )
-        elif existing_user.full_name is None:
+        elif full_name is None:
             # User exists but needs profile data update.
             self.must_update_user = True
             LOGGER.info(f"User {user_id} exists but needs profile data update.")
@@ -1128,6 +1188,7 @@ class GarminProcessor(Processor):
                 model_instances=movement_records,
                 conflict_columns=["sleep_id", "timestamp"],
                 on_conflict_update=False,
+                returning=False,
             )
             LOGGER.info(f"Processed {len(movement_records)} sleep movement records.")
         else:
@@ -1153,7 +1214,7 @@ class GarminProcessor(Processor):
         for moment in restless_moments:
             start_gmt_ms = moment.pop("startGMT")
             if start_gmt_ms:
-                timestamp = datetime.fromtimestamp(start_gmt_ms / 1000, tz=timezone.utc)
+                timestamp = _epoch_ms_to_datetime(start_gmt_ms)
                 restless_records.append(
                     SleepRestlessMoment(
                         sleep_id=sleep_id,
@@ -1168,6 +1229,7 @@ class GarminProcessor(Processor):
                 model_instances=restless_records,
                 conflict_columns=["sleep_id", "timestamp"],
                 on_conflict_update=False,
+                returning=False,
             )
             LOGGER.info(
                 f"Processed {len(restless_records)} sleep restless moment records."
@@ -1213,6 +1275,7 @@ class GarminProcessor(Processor):
                 model_instances=spo2_records,
                 conflict_columns=["sleep_id", "timestamp"],
                 on_conflict_update=False,
+                returning=False,
             )
             LOGGER.info(f"Processed {len(spo2_records)} SpO2 records.")
         else:
@@ -1239,7 +1302,7 @@ class GarminProcessor(Processor):
         for hrv_reading in hrv_data:
             start_gmt_ms = hrv_reading.pop("startGMT")
             if start_gmt_ms:
-                timestamp = datetime.fromtimestamp(start_gmt_ms / 1000, tz=timezone.utc)
+                timestamp = _epoch_ms_to_datetime(start_gmt_ms)
                 hrv_records.append(
                     HRV(
                         sleep_id=sleep_id,
@@ -1254,6 +1317,7 @@ class GarminProcessor(Processor):
                 model_instances=hrv_records,
                 conflict_columns=["sleep_id", "timestamp"],
                 on_conflict_update=False,
+                returning=False,
             )
             LOGGER.info(f"Processed {len(hrv_records)} HRV records.")
         else:
@@ -1280,7 +1344,7 @@ class GarminProcessor(Processor):
         for breathing_event in breathing_data:
             start_gmt_ms = breathing_event.pop("startGMT")
             if start_gmt_ms:
-                timestamp = datetime.fromtimestamp(start_gmt_ms / 1000, tz=timezone.utc)
+                timestamp = _epoch_ms_to_datetime(start_gmt_ms)
                 breathing_records.append(
                     BreathingDisruption(
                         sleep_id=sleep_id,
@@ -1295,6 +1359,7 @@ class GarminProcessor(Processor):
                 model_instances=breathing_records,
                 conflict_columns=["sleep_id", "timestamp"],
                 on_conflict_update=False,
+                returning=False,
             )
             LOGGER.info(
                 f"Processed {len(breathing_records)} breathing disruption records."
@@ -1337,6 +1402,10 @@ class GarminProcessor(Processor):
 
         generic_record = None
 
+        # VO2Max records to UPSERT with their update columns. Generic and cycling values
+        # for the same date share a single record, written in one statement.
+        pending_upserts = []
+
         # Process generic VO2 max data if available.
         generic_data = vo2_max_section.pop("generic", {})
         if generic_data and generic_data.get("calendarDate"):
@@ -1350,14 +1419,8 @@ class GarminProcessor(Processor):
                 vo2_max_generic=vo2_max_generic,
             )
 
-            # UPSERT generic record with only generic columns.
-            upsert_model_instances(
-                session=session,
-                model_instances=[generic_record],
-                conflict_columns=["user_id", "date"],
-                update_columns=["vo2_max_generic"],
-                on_conflict_update=True,
-            )
+            generic_update_columns = ["vo2_max_generic"]
+            pending_upserts.append((generic_record, generic_update_columns))
             LOGGER.info("Processed generic VO2 max data.")
         else:
             LOGGER.warning("⚠️ No generic VO2 max data found.")
@@ -1372,29 +1435,32 @@ class GarminProcessor(Processor):
 
             # Check if we can reuse the generic record.
             if generic_record and generic_record.date == cycling_date:
-                # Same date: add cycling field to existing generic record.
+                # Same date: add cycling field and column to existing generic record.
                 target_record = generic_record
+                generic_update_columns.append("vo2_max_cycling")
             else:
                 # Different date: create new record for cycling data.
                 target_record = VO2Max(
                     user_id=int(self.user_id),
                     date=cycling_date,
                 )
+                pending_upserts.append((target_record, ["vo2_max_cycling"]))
 
             # Set cycling field on target record.
             target_record.vo2_max_cycling = vo2_max_cycling
+            LOGGER.info("Processed cycling VO2 max data.")
+        else:
+            LOGGER.warning("⚠️ No cycling VO2 max data found.")
 
-            # UPSERT cycling record with only cycling columns.
+        # UPSERT each VO2Max record with only the columns extracted for it.
+        for record, update_columns in pending_upserts:
             upsert_model_instances(
                 session=session,
-                model_instances=[target_record],
+                model_instances=[record],
                 conflict_columns=["user_id", "date"],
-                update_columns=["vo2_max_cycling"],
+                update_columns=update_columns,
                 on_conflict_update=True,
             )
-            LOGGER.info("Processed cycling VO2 max data.")
-        else:
-            LOGGER.warning("⚠️ No cycling VO2 max data found.")
 
         # Process acclimation data from the same section.
         acclimation_data = vo2_max_section.pop("heatAltitudeAcclimation", {})
@@ -1440,6 +1506,10 @@ class GarminProcessor(Processor):
 
         balance_record = None
 
+        # Records to UPSERT with their update columns. Balance and status data for the
+        # same date share a single record, written in one statement.
+        pending_upserts = []
+
         # Extract training load balance data.
         training_load_balance = training_status_data.pop(
             "mostRecentTrainingLoadBalance", {}
@@ -1488,14 +1558,7 @@ class GarminProcessor(Processor):
                         setattr(balance_record, snake_case_name, field_value)
                         balance_update_columns.append(snake_case_name)
 
-                    # UPSERT balance record with only balance columns.
-                    upsert_model_instances(
-                        session=session,
-                        model_instances=[balance_record],
-                        conflict_columns=["user_id", "date"],
-                        update_columns=balance_update_columns,
-                        on_conflict_update=True,
-                    )
+                    pending_upserts.append((balance_record, balance_update_columns))
                     LOGGER.info("Processed training load balance data.")
                 else:
                     LOGGER.warning("⚠️ No training load balance data found.")
@@ -1513,14 +1576,18 @@ class GarminProcessor(Processor):
 
                     # Check if we can reuse the balance record.
                     if balance_record and balance_record.date == status_date:
-                        # Same date: add status fields to existing balance record.
+                        # Same date: add status fields and columns to existing balance
+                        # record.
                         target_record = balance_record
+                        status_update_columns = balance_update_columns
                     else:
                         # Different date: create new record for status data.
                         target_record = TrainingLoad(
                             user_id=int(self.user_id),
                             date=status_date,
                         )
+                        status_update_columns = []
+                        pending_upserts.append((target_record, status_update_columns))
 
                     # Extract ACWR data.
                     acwr_data = status_device_data.pop("acuteTrainingLoadDTO", {})
@@ -1538,7 +1605,6 @@ class GarminProcessor(Processor):
                         "dailyTrainingLoadChronic",
                         "dailyAcuteChronicWorkloadRatio",
                     ]
-                    status_update_columns = []
                     for field_name in acwr_fields:
                         snake_case_name = self._convert_field_name(field_name)
                         field_value = acwr_data.pop(field_name, None)
@@ -1553,18 +1619,20 @@ class GarminProcessor(Processor):
                         setattr(target_record, snake_case_name, field_value)
                         status_update_columns.append(snake_case_name)
 
-                    # UPSERT status record with only status columns.
-                    upsert_model_instances(
-                        session=session,
-                        model_instances=[target_record],
-                        conflict_columns=["user_id", "date"],
-                        update_columns=status_update_columns,
-                        on_conflict_update=True,
-                    )
                     LOGGER.info("Processed acute/chronic training load data.")
                 else:
                     LOGGER.warning("⚠️ No acute/chronic training load data found.")
 
+        # UPSERT each record with only the columns extracted for it.
+        for record, update_columns in pending_upserts:
+            upsert_model_instances(
+                session=session,
+                model_instances=[record],
+                conflict_columns=["user_id", "date"],
+                update_columns=update_columns,
+                on_conflict_update=True,
+            )
+
     def _process_training_readiness(self, file_path: Path, session: Session):
         """
         Process a TRAINING_READINESS file containing daily readiness scores and factors.
@@ -1652,9 +1720,7 @@ class GarminProcessor(Processor):
                 timestamp_ms, stress_level = stress_value[0], stress_value[1]
                 # Skip negative values as they indicate unmeasurable periods.
                 if stress_level >= 0:
-                    timestamp = datetime.fromtimestamp(
-                        timestamp_ms / 1000, tz=timezone.utc
-                    )
+                    timestamp = _epoch_ms_to_datetime(timestamp_ms)
                     stress_records.append(
                         Stress(
                             user_id=int(self.user_id),
@@ -1670,6 +1736,7 @@ class GarminProcessor(Processor):
                 model_instances=stress_records,
                 conflict_columns=["user_id", "timestamp"],
                 on_conflict_update=False,
+                returning=False,
             )
             LOGGER.info("Processed stress data.")
         else:
@@ -1680,12 +1747,8 @@ class GarminProcessor(Processor):
         body_battery_values_array = stress_data.pop("bodyBatteryValuesArray", [])
         for battery_value in body_battery_values_array:
             if len(battery_value) >= 3:
-                timestamp_ms, _, body_battery_level = (
-                    battery_value[0],
-                    battery_value[1],
-                    battery_value[2],
-                )
-                timestamp = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
+                timestamp_ms, body_battery_level = battery_value[0], battery_value[2]
+                timestamp = _epoch_ms_to_datetime(timestamp_ms)
                 body_battery_records.append(
                     BodyBattery(
                         user_id=int(self.user_id),
@@ -1701,6 +1764,7 @@ class GarminProcessor(Processor):
                 model_instances=body_battery_records,
                 conflict_columns=["user_id", "timestamp"],
                 on_conflict_update=False,
+                returning=False,
             )
             LOGGER.info(f"Processed {len(body_battery_records)} body battery records.")
         else:
@@ -1746,6 +1810,7 @@ class GarminProcessor(Processor):
                 model_instances=heart_rate_records,
                 conflict_columns=["user_id", "timestamp"],
                 on_conflict_update=False,
+                returning=False,
             )
             LOGGER.info(f"Processed {len(heart_rate_records)} heart rate records.")
         else:
@@ -1793,6 +1858,7 @@ class GarminProcessor(Processor):
                 model_instances=steps_records,
                 conflict_columns=["user_id", "timestamp"],
                 on_conflict_update=False,
+                returning=False,
             )
             LOGGER.info(f"Processed {len(steps_records)} steps records.")
         else:
@@ -1844,6 +1910,7 @@ class GarminProcessor(Processor):
                 model_instances=respiration_records,
                 conflict_columns=["user_id", "timestamp"],
                 on_conflict_update=False,
+                returning=False,
             )
             LOGGER.info(f"Processed {len(respiration_records)} respiration records.")
         else:
@@ -1895,6 +1962,7 @@ class GarminProcessor(Processor):
                 model_instances=intensity_records,
                 conflict_columns=["user_id", "timestamp"],
                 on_conflict_update=False,
+                returning=False,
             )
             LOGGER.info(
                 f"Processed {len(intensity_records)} intensity minutes records."
@@ -1993,6 +2061,7 @@ class GarminProcessor(Processor):
                 model_instances=floors_records,
                 conflict_columns=["user_id", "timestamp"],
                 on_conflict_update=False,
+                returning=False,
             )
             LOGGER.info(f"Processed {len(floors_records)} floors records.")
         else:
@@ -2186,6 +2255,7 @@ class GarminProcessor(Processor):
             model_instances=[race_prediction],
             conflict_columns=["user_id", "date"],
             on_conflict_update=False,
+            returning=False,
         )
 
     def _process_fit_file(self, file_path: Path, session: Session):
@@ -2203,8 +2273,7 @@ class GarminProcessor(Processor):
         # Extract `activity_id` from filename.
         # FIT files have format: {user_id}_ACTIVITY_{activity_id}_{timestamp}.fit
         # Use regex to extract activity_id directly from filename.
-        pattern = r"^(\d+)_ACTIVITY_(\d+)_([0-9T:\-Z\.]+)\.fit$"
-        match = re.match(pattern, file_path.name)
+        match = self._FIT_FILENAME_RE.match(file_path.name)
 
         if not match:
             raise ValueError(
@@ -2265,13 +2334,15 @@ class GarminProcessor(Processor):
                                     and isinstance(field.value, (int, float, bool))
                                 ):
                                     ts_metrics.append(
-                                        ActivityTsMetric(
-                                            activity_id=activity_id,
-                                            timestamp=timestamp,
-                                            name=field.name,
-                                            value=float(field.value),
-                                            units=field.units if field.units else None,
-                                        )
+                                        {
+                                            "activity_id": activity_id,
+                                            "timestamp": timestamp,
+                                            "name": field.name,
+                                            "value": float(field.value),
+                                            "units": (
+                                                field.units if field.units else None
+                                            ),
+                                        }
                                     )
 
                     # Process split frames.
@@ -2381,8 +2452,11 @@ class GarminProcessor(Processor):
         session.flush()
 
         # Bulk insert all metrics if any were found.
+        # Time-series records are inserted as plain mappings, since a single FIT
+        # file can yield tens of thousands of them and constructing ORM instances
+        # dominates the cost.
         if ts_metrics:
-            session.bulk_save_objects(ts_metrics)
+            session.bulk_insert_mappings(ActivityTsMetric, ts_metrics)
             LOGGER.info(f"Processed {len(ts_metrics)} time-series records.")
             existing_activity.ts_data_available = True
         else:
@@ -77,6 +77,25 @@ class TestUpsertModelInstances:
         result = MyTest(id=1, col_a="C")
         assert result.col_a == "C"
 
+    def test_upsert_model_instances_without_returning(self, db_session):
+        """
+        Test upsert_model_instances skips returning rows when `returning` is False.
+        """
+
+        obj = MyTest(id=1, col_a="A")
+        with patch("dags.lib.sql_utils._upsert_values") as mock_upsert:
+            mock_upsert.return_value = None
+            result = upsert_model_instances(
+                db_session,
+                [obj],
+                conflict_columns=["id"],
+                on_conflict_update=False,
+                returning=False,
+            )
+
+        assert result == []
+        assert mock_upsert.call_args.kwargs["returning_columns"] is None
+
     def test_upsert_values_missing_conflict_columns_raises(self, db_session):
         """
         Test that _upsert_values raises ValueError if conflict_columns is missing.
@@ -0,0 +1,22 @@
+"""
+Shared fixtures for the dags.pipelines.garmin test modules.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from dags.lib.etl_config import ETLConfig
+
+
+@pytest.fixture(scope="session")
+def mock_config(tmp_path_factory: pytest.TempPathFactory) -> ETLConfig:
+    """
+    Create a mock ETL config shared across the session. Tests only read its ingest
+    directory, so a single instance is safe to reuse.
+
+    :param tmp_path_factory: Pytest session temporary path factory.
+    :return: Mock ETL config.
+    """
+
+    return MagicMock(data_dirs=MagicMock(ingest=tmp_path_factory.mktemp("ingest")))
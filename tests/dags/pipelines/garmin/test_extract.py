@@ -11,21 +11,60 @@ This test suite covers:
 
 import io
 import json
-import tempfile
+import threading
 import zipfile
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
-from unittest.mock import MagicMock, call, patch
+from typing import Callable, Generator, List, Optional, Tuple
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pendulum
 import pytest
 from airflow.exceptions import AirflowSkipException
+from garminconnect import Garmin
 
-from dags.lib.etl_config import ETLConfig
+from dags.pipelines.garmin import extract as garmin_extract
 from dags.pipelines.garmin.constants import APIMethodTimeParam, GarminDataType
 from dags.pipelines.garmin.extract import GarminExtractor, extract, cli_extract
 
+# Baseline configuration shared by every mock Garmin client.
+_GARMIN_MOCK_DEFAULTS = {
+    "full_name": "Test User",
+    "get_user_profile.return_value": {"id": "123456789"},
+}
+
+
+@pytest.fixture(scope="session")
+def mock_zip_bytes_factory() -> Callable[..., bytes]:
+    """
+    Provide a factory building ZIP archive payloads, cached for the whole session.
+
+    :return: Function taking (member name, content) tuples and returning the ZIP bytes.
+        Calling it without members returns an empty archive.
+    """
+
+    cache = {}
+
+    def make(*members: Tuple[str, bytes]) -> bytes:
+        """
+        Build (or reuse) a ZIP archive with the given members.
+
+        :param members: (member name, content) tuples to write to the archive.
+        :return: ZIP archive bytes.
+        """
+
+        if members not in cache:
+            zip_buffer = io.BytesIO()
+            with zipfile.ZipFile(zip_buffer, "w") as zip_file:
+                for name, content in members:
+                    zip_file.writestr(name, content)
+            cache[members] = zip_buffer.getvalue()
+        return cache[members]
+
+    return make
+
 
 class TestGarminExtractor:
     """
@@ -33,15 +72,26 @@ class TestGarminExtractor:
     """
 
     @pytest.fixture
-    def temp_dir(self):
+    def temp_dir(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
         """
-        Create temporary directory for testing.
+        Create temporary ingest directory for testing.
 
+        :param tmp_path_factory: Pytest session temporary path factory.
         :return: Temporary directory path.
         """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+        return tmp_path_factory.mktemp("ingest")
+
+    @pytest.fixture(autouse=True)
+    def mock_sleep(self) -> Generator[MagicMock, None, None]:
+        """
+        Disable rate limiting sleeps for every test in the class.
+
+        :return: Mock sleep function.
+        """
+
+        with patch("dags.pipelines.garmin.extract.time.sleep") as mock_sleep:
+            yield mock_sleep
 
     @pytest.fixture
     def extractor(self, temp_dir: Path) -> GarminExtractor:
@@ -66,9 +116,8 @@ class TestGarminExtractor:
         :return: Mock Garmin client.
         """
 
-        mock_client = MagicMock()
-        mock_client.full_name = "Test User"
-        mock_client.get_user_profile.return_value = {"id": "123456789"}
+        mock_client = MagicMock(spec=Garmin)
+        mock_client.configure_mock(**_GARMIN_MOCK_DEFAULTS)
         return mock_client
 
     def test_init(self, temp_dir: Path) -> None:
@@ -89,6 +138,7 @@ class TestGarminExtractor:
         assert extractor.start_date == date(2025, 1, 1)
         assert extractor.end_date == date(2025, 1, 3)
         assert extractor.ingest_dir == temp_dir
+        assert extractor.max_workers == 1
         assert extractor.garmin_client is None
         assert extractor.user_id is None
 
@@ -230,7 +280,6 @@ class TestGarminExtractor:
             "Skipping Garmin data extraction: no data types to process."
         )
 
-    @patch("dags.pipelines.garmin.extract.time.sleep")
     @patch("dags.pipelines.garmin.extract.LOGGER")
     def test_extract_data_by_type_daily(
         self, mock_logger, mock_sleep, extractor, mock_garmin_client
@@ -273,7 +322,6 @@ class TestGarminExtractor:
         )
         mock_sleep.assert_called()
 
-    @patch("dags.pipelines.garmin.extract.time.sleep")
     @patch("dags.pipelines.garmin.extract.LOGGER")
     def test_extract_data_by_type_range(
         self, mock_logger, mock_sleep, extractor, mock_garmin_client
@@ -356,6 +404,35 @@ class TestGarminExtractor:
         assert len(result) == 1
         mock_garmin_client.get_personal_record.assert_called_once_with()
 
+    def test_extract_data_by_type_unsupported_time_param(
+        self, extractor, mock_garmin_client
+    ) -> None:
+        """
+        Test that _extract_data_by_type raises as soon as it is called with an
+        unsupported API method time parameter.
+
+        :param extractor: GarminExtractor fixture.
+        :param mock_garmin_client: Mock Garmin client fixture.
+        """
+
+        # Arrange.
+        extractor.garmin_client = mock_garmin_client
+        data_type = GarminDataType(
+            name="SLEEP",
+            api_method="get_sleep_data",
+            api_method_time_param="HOURLY",
+            api_endpoint="/garmin-service/garmin/dailySleepData/{display_name}",
+            description="Sleep stage duration",
+            emoji="sleep",
+        )
+
+        # Act & Assert.
+        with pytest.raises(ValueError, match="Unsupported API method time parameter"):
+            extractor._extract_data_by_type(
+                data_type, date(2025, 1, 1), date(2025, 1, 3)
+            )
+        mock_garmin_client.get_sleep_data.assert_not_called()
+
     def test_save_garmin_data(self, extractor, temp_dir) -> None:
         """
         Test _save_garmin_data method.
@@ -385,8 +462,7 @@ class TestGarminExtractor:
             assert len(result) == 1
             saved_file = result[0]
             assert saved_file.exists()
-            assert saved_file.name.startswith("123456789_SLEEP_")
-            assert saved_file.name.endswith(".json")
+            assert saved_file.name == "123456789_SLEEP_2025-01-01T12:00:00Z.json"
 
             # Verify file contents.
             with open(saved_file, "r", encoding="utf-8") as f:
@@ -395,10 +471,47 @@ class TestGarminExtractor:
 
             mock_logger.info.assert_called()
 
-    @patch("dags.pipelines.garmin.extract.time.sleep")
+    @patch("dags.pipelines.garmin.extract.LOGGER")
+    def test_save_garmin_data_non_str_keys_and_non_finite_floats(
+        self, mock_logger, extractor
+    ) -> None:
+        """
+        Test that _save_garmin_data stringifies non-str keys and writes non-finite
+        floats as null.
+
+        :param mock_logger: Mock logger.
+        :param extractor: GarminExtractor fixture.
+        """
+
+        # Arrange.
+        extractor.user_id = "123456789"
+        data = {1: "one", "values": [float("nan"), float("inf"), 1.5]}
+        data_type = GarminDataType(
+            name="SLEEP",
+            api_method="get_sleep_data",
+            api_method_time_param=APIMethodTimeParam.DAILY,
+            api_endpoint="/garmin-service/garmin/dailySleepData/{display_name}"
+            "?date={date}&nonSleepBufferMinutes=60",
+            description="Sleep stage duration",
+            emoji="sleep",
+        )
+
+        # Act.
+        result = extractor._save_garmin_data(data, data_type, date(2025, 1, 1))
+
+        # Assert.
+        saved_data = json.loads(result[0].read_bytes())
+        assert saved_data == {"1": "one", "values": [None, None, 1.5]}
+
     @patch("dags.pipelines.garmin.extract.LOGGER")
     def test_extract_fit_activities_success(
-        self, mock_logger, mock_sleep, extractor, mock_garmin_client, temp_dir
+        self,
+        mock_logger,
+        mock_sleep,
+        extractor,
+        mock_garmin_client,
+        temp_dir,
+        mock_zip_bytes_factory,
     ) -> None:
         """
         Test successful FIT activity extraction.
@@ -408,6 +521,7 @@ class TestGarminExtractor:
         :param extractor: GarminExtractor fixture.
         :param mock_garmin_client: Mock Garmin client fixture.
         :param temp_dir: Temporary directory fixture.
+        :param mock_zip_bytes_factory: Cached ZIP payload factory fixture.
         """
 
         # Arrange.
@@ -428,22 +542,18 @@ class TestGarminExtractor:
         ]
         mock_garmin_client.get_activities_by_date.return_value = activities
         # Create mock ZIP files containing FIT data.
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w") as zip_file:
-            zip_file.writestr("12345_ACTIVITY.fit", b"ACTUAL_FIT_FILE_DATA_1")
-        zip_buffer.seek(0)
-        mock_zip_data_1 = zip_buffer.getvalue()
-
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w") as zip_file:
-            zip_file.writestr("67890_ACTIVITY.fit", b"ACTUAL_FIT_FILE_DATA_2")
-        zip_buffer.seek(0)
-        mock_zip_data_2 = zip_buffer.getvalue()
-
-        mock_garmin_client.download_activity.side_effect = [
-            mock_zip_data_1,
-            mock_zip_data_2,
-        ]
+        mock_zip_data_1 = mock_zip_bytes_factory(
+            ("12345_ACTIVITY.fit", b"ACTUAL_FIT_FILE_DATA_1")
+        )
+        mock_zip_data_2 = mock_zip_bytes_factory(
+            ("67890_ACTIVITY.fit", b"ACTUAL_FIT_FILE_DATA_2")
+        )
+
+        # Key downloads by activity ID since they may run concurrently.
+        mock_zip_data = {"12345": mock_zip_data_1, "67890": mock_zip_data_2}
+        mock_garmin_client.download_activity.side_effect = (
+            lambda activity_id, dl_fmt: mock_zip_data[activity_id]
+        )
 
         # Act.
         result = extractor.extract_fit_activities()
@@ -454,18 +564,204 @@ class TestGarminExtractor:
             "2025-01-01", "2025-01-03"
         )
         assert mock_garmin_client.download_activity.call_count == 2
+        downloaded_ids = {
+            args[0] for args, _ in mock_garmin_client.download_activity.call_args_list
+        }
+        assert downloaded_ids == {"12345", "67890"}
         mock_sleep.assert_called()
 
-        # Check files were created and contain extracted FIT data.
-        files = list(temp_dir.glob("*.fit"))
-        assert len(files) == 2
+        # Verify each returned file holds exactly the extracted FIT data, not the ZIP.
+        assert all(path.parent == temp_dir for path in result)
+        assert {path.name.split("_")[2]: path.read_bytes() for path in result} == {
+            "12345": b"ACTUAL_FIT_FILE_DATA_1",
+            "67890": b"ACTUAL_FIT_FILE_DATA_2",
+        }
+
+    @pytest.mark.parametrize("max_workers", [1, 3], ids=["serial", "concurrent"])
+    @patch("dags.pipelines.garmin.extract.LOGGER")
+    def test_extract_fit_activities_max_workers(
+        self,
+        mock_logger,
+        max_workers,
+        extractor,
+        mock_garmin_client,
+        mock_zip_bytes_factory,
+    ) -> None:
+        """
+        Test that FIT downloads only use a thread pool, sized by `max_workers`, when
+        more than one worker is requested, and keep the activity order either way.
+
+        :param mock_logger: Mock logger.
+        :param max_workers: Maximum number of concurrent downloads.
+        :param extractor: GarminExtractor fixture.
+        :param mock_garmin_client: Mock Garmin client fixture.
+        :param mock_zip_bytes_factory: Cached ZIP payload factory fixture.
+        """
+
+        # Arrange.
+        extractor.garmin_client = mock_garmin_client
+        extractor.user_id = "123456789"
+        extractor.max_workers = max_workers
+        activity_ids = ["111", "222", "333"]
+        mock_garmin_client.get_activities_by_date.return_value = [
+            {"activityId": activity_id, "startTimeLocal": "2025-01-01T10:00:00.000"}
+            for activity_id in activity_ids
+        ]
+        mock_garmin_client.download_activity.return_value = mock_zip_bytes_factory(
+            ("ACTIVITY.fit", b"FIT_DATA")
+        )
+
+        # Act.
+        with patch(
+            "dags.pipelines.garmin.extract.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as mock_executor:
+            result = extractor.extract_fit_activities()
 
-        # Verify file contents are the extracted FIT data, not ZIP.
-        for file_path in files:
-            with open(file_path, "rb") as f:
-                content = f.read()
-                assert b"ACTUAL_FIT_FILE_DATA" in content
-                assert not content.startswith(b"PK")  # Not a ZIP file.
+        # Assert.
+        if max_workers > 1:
+            mock_executor.assert_called_once_with(max_workers=max_workers)
+        else:
+            mock_executor.assert_not_called()
+        assert [path.name.split("_")[2] for path in result] == activity_ids
+
+    @patch("dags.pipelines.garmin.extract.LOGGER")
+    def test_extract_fit_activities_download_error(
+        self, mock_logger, extractor, mock_garmin_client, mock_zip_bytes_factory
+    ) -> None:
+        """
+        Test that a failed FIT download stops serial extraction and is raised to the
+        caller, leaving only the complete files of earlier activities.
+
+        :param mock_logger: Mock logger.
+        :param extractor: GarminExtractor fixture.
+        :param mock_garmin_client: Mock Garmin client fixture.
+        :param mock_zip_bytes_factory: Cached ZIP payload factory fixture.
+        """
+
+        # Arrange.
+        extractor.garmin_client = mock_garmin_client
+        extractor.user_id = "123456789"
+        mock_garmin_client.get_activities_by_date.return_value = [
+            {"activityId": activity_id, "startTimeLocal": "2025-01-01T10:00:00.000"}
+            for activity_id in ["111", "222", "333"]
+        ]
+        zip_data = mock_zip_bytes_factory(("ACTIVITY.fit", b"FIT_DATA"))
+
+        def download(activity_id: str, dl_fmt: str) -> bytes:
+            """
+            Fail the download of the second activity.
+
+            :param activity_id: Activity ID.
+            :param dl_fmt: Download format.
+            :return: ZIP archive bytes.
+            """
+
+            if activity_id == "222":
+                raise RuntimeError("Download failed for 222.")
+            return zip_data
+
+        mock_garmin_client.download_activity.side_effect = download
+
+        # Act & Assert.
+        with pytest.raises(RuntimeError, match="Download failed for 222."):
+            extractor.extract_fit_activities()
+
+        saved_files = list(extractor.ingest_dir.iterdir())
+        assert [path.name.split("_")[2] for path in saved_files] == ["111"]
+        assert saved_files[0].read_bytes() == b"FIT_DATA"
+        assert mock_garmin_client.download_activity.call_count == 2
+
+    @patch("dags.pipelines.garmin.extract.LOGGER")
+    def test_extract_fit_activities_download_error_concurrent(
+        self, mock_logger, extractor, mock_garmin_client, mock_zip_bytes_factory
+    ) -> None:
+        """
+        Test that concurrent FIT downloads raise the first failure in activity order,
+        even when a later activity fails first, cancel the queued downloads, and leave
+        no partial files behind.
+
+        Two workers download six activities. Activity 333 fails first, then 222.
+        Downloads started after that wait until the queued ones are cancelled, so
+        activity 666 is still queued when the failure is handled.
+
+        :param mock_logger: Mock logger.
+        :param extractor: GarminExtractor fixture.
+        :param mock_garmin_client: Mock Garmin client fixture.
+        :param mock_zip_bytes_factory: Cached ZIP payload factory fixture.
+        """
+
+        # Arrange.
+        extractor.garmin_client = mock_garmin_client
+        extractor.user_id = "123456789"
+        extractor.max_workers = 2
+        mock_garmin_client.get_activities_by_date.return_value = [
+            {"activityId": activity_id, "startTimeLocal": "2025-01-01T10:00:00.000"}
+            for activity_id in ["111", "222", "333", "444", "555", "666"]
+        ]
+        zip_data = mock_zip_bytes_factory(("ACTIVITY.fit", b"FIT_DATA"))
+        failed_333 = threading.Event()
+        queued_cancelled = threading.Event()
+
+        def download(activity_id: str, dl_fmt: str) -> bytes:
+            """
+            Fail activity 333, then 222, and hold later downloads until the queued
+            ones are cancelled.
+
+            :param activity_id: Activity ID.
+            :param dl_fmt: Download format.
+            :return: ZIP archive bytes.
+            """
+
+            if activity_id == "333":
+                failed_333.set()
+                raise RuntimeError("Download failed for 333.")
+            if activity_id == "222":
+                assert failed_333.wait(timeout=5)
+                raise RuntimeError("Download failed for 222.")
+            if activity_id != "111":
+                assert queued_cancelled.wait(timeout=5)
+            return zip_data
+
+        mock_garmin_client.download_activity.side_effect = download
+
+        class CancelSignallingExecutor(ThreadPoolExecutor):
+            """
+            Thread pool signalling once its queued work items have been cancelled.
+            """
+
+            def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+                """
+                Cancel queued work items if requested, signal it, then shut down.
+
+                :param wait: Whether to wait for running work items.
+                :param cancel_futures: Whether to cancel queued work items.
+                """
+
+                super().shutdown(wait=False, cancel_futures=cancel_futures)
+                if cancel_futures:
+                    queued_cancelled.set()
+                super().shutdown(wait=wait)
+
+        # Act & Assert.
+        with patch(
+            "dags.pipelines.garmin.extract.ThreadPoolExecutor",
+            CancelSignallingExecutor,
+        ), pytest.raises(RuntimeError, match="Download failed for 222."):
+            extractor.extract_fit_activities()
+
+        assert queued_cancelled.is_set()
+        downloaded_ids = {
+            args[0] for args, _ in mock_garmin_client.download_activity.call_args_list
+        }
+        assert "666" not in downloaded_ids
+
+        # Only complete FIT files of successful downloads remain, with no temp files.
+        saved_files = list(extractor.ingest_dir.iterdir())
+        assert all(path.suffix == ".fit" for path in saved_files)
+        saved_ids = {path.name.split("_")[2] for path in saved_files}
+        assert saved_ids == {"111", "444", "555"}
+        assert all(path.read_bytes() == b"FIT_DATA" for path in saved_files)
 
     @patch("dags.pipelines.garmin.extract.LOGGER")
     def test_extract_fit_activities_no_activities(
@@ -492,19 +788,23 @@ class TestGarminExtractor:
             "No activities found in the specified date range."
         )
 
-    @patch("dags.pipelines.garmin.extract.time.sleep")
     @patch("dags.pipelines.garmin.extract.LOGGER")
     def test_extract_fit_activities_empty_zip(
-        self, mock_logger, mock_sleep, extractor, mock_garmin_client, temp_dir
+        self,
+        mock_logger,
+        extractor,
+        mock_garmin_client,
+        temp_dir,
+        mock_zip_bytes_factory,
     ) -> None:
         """
         Test FIT activity extraction with empty ZIP archive.
 
         :param mock_logger: Mock logger.
-        :param mock_sleep: Mock sleep function.
         :param extractor: GarminExtractor fixture.
         :param mock_garmin_client: Mock Garmin client fixture.
         :param temp_dir: Temporary directory fixture.
+        :param mock_zip_bytes_factory: Cached ZIP payload factory fixture.
         """
 
         # Arrange.
@@ -521,11 +821,7 @@ class TestGarminExtractor:
         mock_garmin_client.get_activities_by_date.return_value = activities
 
         # Create an empty ZIP file.
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w"):
-            pass  # Empty ZIP.
-        zip_buffer.seek(0)
-        mock_garmin_client.download_activity.return_value = zip_buffer.getvalue()
+        mock_garmin_client.download_activity.return_value = mock_zip_bytes_factory()
 
         # Act.
         result = extractor.extract_fit_activities()
@@ -536,16 +832,112 @@ class TestGarminExtractor:
             "⚠️ Empty ZIP archive for activity 12345."
         )
 
-    @patch("dags.pipelines.garmin.extract.time.sleep")
+    @patch("dags.pipelines.garmin.extract.LOGGER")
+    def test_extract_fit_activities_empty_fit_file(
+        self,
+        mock_logger,
+        extractor,
+        mock_garmin_client,
+        temp_dir,
+        mock_zip_bytes_factory,
+    ) -> None:
+        """
+        Test FIT activity extraction with a zero-size FIT file in the ZIP archive.
+
+        :param mock_logger: Mock logger.
+        :param extractor: GarminExtractor fixture.
+        :param mock_garmin_client: Mock Garmin client fixture.
+        :param temp_dir: Temporary directory fixture.
+        :param mock_zip_bytes_factory: Cached ZIP payload factory fixture.
+        """
+
+        # Arrange.
+        extractor.garmin_client = mock_garmin_client
+        extractor.user_id = "123456789"
+
+        activities = [
+            {
+                "activityId": "12345",
+                "startTimeGMT": "2025-01-01T10:00:00.000Z",
+                "startTimeLocal": "2025-01-01T10:00:00.000",
+            }
+        ]
+        mock_garmin_client.get_activities_by_date.return_value = activities
+
+        # Create a ZIP file containing an empty FIT file.
+        mock_garmin_client.download_activity.return_value = mock_zip_bytes_factory(
+            ("12345_ACTIVITY.fit", b"")
+        )
+
+        # Act.
+        result = extractor.extract_fit_activities()
+
+        # Assert.
+        assert len(result) == 0
+        assert list(temp_dir.glob("*.fit")) == []
+        mock_logger.warning.assert_called_with(
+            "⚠️ Empty FIT file in archive for 12345."
+        )
+
+    @patch("dags.pipelines.garmin.extract.LOGGER")
+    def test_save_fit_file_from_file_object(
+        self, mock_logger, extractor, temp_dir, mock_zip_bytes_factory
+    ) -> None:
+        """
+        Test saving a FIT file from a file-like ZIP payload without copying to bytes.
+
+        :param mock_logger: Mock logger.
+        :param extractor: GarminExtractor fixture.
+        :param temp_dir: Temporary directory fixture.
+        :param mock_zip_bytes_factory: Cached ZIP payload factory fixture.
+        """
+
+        # Arrange.
+        zip_buffer = io.BytesIO(
+            mock_zip_bytes_factory(("12345_ACTIVITY.fit", b"ACTUAL_FIT_FILE_DATA"))
+        )
+        filepath = temp_dir / "activity.fit"
+
+        # Act.
+        file_size = extractor._save_fit_file(zip_buffer, filepath, "12345")
+
+        # Assert.
+        assert file_size == len(b"ACTUAL_FIT_FILE_DATA")
+        assert filepath.read_bytes() == b"ACTUAL_FIT_FILE_DATA"
+
+    def test_save_fit_file_failed_write_leaves_no_file(
+        self, extractor, temp_dir, mock_zip_bytes_factory
+    ) -> None:
+        """
+        Test that a failed FIT write leaves neither a partial nor a temporary file.
+
+        :param extractor: GarminExtractor fixture.
+        :param temp_dir: Temporary directory fixture.
+        :param mock_zip_bytes_factory: Cached ZIP payload factory fixture.
+        """
+
+        # Arrange.
+        fit_data = mock_zip_bytes_factory(("12345_ACTIVITY.fit", b"ACTUAL_FIT_DATA"))
+        filepath = temp_dir / "activity.fit"
+
+        # Act & Assert.
+        with patch(
+            "dags.pipelines.garmin.extract.shutil.copyfileobj",
+            side_effect=OSError("Disk full"),
+        ):
+            with pytest.raises(OSError, match="Disk full"):
+                extractor._save_fit_file(fit_data, filepath, "12345")
+
+        assert list(temp_dir.iterdir()) == []
+
     @patch("dags.pipelines.garmin.extract.LOGGER")
     def test_extract_fit_activities_non_zip_fallback(
-        self, mock_logger, mock_sleep, extractor, mock_garmin_client, temp_dir
+        self, mock_logger, extractor, mock_garmin_client, temp_dir
     ) -> None:
         """
         Test FIT activity extraction with non-ZIP data (fallback mode).
 
         :param mock_logger: Mock logger.
-        :param mock_sleep: Mock sleep function.
         :param extractor: GarminExtractor fixture.
         :param mock_garmin_client: Mock Garmin client fixture.
         :param temp_dir: Temporary directory fixture.
@@ -572,12 +964,8 @@ class TestGarminExtractor:
         assert len(result) == 1
 
         # Check file was created with raw data (fallback).
-        files = list(temp_dir.glob("*.fit"))
-        assert len(files) == 1
-
-        with open(files[0], "rb") as f:
-            content = f.read()
-            assert content == b"RAW_FIT_FILE_DATA"
+        assert result[0].parent == temp_dir
+        assert result[0].read_bytes() == b"RAW_FIT_FILE_DATA"
 
 
 class TestExtractFunction:
@@ -585,18 +973,7 @@ class TestExtractFunction:
     Test class for the extract function.
     """
 
-    @pytest.fixture
-    def mock_config(self, tmp_path) -> ETLConfig:
-        """
-        Create mock ETL config for testing.
-
-        :param tmp_path: Pytest temporary path fixture.
-        :return: Mock ETL config.
-        """
-
-        return MagicMock(data_dirs=MagicMock(ingest=tmp_path))
-
-    @patch("dags.pipelines.garmin.extract.GarminExtractor")
+    @patch("dags.pipelines.garmin.extract.GarminExtractor", new_callable=Mock)
     @patch("dags.pipelines.garmin.extract.LOGGER")
     def test_extract_success(
         self, mock_logger, mock_extractor_class, mock_config
@@ -610,7 +987,7 @@ class TestExtractFunction:
         """
 
         # Arrange.
-        mock_extractor = MagicMock()
+        mock_extractor = Mock()
         mock_extractor.extract_fit_activities.return_value = [Path("activity.fit")]
         mock_extractor.extract_garmin_data.return_value = [Path("data.json")]
         mock_extractor_class.return_value = mock_extractor
@@ -623,14 +1000,18 @@ class TestExtractFunction:
 
         # Assert.
         mock_extractor_class.assert_called_once_with(
-            date(2025, 1, 1), date(2025, 1, 2), mock_config.data_dirs.ingest, None
+            date(2025, 1, 1),
+            date(2025, 1, 2),
+            mock_config.data_dirs.ingest,
+            None,
+            max_workers=1,
         )
-        mock_extractor.authenticate.assert_called_once()
-        mock_extractor.extract_fit_activities.assert_called_once()
-        mock_extractor.extract_garmin_data.assert_called_once()
+        assert mock_extractor.authenticate.call_count == 1
+        assert mock_extractor.extract_fit_activities.call_count == 1
+        assert mock_extractor.extract_garmin_data.call_count == 1
         mock_logger.info.assert_called()
 
-    @patch("dags.pipelines.garmin.extract.GarminExtractor")
+    @patch("dags.pipelines.garmin.extract.GarminExtractor", new_callable=Mock)
     def test_extract_same_start_end_date(
         self, mock_extractor_class, mock_config
     ) -> None:
@@ -642,7 +1023,7 @@ class TestExtractFunction:
         """
 
         # Arrange.
-        mock_extractor = MagicMock()
+        mock_extractor = Mock()
         mock_extractor.extract_fit_activities.return_value = [Path("activity.fit")]
         mock_extractor.extract_garmin_data.return_value = [Path("data.json")]
         mock_extractor_class.return_value = mock_extractor
@@ -656,10 +1037,14 @@ class TestExtractFunction:
         # Assert.
         # Should pass the same date (no subtraction) because start_date == end_date
         mock_extractor_class.assert_called_once_with(
-            date(2025, 1, 1), date(2025, 1, 1), mock_config.data_dirs.ingest, None
+            date(2025, 1, 1),
+            date(2025, 1, 1),
+            mock_config.data_dirs.ingest,
+            None,
+            max_workers=1,
         )
 
-    @patch("dags.pipelines.garmin.extract.GarminExtractor")
+    @patch("dags.pipelines.garmin.extract.GarminExtractor", new_callable=Mock)
     @patch("dags.pipelines.garmin.extract.AirflowSkipException")
     def test_extract_no_data_found(
         self, mock_skip_exception, mock_extractor_class, mock_config
@@ -673,7 +1058,7 @@ class TestExtractFunction:
         """
 
         # Arrange.
-        mock_extractor = MagicMock()
+        mock_extractor = Mock()
         mock_extractor.extract_fit_activities.return_value = []
         mock_extractor.extract_garmin_data.return_value = []
         mock_extractor_class.return_value = mock_extractor
@@ -687,9 +1072,9 @@ class TestExtractFunction:
                 mock_config.data_dirs.ingest, data_interval_start, data_interval_end
             )
 
-        mock_skip_exception.assert_called_once()
+        assert mock_skip_exception.call_count == 1
 
-    @patch("dags.pipelines.garmin.extract.GarminExtractor")
+    @patch("dags.pipelines.garmin.extract.GarminExtractor", new_callable=Mock)
     def test_extract_activities_false(self, mock_extractor_class, mock_config) -> None:
         """
         Test extract function with specific data types (no FIT files).
@@ -699,7 +1084,7 @@ class TestExtractFunction:
         """
 
         # Arrange.
-        mock_extractor = MagicMock()
+        mock_extractor = Mock()
         mock_extractor.extract_garmin_data.return_value = [Path("data.json")]
         mock_extractor_class.return_value = mock_extractor
 
@@ -716,13 +1101,53 @@ class TestExtractFunction:
 
         # Assert.
         mock_extractor_class.assert_called_once_with(
-            date(2025, 1, 1), date(2025, 1, 2), mock_config.data_dirs.ingest, ["SLEEP"]
+            date(2025, 1, 1),
+            date(2025, 1, 2),
+            mock_config.data_dirs.ingest,
+            ["SLEEP"],
+            max_workers=1,
         )
-        mock_extractor.authenticate.assert_called_once()
+        assert mock_extractor.authenticate.call_count == 1
         mock_extractor.extract_fit_activities.assert_not_called()
-        mock_extractor.extract_garmin_data.assert_called_once()
+        assert mock_extractor.extract_garmin_data.call_count == 1
+
+    @patch("dags.pipelines.garmin.extract.GarminExtractor", new_callable=Mock)
+    def test_extract_max_workers(self, mock_extractor_class, mock_config) -> None:
+        """
+        Test that extract forwards max_workers to the GarminExtractor.
+
+        :param mock_extractor_class: Mock GarminExtractor class.
+        :param mock_config: Mock ETL config.
+        """
+
+        # Arrange.
+        mock_extractor = Mock()
+        mock_extractor.extract_garmin_data.return_value = [Path("data.json")]
+        mock_extractor.extract_fit_activities.return_value = [Path("activity.fit")]
+        mock_extractor_class.return_value = mock_extractor
+
+        data_interval_start = pendulum.datetime(2025, 1, 1, tz="UTC")
+        data_interval_end = pendulum.datetime(2025, 1, 3, tz="UTC")
+
+        # Act.
+        extract(
+            mock_config.data_dirs.ingest,
+            data_interval_start,
+            data_interval_end,
+            max_workers=4,
+        )
 
-    @patch("dags.pipelines.garmin.extract.GarminExtractor")
+        # Assert.
+        mock_extractor_class.assert_called_once_with(
+            date(2025, 1, 1),
+            date(2025, 1, 2),
+            mock_config.data_dirs.ingest,
+            None,
+            max_workers=4,
+        )
+        assert mock_extractor.extract_fit_activities.call_count == 1
+
+    @patch("dags.pipelines.garmin.extract.GarminExtractor", new_callable=Mock)
     @patch("dags.pipelines.garmin.extract.AirflowSkipException")
     def test_extract_activities_false_no_garmin_data(
         self, mock_skip_exception, mock_extractor_class, mock_config
@@ -736,7 +1161,7 @@ class TestExtractFunction:
         """
 
         # Arrange.
-        mock_extractor = MagicMock()
+        mock_extractor = Mock()
         mock_extractor.extract_garmin_data.return_value = []
         mock_extractor_class.return_value = mock_extractor
 
@@ -752,10 +1177,10 @@ class TestExtractFunction:
                 data_types=["SLEEP"],  # Specific data type that returns no data
             )
 
-        mock_skip_exception.assert_called_once()
+        assert mock_skip_exception.call_count == 1
         mock_extractor.extract_fit_activities.assert_not_called()
 
-    @patch("dags.pipelines.garmin.extract.GarminExtractor")
+    @patch("dags.pipelines.garmin.extract.GarminExtractor", new_callable=Mock)
     def test_extract_empty_data_types_list(
         self, mock_extractor_class, mock_config
     ) -> None:
@@ -786,7 +1211,7 @@ class TestExtractFunction:
         # Ensure extractor is not even instantiated.
         mock_extractor_class.assert_not_called()
 
-    @patch("dags.pipelines.garmin.extract.GarminExtractor")
+    @patch("dags.pipelines.garmin.extract.GarminExtractor", new_callable=Mock)
     @patch("dags.pipelines.garmin.extract.AirflowSkipException")
     def test_extract_empty_data_types_no_activities(
         self, mock_skip_exception, mock_extractor_class, mock_config
@@ -800,7 +1225,7 @@ class TestExtractFunction:
         """
 
         # Arrange.
-        mock_extractor = MagicMock()
+        mock_extractor = Mock()
         mock_extractor.extract_garmin_data.return_value = []
         mock_extractor_class.return_value = mock_extractor
 
@@ -827,7 +1252,7 @@ class TestExtractFunction:
         mock_extractor.extract_garmin_data.assert_not_called()
         mock_extractor.authenticate.assert_not_called()
 
-    @patch("dags.pipelines.garmin.extract.GarminExtractor")
+    @patch("dags.pipelines.garmin.extract.GarminExtractor", new_callable=Mock)
     @patch("dags.pipelines.garmin.extract.LOGGER")
     def test_extract_with_string_parameters(
         self, mock_logger, mock_extractor_class, mock_config
@@ -841,7 +1266,7 @@ class TestExtractFunction:
         """
 
         # Arrange.
-        mock_extractor = MagicMock()
+        mock_extractor = Mock()
         mock_extractor.extract_fit_activities.return_value = [Path("activity.fit")]
         mock_extractor.extract_garmin_data.return_value = [Path("data.json")]
         mock_extractor_class.return_value = mock_extractor
@@ -855,92 +1280,113 @@ class TestExtractFunction:
 
         # Assert.
         mock_extractor_class.assert_called_once_with(
-            date(2015, 1, 1), date(2015, 1, 30), mock_config.data_dirs.ingest, None
+            date(2015, 1, 1),
+            date(2015, 1, 30),
+            mock_config.data_dirs.ingest,
+            None,
+            max_workers=1,
         )
-        mock_extractor.authenticate.assert_called_once()
-        mock_extractor.extract_fit_activities.assert_called_once()
-        mock_extractor.extract_garmin_data.assert_called_once()
+        assert mock_extractor.authenticate.call_count == 1
+        assert mock_extractor.extract_fit_activities.call_count == 1
+        assert mock_extractor.extract_garmin_data.call_count == 1
         mock_logger.info.assert_called()
 
 
-class TestCliExtractFunction:
-    """
-    Test class for the cli_extract function.
+# Expected UTC datetimes for the CLI date arguments, built once per module.
+_CLI_EXPECTED_DATETIMES = {
+    "2025-01-01": pendulum.datetime(2025, 1, 1, tz="UTC"),
+    "2025-01-03": pendulum.datetime(2025, 1, 3, tz="UTC"),
+    "2025-12-25": pendulum.datetime(2025, 12, 25, tz="UTC"),
+    "2025-12-31": pendulum.datetime(2025, 12, 31, tz="UTC"),
+}
+
+
+def _assert_extract_kwargs(kwargs: dict, **expected) -> None:
     """
+    Assert that extract received the expected keyword arguments, compared as a single
+    dict subset, and no longer receives the removed include_fit flag.
 
-    @patch("dags.pipelines.garmin.extract.extract")
-    def test_cli_extract_basic(self, mock_extract) -> None:
-        """
-        Test basic cli_extract function call.
+    :param kwargs: Keyword arguments recorded from the extract call.
+    :param expected: Expected values for a subset of the keyword arguments.
+    """
 
-        :param mock_extract: Mock extract function.
-        """
+    assert {key: kwargs[key] for key in expected} == expected
+    assert "include_fit" not in kwargs
 
-        # Act.
-        cli_extract("/tmp/test", "2025-01-01", "2025-01-03")
 
-        # Assert.
-        mock_extract.assert_called_once()
-        _, kwargs = mock_extract.call_args
-        assert str(kwargs["ingest_dir"]) == "/tmp/test"
-        assert kwargs["data_interval_start"].date() == date(2025, 1, 1)
-        assert kwargs["data_interval_end"].date() == date(2025, 1, 3)
-        assert kwargs["data_types"] is None
-        assert "include_fit" not in kwargs
+class TestCliExtractFunction:
+    """
+    Test class for the cli_extract function.
+    """
 
-    @patch("dags.pipelines.garmin.extract.extract")
-    def test_cli_extract_with_data_types(self, mock_extract) -> None:
+    @pytest.fixture
+    def extract_calls(self, monkeypatch) -> List[dict]:
         """
-        Test cli_extract function with data types.
+        Replace extract with a lightweight recorder of its keyword arguments.
 
-        :param mock_extract: Mock extract function.
+        :param monkeypatch: Pytest monkeypatch fixture.
+        :return: List receiving the keyword arguments of each extract call.
         """
 
-        # Act.
-        cli_extract(
-            "/tmp/test",
-            "2025-01-01",
-            "2025-01-03",
-            data_types=["SLEEP", "HRV"],
+        calls = []
+        monkeypatch.setattr(
+            garmin_extract, "extract", lambda **kwargs: calls.append(kwargs)
         )
-
-        # Assert.
-        mock_extract.assert_called_once()
-        _, kwargs = mock_extract.call_args
-        assert kwargs["data_types"] == ["SLEEP", "HRV"]
-        assert "include_fit" not in kwargs
-
-    @patch("dags.pipelines.garmin.extract.extract")
-    def test_cli_extract_empty_data_types(self, mock_extract) -> None:
+        return calls
+
+    @pytest.mark.parametrize(
+        "start_date, end_date, data_types",
+        [
+            ("2025-01-01", "2025-01-03", None),
+            ("2025-01-01", "2025-01-03", ["SLEEP", "HRV"]),
+            ("2025-01-01", "2025-01-03", []),
+            ("2025-12-25", "2025-12-31", None),
+        ],
+        ids=["basic", "with_data_types", "empty_data_types", "date_conversion"],
+    )
+    def test_cli_extract(
+        self,
+        extract_calls,
+        start_date: str,
+        end_date: str,
+        data_types: Optional[List[str]],
+    ) -> None:
         """
-        Test cli_extract function with empty data types list.
+        Test that cli_extract converts CLI arguments and forwards them to extract.
 
-        :param mock_extract: Mock extract function.
+        :param extract_calls: Recorded extract calls fixture.
+        :param start_date: Start date CLI argument.
+        :param end_date: End date CLI argument.
+        :param data_types: Data types CLI argument.
         """
 
         # Act.
-        cli_extract("/tmp/test", "2025-01-01", "2025-01-03", data_types=[])
+        cli_extract("/tmp/test", start_date, end_date, data_types=data_types)
 
         # Assert.
-        mock_extract.assert_called_once()
-        _, kwargs = mock_extract.call_args
-        assert kwargs["data_types"] == []
+        assert len(extract_calls) == 1
+        kwargs = extract_calls[-1]
+        _assert_extract_kwargs(
+            kwargs,
+            ingest_dir=Path("/tmp/test"),
+            data_interval_start=_CLI_EXPECTED_DATETIMES[start_date],
+            data_interval_end=_CLI_EXPECTED_DATETIMES[end_date],
+            data_types=data_types,
+            max_workers=1,
+        )
+        assert kwargs["data_interval_start"].timezone.name == "UTC"
+        assert kwargs["data_interval_end"].timezone.name == "UTC"
 
-    @patch("dags.pipelines.garmin.extract.extract")
-    def test_cli_extract_date_conversion(self, mock_extract) -> None:
+    def test_cli_extract_max_workers(self, extract_calls) -> None:
         """
-        Test cli_extract function date string conversion.
+        Test that cli_extract forwards max_workers to extract.
 
-        :param mock_extract: Mock extract function.
+        :param extract_calls: Recorded extract calls fixture.
         """
 
         # Act.
-        cli_extract("/tmp/test", "2025-12-25", "2025-12-31")
+        cli_extract("/tmp/test", "2025-01-01", "2025-01-03", max_workers=4)
 
         # Assert.
-        mock_extract.assert_called_once()
-        _, kwargs = mock_extract.call_args
-        assert kwargs["data_interval_start"].date() == date(2025, 12, 25)
-        assert kwargs["data_interval_end"].date() == date(2025, 12, 31)
-        assert kwargs["data_interval_start"].timezone.name == "UTC"
-        assert kwargs["data_interval_end"].timezone.name == "UTC"
+        assert len(extract_calls) == 1
+        _assert_extract_kwargs(extract_calls[-1], data_types=None, max_workers=4)
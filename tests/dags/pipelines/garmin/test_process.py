@@ -9,14 +9,17 @@ This test suite covers:
     - Database session integration and model creation.
 """
 
-import copy
-import json
-import tempfile
+import math
+
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 
 from dags.lib.etl_config import ETLConfig
@@ -25,10 +28,11 @@ from dags.pipelines.garmin.constants import (
     GARMIN_FILE_TYPES,
     PR_TYPE_LABELS,
 )
-from dags.pipelines.garmin.process import GarminProcessor
+from dags.pipelines.garmin.process import GarminProcessor, _epoch_ms_to_datetime
 from dags.pipelines.garmin.sqla_models import (
     Acclimation,
     Activity,
+    ActivityTsMetric,
     BodyBattery,
     BreathingDisruption,
     HeartRate,
@@ -44,48 +48,826 @@ from dags.pipelines.garmin.sqla_models import (
     Stress,
     TrainingLoad,
     TrainingReadiness,
-    User,
     UserProfile,
     VO2Max,
 )
 
+# Session methods used by the processor, given as a plain list so the mock session
+# does not have to introspect the SQLAlchemy Session class on every construction.
+_SESSION_SPEC = [
+    "add",
+    "bulk_insert_mappings",
+    "bulk_save_objects",
+    "commit",
+    "execute",
+    "flush",
+    "merge",
+    "query",
+    "rollback",
+]
+
+# Baseline configuration shared by every mock session.
+_SESSION_MOCK_DEFAULTS = {
+    "query.return_value.filter.return_value.first.return_value": None,
+    "merge.return_value": None,
+    "add.return_value": None,
+}
+
+# Sleep time series processing methods with their JSON key, model and sample records.
+_SLEEP_TIMESERIES_CASES = [
+    pytest.param(
+        "_process_sleep_movement",
+        "sleepMovement",
+        SleepMovement,
+        [
+            {"startGMT": "2022-01-01T00:30:00Z", "activityLevel": 0.1},
+            {"startGMT": "2022-01-01T01:00:00Z", "activityLevel": 0.2},
+        ],
+        id="movement",
+    ),
+    pytest.param(
+        "_process_sleep_restless_moments",
+        "sleepRestlessMoments",
+        SleepRestlessMoment,
+        [
+            {"startGMT": 1640997000000, "value": 1},
+            {"startGMT": 1641001200000, "value": 2},
+        ],
+        id="restless_moments",
+    ),
+    pytest.param(
+        "_process_sleep_spo2_data",
+        "wellnessEpochSPO2DataDTOList",
+        SpO2,
+        [
+            {"epochTimestamp": "2022-01-01T00:00:00Z", "spo2Reading": 97},
+            {"epochTimestamp": "2022-01-01T01:00:00Z", "spo2Reading": 96},
+        ],
+        id="spo2",
+    ),
+    pytest.param(
+        "_process_sleep_hrv_data",
+        "hrvData",
+        HRV,
+        [
+            {"startGMT": 1640995800000, "value": 42.5},
+            {"startGMT": 1640999400000, "value": 45.2},
+        ],
+        id="hrv",
+    ),
+    pytest.param(
+        "_process_sleep_breathing_disruption",
+        "breathingDisruptionData",
+        BreathingDisruption,
+        [
+            {"startGMT": 1641000000000, "value": 1},
+            {"startGMT": 1641003600000, "value": 2},
+        ],
+        id="breathing_disruption",
+    ),
+]
+
+
+# Activities list entries, from current to very old, with the expected attribute values
+# of the resulting Activity record.
+_ACTIVITY_BASE_CASES = [
+    pytest.param(
+        {
+            "activityId": 987654321,
+            "activityName": "Morning Run",
+            "activityType": {"typeId": 1, "typeKey": "running"},
+            "eventType": {"typeId": 1, "typeKey": "other"},
+            "startTimeGMT": "2022-01-01T07:00:00",
+            "startTimeLocal": "2022-01-01T00:00:00",
+            "endTimeGMT": "2022-01-01T08:30:00",
+            "deviceId": 123456789,
+            "manufacturer": "GARMIN",
+            "timeZoneId": 1,
+            "parent": False,
+            "purposeful": True,
+            "favorite": False,
+            "pr": False,
+            "hasPolyline": True,
+            "hasImages": False,
+            "hasVideo": False,
+            "hasSplits": True,
+            "hasHeatMap": False,
+            "elevationCorrected": True,
+            "atpActivity": False,
+            "manualActivity": False,
+            "autoCalcCalories": True,
+        },
+        {"activity_id": 987654321, "activity_name": "Morning Run"},
+        id="full",
+    ),
+    # Historical activity data without device fields.
+    pytest.param(
+        {
+            "activityId": 987654321,
+            "activityName": "Very Old Run",
+            "activityType": {"typeId": 1, "typeKey": "running"},
+            "eventType": {"typeId": 1, "typeKey": "other"},
+            "startTimeGMT": "2015-01-01T07:00:00",
+            "startTimeLocal": "2015-01-01T00:00:00",
+            "endTimeGMT": "2015-01-01T08:00:00",
+            "parent": False,
+            "purposeful": True,
+            "favorite": False,
+            "pr": False,
+            "hasPolyline": True,
+            "hasImages": False,
+            "hasVideo": False,
+            "hasSplits": True,
+            "hasHeatMap": False,
+            "elevationCorrected": True,
+            "atpActivity": False,
+            "manualActivity": False,
+            "autoCalcCalories": True,
+        },
+        {
+            "device_id": None,
+            "manufacturer": None,
+            "time_zone_id": None,
+            "activity_id": 987654321,
+            "activity_name": "Very Old Run",
+            "start_ts": datetime(2015, 1, 1, 7, 0, tzinfo=timezone.utc),
+            "end_ts": datetime(2015, 1, 1, 8, 0, tzinfo=timezone.utc),
+        },
+        id="no_device",
+    ),
+    # 2016 activity data without hasSplits, elevationCorrected, atpActivity.
+    pytest.param(
+        {
+            "activityId": 1021028774,
+            "activityName": "New York City Running",
+            "activityType": {"typeId": 1, "typeKey": "running"},
+            "eventType": {"typeId": 9, "typeKey": "uncategorized"},
+            "startTimeGMT": "2016-01-16 17:32:31",
+            "startTimeLocal": "2016-01-16 12:32:31",
+            "duration": 2077.619,
+            "distance": 7360.03,
+            "timeZoneId": 149,
+            "parent": False,
+            "purposeful": False,
+            "favorite": False,
+            "pr": False,
+            "hasPolyline": True,
+            "hasImages": False,
+            "hasVideo": False,
+            "hasHeatMap": False,
+            "manualActivity": False,
+            "autoCalcCalories": False,
+        },
+        {
+            "has_splits": None,
+            "elevation_corrected": None,
+            "atp_activity": None,
+            "has_polyline": True,
+            "has_images": False,
+            "has_video": False,
+            "has_heat_map": False,
+            "parent": False,
+            "purposeful": False,
+            "favorite": False,
+            "pr": False,
+            "manual_activity": False,
+            "auto_calc_calories": False,
+            "activity_id": 1021028774,
+            "activity_name": "New York City Running",
+            "duration": 2077.619,
+            "distance": 7360.03,
+        },
+        id="no_bools",
+    ),
+    # Very old activity data without activityName.
+    pytest.param(
+        {
+            "activityId": 999999999,
+            "activityType": {"typeId": 1, "typeKey": "running"},
+            "eventType": {"typeId": 9, "typeKey": "uncategorized"},
+            "startTimeGMT": "2014-01-01T10:00:00",
+            "startTimeLocal": "2014-01-01T05:00:00",
+            "endTimeGMT": "2014-01-01T11:00:00",
+            "duration": 3600,
+            "parent": False,
+            "purposeful": False,
+            "favorite": False,
+            "pr": False,
+            "hasPolyline": True,
+            "hasImages": False,
+            "hasVideo": False,
+            "hasHeatMap": False,
+            "manualActivity": False,
+            "autoCalcCalories": False,
+        },
+        {
+            "activity_name": None,
+            "activity_id": 999999999,
+            "duration": 3600,
+            "parent": False,
+            "purposeful": False,
+            "favorite": False,
+            "pr": False,
+        },
+        id="no_name",
+    ),
+]
+
+
+# File types with the processing method each is routed to by process_file_set.
+_FILE_ROUTING_CASES = [
+    pytest.param(GARMIN_FILE_TYPES.STEPS, "_process_steps", id="steps"),
+    pytest.param(
+        GARMIN_FILE_TYPES.TRAINING_STATUS,
+        "_process_training_status",
+        id="training_status",
+    ),
+    pytest.param(
+        GARMIN_FILE_TYPES.TRAINING_READINESS,
+        "_process_training_readiness",
+        id="training_readiness",
+    ),
+    pytest.param(GARMIN_FILE_TYPES.STRESS, "_process_stress_body_battery", id="stress"),
+    pytest.param(GARMIN_FILE_TYPES.HEART_RATE, "_process_heart_rate", id="heart_rate"),
+    pytest.param(
+        GARMIN_FILE_TYPES.RESPIRATION,
+        "_process_respiration",
+        id="respiration",
+    ),
+    pytest.param(
+        GARMIN_FILE_TYPES.INTENSITY_MINUTES,
+        "_process_intensity_minutes",
+        id="intensity_minutes",
+    ),
+    pytest.param(GARMIN_FILE_TYPES.FLOORS, "_process_floors", id="floors"),
+    pytest.param(
+        GARMIN_FILE_TYPES.PERSONAL_RECORDS,
+        "_process_personal_records",
+        id="personal_records",
+    ),
+    pytest.param(
+        GARMIN_FILE_TYPES.RACE_PREDICTIONS,
+        "_process_race_predictions",
+        id="race_predictions",
+    ),
+]
+
+
+# UTC datetimes of the epoch millisecond timestamps asserted on by the tests, computed
+# once at import.
+_EPOCH_MS_DATETIMES = {
+    epoch_ms: datetime.fromtimestamp(epoch_ms / 1000, tz=timezone.utc)
+    for epoch_ms in (
+        1640995200000,
+        1640995560000,
+        1640995740000,
+        1650114005000,
+        1754550000000,
+        1754550120000,
+    )
+}
+
+
+def _clone(obj: Any) -> Any:
+    """
+    Copy a JSON-shaped payload, recursing only into dicts and lists.
+
+    Cheaper than `copy.deepcopy` for acyclic sample data, since it skips the memo and
+    `__deepcopy__` dispatch.
+
+    :param obj: Payload to copy.
+    :return: Copy of the payload sharing only immutable leaves with the original.
+    """
+
+    if isinstance(obj, dict):
+        return {key: _clone(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_clone(item) for item in obj]
+    return obj
+
+
+@lru_cache(maxsize=None)
+def _activity_with_id(activity_id: int) -> Activity:
+    """
+    Build an Activity record with only `activity_id` set, standing in for the record
+    returned by the mocked upsert. Cached, since the processor only reads it.
+
+    :param activity_id: Activity ID.
+    :return: Activity record.
+    """
+
+    activity = Activity()
+    activity.activity_id = activity_id
+    return activity
+
+
+def _series(start_ms: int, step_ms: int, values: List[Any]) -> List[List[Any]]:
+    """
+    Build a Garmin time series of `[epoch_ms, value]` pairs sampled at a fixed
+    interval.
+
+    :param start_ms: Epoch timestamp in milliseconds of the first sample.
+    :param step_ms: Interval between samples in milliseconds.
+    :param values: Sample values, in order.
+    :return: List of `[epoch_ms, value]` pairs.
+    """
+
+    return [[start_ms + i * step_ms, value] for i, value in enumerate(values)]
+
+
+# Getter for the `value` column of time series records, used in assertions.
+_get_value = attrgetter("value")
+
+
+# Sample sleep JSON data, shared read-only by the fixtures below.
+_SAMPLE_SLEEP_DATA = {
+    "dailySleepDTO": {
+        "id": 123456789,
+        "sleepStartTimestampGMT": 1640995200000,  # 2022-01-01 00:00:00 UTC
+        "sleepEndTimestampGMT": 1641024000000,  # 2022-01-01 08:00:00 UTC
+        "sleepStartTimestampLocal": 1640995200000,
+        "sleepEndTimestampLocal": 1641024000000,
+        "calendarDate": "2022-01-01",
+        "sleepTimeSeconds": 28800,
+        "deepSleepSeconds": 7200,
+        "lightSleepSeconds": 14400,
+        "remSleepSeconds": 5400,
+        "awakeSleepSeconds": 1800,
+        "averageSpO2Value": 94.0,
+        "lowestSpO2Value": 91,
+        "highestSpO2Value": 98,
+        "averageRespirationValue": 15.2,
+        "lowestRespirationValue": 12.0,
+        "highestRespirationValue": 18.5,
+        "sleepScores": {
+            "overall": {"qualifierKey": "GOOD", "value": 85},
+            "deepPercentage": {"qualifierKey": "EXCELLENT", "value": 25},
+            "lightPercentage": {"qualifierKey": "GOOD", "value": 50},
+            "remPercentage": {"qualifierKey": "FAIR", "value": 19},
+        },
+        "sleepNeed": {
+            "baseline": 28800,
+            "actual": 28800,
+            "feedback": "You got your recommended sleep time.",
+        },
+        "nextSleepNeed": {
+            "baseline": 28800,
+            "actual": 28800,
+            "feedback": "Aim for 8 hours tonight.",
+        },
+    },
+    "wellnessSpO2SleepSummaryDTO": {
+        "numberOfEventsBelowThreshold": 2,
+    },
+    "sleepMovement": [
+        {"startGMT": "2022-01-01T00:30:00Z", "activityLevel": 0.1},
+        {"startGMT": "2022-01-01T01:00:00Z", "activityLevel": 0.2},
+    ],
+    "sleepRestlessMoments": [
+        {"startGMT": 1640997000000, "value": 1},  # Epoch milliseconds
+        {"startGMT": 1641001200000, "value": 2},
+    ],
+    "wellnessEpochSPO2DataDTOList": [
+        {"epochTimestamp": "2022-01-01T00:00:00Z", "spo2Reading": 97},
+        {"epochTimestamp": "2022-01-01T01:00:00Z", "spo2Reading": 96},
+    ],
+    "hrvData": [
+        {"startGMT": 1640995800000, "value": 42.5},  # Epoch milliseconds
+        {"startGMT": 1640999400000, "value": 45.2},
+    ],
+    "breathingDisruptionData": [
+        {"startGMT": 1641000000000, "value": 1},  # Epoch milliseconds
+        {"startGMT": 1641003600000, "value": 2},
+    ],
+    "remSleepData": True,
+    "restlessMomentsCount": 12,
+    "avgOvernightHrv": 43.8,
+    "bodyBatteryChange": -25,
+}
+
+# Sample sleep payload serialized once, for tests that need it as a file on disk.
+_SAMPLE_SLEEP_BYTES = orjson.dumps(_SAMPLE_SLEEP_DATA)
+
+
+# Sample user profile JSON data, shared read-only by the fixtures below.
+_SAMPLE_USER_PROFILE_DATA = {
+    "full_name": "Test User",
+    "userData": {
+        "gender": "MALE",
+        "weight": 70.5,
+        "height": 175.0,
+        "birthDate": "1990-01-01",
+        "vo2MaxRunning": 55.2,
+        "vo2MaxCycling": 62.1,
+    },
+}
+
+
+# Sample activities list JSON data, shared read-only by the fixtures below.
+_SAMPLE_ACTIVITY_DATA = [
+    {
+        "activityId": 987654321,
+        "activityName": "Morning Run",
+        "activityType": {"typeId": 1, "typeKey": "running"},
+        "eventType": {"typeId": 9, "typeKey": "race"},
+        "startTimeGMT": "2022-01-01T06:00:00.000",
+        "startTimeLocal": "2022-01-01T07:00:00.000",
+        "endTimeGMT": "2022-01-01T07:00:00.000",
+        "deviceId": 123456,
+        "manufacturer": "Garmin",
+        "timeZoneId": 1,
+        "hasPolyline": True,
+        "hasImages": False,
+        "hasVideo": False,
+        "hasSplits": True,
+        "hasHeatMap": False,
+        "parent": False,
+        "purposeful": True,
+        "favorite": False,
+        "elevationCorrected": True,
+        "atpActivity": False,
+        "manualActivity": False,
+        "pr": True,
+        "autoCalcCalories": True,
+        "duration": 3600.0,
+        "distance": 10000.0,
+        "calories": 600.0,
+        "averageHR": 150,
+        "maxHR": 175,
+        "steps": 12000,
+        "vO2MaxValue": 55.5,
+    }
+]
+
+
+# Sample steps JSON data, shared read-only by the steps processing tests.
+_SAMPLE_STEPS_DATA = [
+    {
+        "startGMT": "2025-08-07T07:00:00.0",
+        "endGMT": "2025-08-07T07:15:00.0",
+        "steps": 0,
+        "pushes": 0,
+        "primaryActivityLevel": "sleeping",
+        "activityLevelConstant": True,
+    },
+    {
+        "startGMT": "2025-08-07T07:15:00.0",
+        "endGMT": "2025-08-07T07:30:00.0",
+        "steps": 27,
+        "pushes": 0,
+        "primaryActivityLevel": "sleeping",
+        "activityLevelConstant": True,
+    },
+    {
+        "startGMT": "2025-08-07T14:15:00.0",
+        "endGMT": "2025-08-07T14:30:00.0",
+        "steps": 2206,
+        "pushes": 0,
+        "primaryActivityLevel": "highlyActive",
+        "activityLevelConstant": True,
+    },
+    {
+        "startGMT": "2025-08-07T15:00:00.0",
+        "endGMT": "2025-08-07T15:15:00.0",
+        "steps": 1307,
+        "pushes": 0,
+        "primaryActivityLevel": "active",
+        "activityLevelConstant": False,
+    },
+]
+
+
+# Steps payloads with the number of records expected to be upserted, or None when the
+# upsert should be skipped entirely.
+_STEPS_CASES = [
+    pytest.param(_SAMPLE_STEPS_DATA, 4, id="valid"),
+    pytest.param([], None, id="empty"),
+    pytest.param(
+        [
+            *_SAMPLE_STEPS_DATA,
+            {
+                "startGMT": "2025-08-07T16:00:00.0",
+                "endGMT": None,  # Invalid endGMT
+                "steps": 100,
+                "primaryActivityLevel": "active",
+                "activityLevelConstant": False,
+            },
+            {
+                "startGMT": "2025-08-07T16:15:00.0",
+                "endGMT": "2025-08-07T16:30:00.0",
+                "steps": None,  # Invalid steps
+                "primaryActivityLevel": "sedentary",
+                "activityLevelConstant": True,
+            },
+        ],
+        4,
+        id="invalid",
+    ),
+]
+
+
+# Sample training readiness JSON data, shared read-only by the fixtures below. The
+# second record only differs from the first in the fields it overrides.
+_SAMPLE_TRAINING_READINESS_RECORD = {
+    "userProfilePK": 15007510,
+    "calendarDate": "2025-08-07",
+    "timestamp": "2025-08-07T18:56:58.0",
+    "timestampLocal": "2025-08-07T11:56:58.0",
+    "deviceId": 3474921807,
+    "level": "MODERATE",
+    "feedbackLong": "MOD_RT_MOD_SS_MOD",
+    "feedbackShort": "LISTEN_TO_YOUR_BODY",
+    "score": 50,
+    "sleepScore": 77,
+    "sleepScoreFactorPercent": 65,
+    "sleepScoreFactorFeedback": "MODERATE",
+    "recoveryTime": 1524,
+    "recoveryTimeFactorPercent": 59,
+    "recoveryTimeFactorFeedback": "MODERATE",
+    "acwrFactorPercent": 95,
+    "acwrFactorFeedback": "GOOD",
+    "acuteLoad": 730,
+    "stressHistoryFactorPercent": 77,
+    "stressHistoryFactorFeedback": "GOOD",
+    "hrvFactorPercent": 88,
+    "hrvFactorFeedback": "GOOD",
+    "hrvWeeklyAverage": 75,
+    "sleepHistoryFactorPercent": 69,
+    "sleepHistoryFactorFeedback": "MODERATE",
+    "validSleep": True,
+    "inputContext": "UPDATE_REALTIME_VARIABLES",
+    "primaryActivityTracker": True,
+    "recoveryTimeChangePhrase": None,
+    "sleepHistoryFactorFeedbackPhrase": None,
+    "hrvFactorFeedbackPhrase": None,
+    "stressHistoryFactorFeedbackPhrase": None,
+    "acwrFactorFeedbackPhrase": None,
+    "recoveryTimeFactorFeedbackPhrase": None,
+    "sleepScoreFactorFeedbackPhrase": None,
+}
+_SAMPLE_TRAINING_READINESS_DATA = [
+    _SAMPLE_TRAINING_READINESS_RECORD,
+    {
+        **_SAMPLE_TRAINING_READINESS_RECORD,
+        "timestamp": "2025-08-07T15:07:53.0",
+        "timestampLocal": "2025-08-07T08:07:53.0",
+        "level": "LOW",
+        "feedbackLong": "LOW_RT_MOD_OR_LOW_SS_MOD",
+        "feedbackShort": "FOCUS_ON_ENERGY_LEVELS",
+        "score": 47,
+        "recoveryTime": 1752,
+        "recoveryTimeFactorPercent": 52,
+        "inputContext": "AFTER_POST_EXERCISE_RESET",
+        "recoveryTimeChangePhrase": "REACHED_ZERO",
+    },
+]
+
+
+# Sample stress JSON data, shared read-only by the fixtures below.
+_SAMPLE_STRESS_DATA = {
+    "stressValuesArray": [
+        [1754550000000, 25],  # Valid stress value.
+        [1754550180000, 40],  # Valid stress value.
+        [1754550360000, -1],  # Invalid stress value (negative).
+        [1754550540000, 55],  # Valid stress value.
+        [1754550720000],  # Incomplete entry.
+    ],
+    "bodyBatteryValuesArray": [
+        [1754550000000, 0, 75],  # Valid body battery value.
+        [1754550180000, 1, 72],  # Valid body battery value.
+        [1754550360000, 2, 68],  # Valid body battery value.
+        [1754550540000, 3],  # Incomplete entry.
+    ],
+    "otherData": "should be removed by pop",
+}
+
+
+# Sample heart rate JSON data, shared read-only by the fixtures below.
+_SAMPLE_HEART_RATE_DATA = {
+    "userProfilePK": 15007510,
+    "calendarDate": "2025-08-07",
+    "startTimestampGMT": "2025-08-07T07:00:00.0",
+    "endTimestampGMT": "2025-08-08T07:00:00.0",
+    "startTimestampLocal": "2025-08-07T00:00:00.0",
+    "endTimestampLocal": "2025-08-08T00:00:00.0",
+    "maxHeartRate": 183,
+    "minHeartRate": 43,
+    "restingHeartRate": 45,
+    "lastSevenDaysAvgRestingHeartRate": 45,
+    # Two-minute samples of [epoch timestamp in ms, heart rate value].
+    "heartRateValues": _series(1754550000000, 120000, [49, 49, 47, 48, 48, 48]),
+}
+
+
+# Sample respiration JSON data, shared read-only by the fixtures below.
+_SAMPLE_RESPIRATION_DATA = {
+    "userProfilePK": 15007510,
+    "calendarDate": "2025-08-07",
+    "startTimestampGMT": "2025-08-07T07:00:00.0",
+    "endTimestampGMT": "2025-08-08T07:00:00.0",
+    "startTimestampLocal": "2025-08-07T00:00:00.0",
+    "endTimestampLocal": "2025-08-08T00:00:00.0",
+    "sleepStartTimestampGMT": "2025-08-07T06:42:06.0",
+    "sleepEndTimestampGMT": "2025-08-07T13:23:06.0",
+    "sleepStartTimestampLocal": "2025-08-06T23:42:06.0",
+    "sleepEndTimestampLocal": "2025-08-07T06:23:06.0",
+    "lowestRespirationValue": 6.0,
+    "highestRespirationValue": 45.0,
+    "avgWakingRespirationValue": 15.0,
+    "avgSleepRespirationValue": 11.0,
+    "avgTomorrowSleepRespirationValue": 11.0,
+    "respirationValueDescriptorsDTOList": [
+        {"key": "timestamp", "index": 0},
+        {"key": "respiration", "index": 1},
+    ],
+    "respirationValuesArray": [
+        [1754550120000, 11.0],  # Epoch timestamp in ms, respiration value
+        [1754550240000, 12.0],
+        [1754550360000, 13.0],
+        [1754550480000, 11.0],
+        [1754557680000, -1.0],  # Negative value (should be skipped)
+        [1754557800000, 13.0],
+        [1754557920000, 10.0],
+    ],
+    "respirationAveragesValueDescriptorDTOList": [
+        {
+            "respirationAveragesValueDescriptorIndex": 0,
+            "respirationAveragesValueDescriptionKey": "timestamp",
+        },
+        {
+            "respirationAveragesValueDescriptorIndex": 1,
+            "respirationAveragesValueDescriptionKey": "averageRespirationValue",
+        },
+    ],
+    "respirationAveragesValuesArray": [
+        [1754553600000, 11.74, 17.0, 7.0],
+        [1754557200000, 11.05, 15.0, 7.0],
+    ],
+    "respirationVersion": 200,
+}
+
+
+# Sample personal records JSON data, serialized once for tests that need it on disk.
+_SAMPLE_PERSONAL_RECORDS_DATA = [
+    {
+        "id": 2071637774,
+        "typeId": 3,
+        "status": "ACCEPTED",
+        "activityId": 8649918243,
+        "activityName": "TT 5k",
+        "activityType": "running",
+        "value": 1091.7960205078125,
+        "prStartTimeGmt": 1650114005000,
+        "prStartTimeGmtFormatted": "2022-04-16T13:00:05.0",
+        "prStartTimeLocal": None,
+        "prStartTimeLocalFormatted": None,
+        "prTypeLabelKey": None,
+        "poolLengthUnit": None,
+    },
+    {
+        "id": 1619773303,
+        "typeId": 4,
+        "status": "ACCEPTED",
+        "activityId": 4914160155,
+        "activityName": "Prog tempo",
+        "activityType": "running",
+        "value": 2441.117919921875,
+        "prStartTimeGmt": 1589158420000,
+        "prStartTimeGmtFormatted": "2020-05-11T00:53:40.0",
+        "prStartTimeLocal": None,
+        "prStartTimeLocalFormatted": None,
+        "prTypeLabelKey": None,
+        "poolLengthUnit": None,
+    },
+    {
+        "id": 2030060315,
+        "typeId": 7,
+        "status": "ACCEPTED",
+        "activityId": 8110297915,
+        "activityName": "Long run",
+        "activityType": "running",
+        "value": 21018.83984375,
+        "prStartTimeGmt": 1642071671000,
+        "prStartTimeGmtFormatted": "2022-01-13T11:01:11.0",
+        "prStartTimeLocal": None,
+        "prStartTimeLocalFormatted": None,
+        "prTypeLabelKey": None,
+        "poolLengthUnit": None,
+    },
+]
+_SAMPLE_PERSONAL_RECORDS_BYTES = orjson.dumps(_SAMPLE_PERSONAL_RECORDS_DATA)
+
+
+# Sample race predictions JSON data, serialized once for tests that need it on disk.
+_SAMPLE_RACE_PREDICTIONS_DATA = {
+    "userId": 15007510,
+    "fromCalendarDate": None,
+    "toCalendarDate": None,
+    "calendarDate": "2025-08-08",
+    "time5K": 1146,
+    "time10K": 2465,
+    "timeHalfMarathon": 5663,
+    "timeMarathon": 12644,
+}
+_SAMPLE_RACE_PREDICTIONS_BYTES = orjson.dumps(_SAMPLE_RACE_PREDICTIONS_DATA)
+
+
+# Expected attribute values of the records built from the sample training status data.
+_EXPECTED_ACCLIMATION = {
+    "user_id": 1,
+    "date": "2025-08-15",
+    "heat_acclimation_percentage": 23,
+    "heat_trend": "DEACCLIMATIZING",
+    "altitude_acclimation": 0,
+    "current_altitude": 8,
+    "acclimation_percentage": 0,
+    "altitude_trend": None,
+}
+_EXPECTED_TRAINING_LOAD_BALANCE = {
+    "user_id": 1,
+    "date": "2025-08-15",
+    "monthly_load_aerobic_low": 1540.738,
+    "monthly_load_aerobic_high": 1366.2461,
+    "monthly_load_anaerobic": 492.51825,
+    "training_balance_feedback_phrase": "ABOVE_TARGETS",
+}
+_EXPECTED_TRAINING_LOAD_STATUS = {
+    "user_id": 1,
+    "date": "2025-08-15",
+    "acwr_percent": 38,
+    "acwr_status": "OPTIMAL",
+    "acwr_status_feedback": "FEEDBACK_2",
+    "daily_training_load_acute": 811,
+    "daily_training_load_chronic": 841,
+    "daily_acute_chronic_workload_ratio": 0.9,
+    "training_status": 8,
+    "training_status_feedback_phrase": "STRAINED_1",
+    # Balance fields carried over, since the status data has the same date.
+    "monthly_load_aerobic_low": 1540.738,
+    "monthly_load_aerobic_high": 1366.2461,
+}
+
 
 # pylint: disable=protected-access,too-many-public-methods
+@pytest.mark.xdist_group(name="garmin_process")
 class TestGarminProcessor:
     """
     Test class for GarminProcessor functionality.
     """
 
-    @pytest.fixture
-    def temp_dir(self):
+    @pytest.fixture(scope="class")
+    def temp_dir(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
         """
-        Create temporary directory for testing.
+        Create temporary directory shared by the tests in the class, as a unique
+        subdirectory of the session's temporary root. Each test writes the files it
+        reads, so files left by other tests do not matter.
 
+        :param tmp_path_factory: Pytest session temporary path factory.
         :return: Temporary directory path.
         """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+        return tmp_path_factory.mktemp("processor")
 
-    @pytest.fixture
-    def processor(self) -> GarminProcessor:
+    @pytest.fixture(scope="class")
+    def shared_processor(self) -> Tuple[GarminProcessor, Dict[str, Any]]:
         """
-        Create GarminProcessor instance for testing.
+        Create a GarminProcessor instance shared by all tests in the class, along with a
+        snapshot of its initial state.
 
-        :return: GarminProcessor instance.
+        :return: Tuple of the GarminProcessor instance and its initial attributes.
         """
 
         # Create mock config.
         mock_config = MagicMock(spec=ETLConfig)
 
         with patch("dags.lib.dag_utils.ETLResult"):
-            return GarminProcessor(
+            processor = GarminProcessor(
                 config=mock_config,
                 dag_run_id="test_run_123",
                 dag_start_date=datetime(2022, 1, 1),
                 file_sets=[],
             )
 
+        return processor, dict(processor.__dict__)
+
+    @pytest.fixture
+    def processor(
+        self, shared_processor: Tuple[GarminProcessor, Dict[str, Any]]
+    ) -> GarminProcessor:
+        """
+        Provide the shared GarminProcessor instance with its state reset, so that
+        attributes set by a previous test (e.g., user_id) never leak.
+
+        :param shared_processor: Shared GarminProcessor and initial state fixture.
+        :return: GarminProcessor instance.
+        """
+
+        processor, initial_state = shared_processor
+        processor.__dict__.clear()
+        processor.__dict__.update(initial_state)
+        processor.results.reset_mock()
+        return processor
+
     @pytest.fixture
     def mock_session(self) -> MagicMock:
         """
@@ -94,13 +876,54 @@ class TestGarminProcessor:
         :return: Mock session.
         """
 
-        session = MagicMock()
-        session.query.return_value.filter.return_value.first.return_value = None
-        session.merge.return_value = None
-        session.add.return_value = None
+        session = MagicMock(spec=_SESSION_SPEC)
+        session.configure_mock(**_SESSION_MOCK_DEFAULTS)
         return session
 
     @pytest.fixture
+    def stub_session(self) -> SimpleNamespace:
+        """
+        Create a bare session stand-in for tests that only pass the session through to
+        the mocked upsert and never inspect it.
+
+        :return: Stub session.
+        """
+
+        return SimpleNamespace()
+
+    @pytest.fixture(autouse=True)
+    def mock_upsert(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """
+        Replace `upsert_model_instances` in the processor module with a mock, for every
+        test in the class so none can reach the real database helper.
+
+        :param monkeypatch: Pytest monkeypatch fixture.
+        :return: Mock upsert function.
+        """
+
+        upsert = MagicMock()
+        monkeypatch.setattr(
+            "dags.pipelines.garmin.process.upsert_model_instances", upsert
+        )
+        return upsert
+
+    @pytest.fixture
+    def patched_ensure_user(
+        self, monkeypatch: pytest.MonkeyPatch, processor: GarminProcessor
+    ) -> MagicMock:
+        """
+        Replace `_ensure_user_exists` on the processor with a mock returning a user ID.
+
+        :param monkeypatch: Pytest monkeypatch fixture.
+        :param processor: GarminProcessor fixture.
+        :return: Mock `_ensure_user_exists` method.
+        """
+
+        ensure_user = MagicMock(return_value=1)
+        monkeypatch.setattr(processor, "_ensure_user_exists", ensure_user)
+        return ensure_user
+
+    @pytest.fixture(scope="session")
     def sample_sleep_data(self) -> Dict[str, any]:
         """
         Create sample sleep data for testing.
@@ -108,72 +931,9 @@ class TestGarminProcessor:
         :return: Sample sleep JSON data.
         """
 
-        return {
-            "dailySleepDTO": {
-                "id": 123456789,
-                "sleepStartTimestampGMT": 1640995200000,  # 2022-01-01 00:00:00 UTC
-                "sleepEndTimestampGMT": 1641024000000,  # 2022-01-01 08:00:00 UTC
-                "sleepStartTimestampLocal": 1640995200000,
-                "sleepEndTimestampLocal": 1641024000000,
-                "calendarDate": "2022-01-01",
-                "sleepTimeSeconds": 28800,
-                "deepSleepSeconds": 7200,
-                "lightSleepSeconds": 14400,
-                "remSleepSeconds": 5400,
-                "awakeSleepSeconds": 1800,
-                "averageSpO2Value": 94.0,
-                "lowestSpO2Value": 91,
-                "highestSpO2Value": 98,
-                "averageRespirationValue": 15.2,
-                "lowestRespirationValue": 12.0,
-                "highestRespirationValue": 18.5,
-                "sleepScores": {
-                    "overall": {"qualifierKey": "GOOD", "value": 85},
-                    "deepPercentage": {"qualifierKey": "EXCELLENT", "value": 25},
-                    "lightPercentage": {"qualifierKey": "GOOD", "value": 50},
-                    "remPercentage": {"qualifierKey": "FAIR", "value": 19},
-                },
-                "sleepNeed": {
-                    "baseline": 28800,
-                    "actual": 28800,
-                    "feedback": "You got your recommended sleep time.",
-                },
-                "nextSleepNeed": {
-                    "baseline": 28800,
-                    "actual": 28800,
-                    "feedback": "Aim for 8 hours tonight.",
-                },
-            },
-            "wellnessSpO2SleepSummaryDTO": {
-                "numberOfEventsBelowThreshold": 2,
-            },
-            "sleepMovement": [
-                {"startGMT": "2022-01-01T00:30:00Z", "activityLevel": 0.1},
-                {"startGMT": "2022-01-01T01:00:00Z", "activityLevel": 0.2},
-            ],
-            "sleepRestlessMoments": [
-                {"startGMT": 1640997000000, "value": 1},  # Epoch milliseconds
-                {"startGMT": 1641001200000, "value": 2},
-            ],
-            "wellnessEpochSPO2DataDTOList": [
-                {"epochTimestamp": "2022-01-01T00:00:00Z", "spo2Reading": 97},
-                {"epochTimestamp": "2022-01-01T01:00:00Z", "spo2Reading": 96},
-            ],
-            "hrvData": [
-                {"startGMT": 1640995800000, "value": 42.5},  # Epoch milliseconds
-                {"startGMT": 1640999400000, "value": 45.2},
-            ],
-            "breathingDisruptionData": [
-                {"startGMT": 1641000000000, "value": 1},  # Epoch milliseconds
-                {"startGMT": 1641003600000, "value": 2},
-            ],
-            "remSleepData": True,
-            "restlessMomentsCount": 12,
-            "avgOvernightHrv": 43.8,
-            "bodyBatteryChange": -25,
-        }
+        return _SAMPLE_SLEEP_DATA
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_user_profile_data(self) -> Dict[str, any]:
         """
         Create sample user profile data for testing.
@@ -181,19 +941,9 @@ class TestGarminProcessor:
         :return: Sample user profile JSON data.
         """
 
-        return {
-            "full_name": "Test User",
-            "userData": {
-                "gender": "MALE",
-                "weight": 70.5,
-                "height": 175.0,
-                "birthDate": "1990-01-01",
-                "vo2MaxRunning": 55.2,
-                "vo2MaxCycling": 62.1,
-            },
-        }
+        return _SAMPLE_USER_PROFILE_DATA
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_activity_data(self) -> List[Dict[str, any]]:
         """
         Create sample activity data for testing.
@@ -201,40 +951,7 @@ class TestGarminProcessor:
         :return: Sample activity JSON data.
         """
 
-        return [
-            {
-                "activityId": 987654321,
-                "activityName": "Morning Run",
-                "activityType": {"typeId": 1, "typeKey": "running"},
-                "eventType": {"typeId": 9, "typeKey": "race"},
-                "startTimeGMT": "2022-01-01T06:00:00.000",
-                "startTimeLocal": "2022-01-01T07:00:00.000",
-                "endTimeGMT": "2022-01-01T07:00:00.000",
-                "deviceId": 123456,
-                "manufacturer": "Garmin",
-                "timeZoneId": 1,
-                "hasPolyline": True,
-                "hasImages": False,
-                "hasVideo": False,
-                "hasSplits": True,
-                "hasHeatMap": False,
-                "parent": False,
-                "purposeful": True,
-                "favorite": False,
-                "elevationCorrected": True,
-                "atpActivity": False,
-                "manualActivity": False,
-                "pr": True,
-                "autoCalcCalories": True,
-                "duration": 3600.0,
-                "distance": 10000.0,
-                "calories": 600.0,
-                "averageHR": 150,
-                "maxHR": 175,
-                "steps": 12000,
-                "vO2MaxValue": 55.5,
-            }
-        ]
+        return _SAMPLE_ACTIVITY_DATA
 
     def test_parse_filename_json_format(self, processor: GarminProcessor) -> None:
         """
@@ -292,13 +1009,14 @@ class TestGarminProcessor:
         """
 
         # Arrange.
-        mock_session.query.return_value.filter.return_value.first.return_value = None
+        mock_session.execute.return_value.first.return_value = (True, None)
 
         # Act.
         processor._ensure_user_exists("123456789", mock_session)
 
         # Assert.
         mock_session.execute.assert_called_once()
+        mock_session.query.assert_not_called()
         mock_session.flush.assert_called_once()
         assert processor.must_update_user is True
 
@@ -311,16 +1029,63 @@ class TestGarminProcessor:
         """
 
         # Arrange.
-        existing_user = User(user_id=123456789, full_name="Test User")
-        mock_session.query.return_value.filter.return_value.first.return_value = (
-            existing_user
-        )
+        mock_session.execute.return_value.first.return_value = (False, "Test User")
 
         # Act.
         processor._ensure_user_exists("123456789", mock_session)
 
         # Assert.
+        mock_session.execute.assert_called_once()
         mock_session.add.assert_not_called()
+        mock_session.flush.assert_not_called()
+        assert processor.must_update_user is False
+
+    def test_ensure_user_exists_existing_user_without_name(
+        self, processor, mock_session
+    ):
+        """
+        Test _ensure_user_exists with existing user missing profile data.
+
+        :param processor: GarminProcessor fixture.
+        :param mock_session: Mock session fixture.
+        """
+
+        # Arrange.
+        mock_session.execute.return_value.first.return_value = (False, None)
+
+        # Act.
+        processor._ensure_user_exists("123456789", mock_session)
+
+        # Assert.
+        mock_session.execute.assert_called_once()
+        mock_session.flush.assert_not_called()
+        assert processor.must_update_user is True
+
+    def test_ensure_user_exists_concurrent_insert(self, processor, mock_session):
+        """
+        Test _ensure_user_exists when a concurrent transaction inserts the same user,
+        so the combined insert and select returns no row.
+
+        :param processor: GarminProcessor fixture.
+        :param mock_session: Mock session fixture.
+        """
+
+        # Arrange.
+        upsert_result = MagicMock()
+        upsert_result.first.return_value = None
+        select_result = MagicMock()
+        select_result.scalar_one.return_value = None
+        mock_session.execute.side_effect = [upsert_result, select_result]
+
+        # Act.
+        processor._ensure_user_exists("123456789", mock_session)
+
+        # Assert.
+        assert mock_session.execute.call_count == 2
+        reread_params = mock_session.execute.call_args_list[1][0][1]
+        assert reread_params == {"user_id": 123456789}
+        mock_session.flush.assert_not_called()
+        assert processor.must_update_user is True
 
     def test_load_json_file(self, processor, temp_dir):
         """
@@ -333,8 +1098,7 @@ class TestGarminProcessor:
         # Arrange.
         test_data = {"test": "data"}
         test_file = temp_dir / "test.json"
-        with open(test_file, "w", encoding="utf-8") as f:
-            json.dump(test_data, f)
+        test_file.write_bytes(orjson.dumps(test_data))
 
         # Act.
         result = processor._load_json_file(test_file)
@@ -342,6 +1106,26 @@ class TestGarminProcessor:
         # Assert.
         assert result == test_data
 
+    def test_load_json_file_non_finite_floats(self, processor, temp_dir):
+        """
+        Test _load_json_file with NaN and Infinity values written by the standard json
+        module, which orjson rejects, and with a str path.
+
+        :param processor: GarminProcessor fixture.
+        :param temp_dir: Temporary directory fixture.
+        """
+
+        # Arrange.
+        test_file = temp_dir / "test_non_finite.json"
+        test_file.write_bytes(b'{"values": [NaN, Infinity, 1.5]}')
+
+        # Act.
+        result = processor._load_json_file(str(test_file))
+
+        # Assert.
+        assert math.isnan(result["values"][0])
+        assert result["values"][1:] == [math.inf, 1.5]
+
     def test_convert_field_name(self, processor):
         """
         Test _convert_field_name static method.
@@ -355,9 +1139,22 @@ class TestGarminProcessor:
         assert processor._convert_field_name("simpleword") == "simpleword"
         assert processor._convert_field_name("XMLParser") == "x_m_l_parser"
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
+    def test_epoch_ms_to_datetime(self):
+        """
+        Test _epoch_ms_to_datetime matches datetime.fromtimestamp for epoch ms.
+        """
+
+        # Act & Assert.
+        for epoch_ms in [0, 1640995200000, 1640997000123]:
+            assert _epoch_ms_to_datetime(epoch_ms) == datetime.fromtimestamp(
+                epoch_ms / 1000, tz=timezone.utc
+            )
+        assert _epoch_ms_to_datetime(1640995200000) == datetime(
+            2022, 1, 1, tzinfo=timezone.utc
+        )
+
     def test_process_sleep_file(
-        self, mock_upsert, processor, mock_session, temp_dir, sample_sleep_data
+        self, mock_upsert, processor, mock_session, sample_sleep_data
     ):
         """
         Test _process_sleep method.
@@ -365,7 +1162,6 @@ class TestGarminProcessor:
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         :param sample_sleep_data: Sample sleep data fixture.
         """
 
@@ -380,13 +1176,16 @@ class TestGarminProcessor:
         mock_upsert.side_effect = mock_upsert_side_effect
 
         # Arrange.
-        sleep_file = temp_dir / "123456789_SLEEP_2022-01-01T00-00-00Z.json"
-        with open(sleep_file, "w", encoding="utf-8") as f:
-            json.dump(sample_sleep_data, f)
+        sleep_file = Path("/fake/123456789_SLEEP_2022-01-01T00-00-00Z.json")
 
         # Act.
-        processor.user_id = 1
-        processor._process_sleep(sleep_file, mock_session)
+        with patch.object(
+            processor,
+            "_load_json_file",
+            return_value=_clone(sample_sleep_data),
+        ):
+            processor.user_id = 1
+            processor._process_sleep(sleep_file, mock_session)
 
         # Assert.
         # Verify upsert was called for sleep base record + timeseries data.
@@ -402,7 +1201,6 @@ class TestGarminProcessor:
         assert isinstance(first_call[1]["model_instances"][0], Sleep)
         assert first_call[1]["model_instances"][0].user_id == 1
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_sleep_base(self, mock_upsert, processor, mock_session):
         """
         Test _process_sleep_base method.
@@ -452,186 +1250,73 @@ class TestGarminProcessor:
         # Now the function should return the sleep_id from the persisted instance.
         assert result == 123456789
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
-    def test_process_sleep_movement(self, mock_upsert, processor, mock_session):
+    @pytest.mark.parametrize(
+        "method_name, data_key, model, records", _SLEEP_TIMESERIES_CASES
+    )
+    def test_process_sleep_timeseries(
+        self,
+        mock_upsert,
+        processor,
+        mock_session,
+        method_name: str,
+        data_key: str,
+        model: type,
+        records: List[Dict],
+    ):
         """
-        Test _process_sleep_movement method.
+        Test the sleep time series processing methods.
 
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
+        :param method_name: Name of the processing method under test.
+        :param data_key: Sleep JSON key holding the time series.
+        :param model: Expected SQLAlchemy model of the created records.
+        :param records: Time series records in Garmin JSON format.
         """
 
         # Arrange.
-        data = {
-            "sleepMovement": [
-                {"startGMT": "2022-01-01T00:30:00Z", "activityLevel": 0.1},
-                {"startGMT": "2022-01-01T01:00:00Z", "activityLevel": 0.2},
-            ]
-        }
+        data = {data_key: _clone(records)}
 
         # Act.
         processor.user_id = 123456789
-        processor._process_sleep_movement(data, 123456, mock_session)
+        getattr(processor, method_name)(data, 123456, mock_session)
 
         # Assert.
         mock_upsert.assert_called_once()
         _, kwargs = mock_upsert.call_args
         model_instances = kwargs["model_instances"]
-        assert len(model_instances) == 2
-        assert all(isinstance(m, SleepMovement) for m in model_instances)
+        assert len(model_instances) == len(records)
+        assert all(isinstance(m, model) for m in model_instances)
         assert kwargs["conflict_columns"] == ["sleep_id", "timestamp"]
         assert kwargs["on_conflict_update"] is False
+        assert kwargs["returning"] is False
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
-    def test_process_sleep_restless_moments(self, mock_upsert, processor, mock_session):
+    def test_process_user_profile(
+        self, processor, mock_session, sample_user_profile_data
+    ):
         """
-        Test _process_sleep_restless_moments method.
+        Test _process_user_profile method.
 
-        :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
+        :param sample_user_profile_data: Sample user profile data fixture.
         """
 
         # Arrange.
-        data = {
-            "sleepRestlessMoments": [
-                {"startGMT": 1640997000000, "value": 1},
-                {"startGMT": 1641001200000, "value": 2},
-            ]
-        }
+        profile_file = Path("/fake/123456789_USER_PROFILE_2022-01-01T00-00-00Z.json")
+
+        # Mock existing user check.
+        mock_session.query.return_value.filter.return_value.first.return_value = None
 
         # Act.
-        processor.user_id = 123456789
-        processor._process_sleep_restless_moments(data, 123456, mock_session)
-
-        # Assert.
-        mock_upsert.assert_called_once()
-        _, kwargs = mock_upsert.call_args
-        model_instances = kwargs["model_instances"]
-        assert len(model_instances) == 2
-        assert all(isinstance(m, SleepRestlessMoment) for m in model_instances)
-        assert kwargs["conflict_columns"] == ["sleep_id", "timestamp"]
-        assert kwargs["on_conflict_update"] is False
-
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
-    def test_process_sleep_spo2_data(self, mock_upsert, processor, mock_session):
-        """
-        Test _process_sleep_spo2_data method.
-
-        :param mock_upsert: Mock upsert function.
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        """
-
-        # Arrange.
-        data = {
-            "wellnessEpochSPO2DataDTOList": [
-                {"epochTimestamp": "2022-01-01T00:00:00Z", "spo2Reading": 97},
-                {"epochTimestamp": "2022-01-01T01:00:00Z", "spo2Reading": 96},
-            ]
-        }
-
-        # Act.
-        processor.user_id = 123456789
-        processor._process_sleep_spo2_data(data, 123456, mock_session)
-
-        # Assert.
-        mock_upsert.assert_called_once()
-        _, kwargs = mock_upsert.call_args
-        model_instances = kwargs["model_instances"]
-        assert len(model_instances) == 2
-        assert all(isinstance(m, SpO2) for m in model_instances)
-        assert kwargs["conflict_columns"] == ["sleep_id", "timestamp"]
-        assert kwargs["on_conflict_update"] is False
-
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
-    def test_process_sleep_hrv_data(self, mock_upsert, processor, mock_session):
-        """
-        Test _process_sleep_hrv_data method.
-
-        :param mock_upsert: Mock upsert function.
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        """
-
-        # Arrange.
-        data = {
-            "hrvData": [
-                {"startGMT": 1640995800000, "value": 42.5},
-                {"startGMT": 1640999400000, "value": 45.2},
-            ]
-        }
-
-        # Act.
-        processor.user_id = 123456789
-        processor._process_sleep_hrv_data(data, 123456, mock_session)
-
-        # Assert.
-        mock_upsert.assert_called_once()
-        _, kwargs = mock_upsert.call_args
-        model_instances = kwargs["model_instances"]
-        assert len(model_instances) == 2
-        assert all(isinstance(m, HRV) for m in model_instances)
-        assert kwargs["conflict_columns"] == ["sleep_id", "timestamp"]
-        assert kwargs["on_conflict_update"] is False
-
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
-    def test_process_sleep_breathing_disruption(
-        self, mock_upsert, processor, mock_session
-    ):
-        """
-        Test _process_sleep_breathing_disruption method.
-
-        :param mock_upsert: Mock upsert function.
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        """
-
-        # Arrange.
-        data = {
-            "breathingDisruptionData": [
-                {"startGMT": 1641000000000, "value": 1},
-                {"startGMT": 1641003600000, "value": 2},
-            ]
-        }
-
-        # Act.
-        processor.user_id = 123456789
-        processor._process_sleep_breathing_disruption(data, 123456, mock_session)
-
-        # Assert.
-        mock_upsert.assert_called_once()
-        _, kwargs = mock_upsert.call_args
-        model_instances = kwargs["model_instances"]
-        assert len(model_instances) == 2
-        assert all(isinstance(m, BreathingDisruption) for m in model_instances)
-        assert kwargs["conflict_columns"] == ["sleep_id", "timestamp"]
-        assert kwargs["on_conflict_update"] is False
-
-    def test_process_user_profile(
-        self, processor, mock_session, temp_dir, sample_user_profile_data
-    ):
-        """
-        Test _process_user_profile method.
-
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
-        :param sample_user_profile_data: Sample user profile data fixture.
-        """
-
-        # Arrange.
-        profile_file = temp_dir / "123456789_USER_PROFILE_2022-01-01T00-00-00Z.json"
-        with open(profile_file, "w", encoding="utf-8") as f:
-            json.dump(sample_user_profile_data, f)
-
-        # Mock existing user check.
-        mock_session.query.return_value.filter.return_value.first.return_value = None
-
-        # Act.
-        processor.user_id = 123456789
-        processor._process_user_profile(profile_file, mock_session)
+        with patch.object(
+            processor,
+            "_load_json_file",
+            return_value=_clone(sample_user_profile_data),
+        ):
+            processor.user_id = 123456789
+            processor._process_user_profile(profile_file, mock_session)
 
         # Assert.
         mock_session.add.assert_called_once()
@@ -641,29 +1326,30 @@ class TestGarminProcessor:
         assert added_user.gender == "male"
         assert added_user.weight == 70.5
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_activities_list(
-        self, mock_upsert, processor, mock_session, temp_dir, sample_activity_data
+        self, mock_upsert, processor, mock_session, sample_activity_data
     ):
         """
         Test _process_activities method.
 
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         :param sample_activity_data: Sample activity data fixture.
         """
 
         # Arrange.
-        activities_file = (
-            temp_dir / "123456789_ACTIVITIES_LIST_2022-01-01T00-00-00Z.json"
+        activities_file = Path(
+            "/fake/123456789_ACTIVITIES_LIST_2022-01-01T00-00-00Z.json"
         )
-        with open(activities_file, "w", encoding="utf-8") as f:
-            json.dump(sample_activity_data, f)
 
         # Act.
-        processor.user_id = 1
-        processor._process_activities(activities_file, mock_session)
+        with patch.object(
+            processor,
+            "_load_json_file",
+            return_value=_clone(sample_activity_data),
+        ):
+            processor.user_id = 1
+            processor._process_activities(activities_file, mock_session)
 
         # Assert.
         # Verify upsert was called (activity base + supplemental metrics).
@@ -678,65 +1364,50 @@ class TestGarminProcessor:
         assert first_call[1]["model_instances"][0].activity_id == 987654321
         assert first_call[1]["model_instances"][0].activity_name == "Morning Run"
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
-    def test_process_activity_base(self, mock_upsert, processor, mock_session):
+    @pytest.mark.parametrize("activity_data, expected", _ACTIVITY_BASE_CASES)
+    def test_process_activity_base(
+        self,
+        mock_upsert,
+        processor,
+        stub_session,
+        activity_data: Dict[str, Any],
+        expected: Dict[str, Any],
+    ):
         """
-        Test _process_activity_base method.
+        Test _process_activity_base method, including historical activity data with
+        missing fields, which must be processed with NULL values.
 
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
+        :param stub_session: Stub session fixture.
+        :param activity_data: Activity data from JSON.
+        :param expected: Expected attribute values of the created Activity record.
         """
 
         # Arrange.
-        activity_data = {
-            "activityId": 987654321,
-            "activityName": "Morning Run",
-            "activityType": {"typeId": 1, "typeKey": "running"},
-            "eventType": {"typeId": 1, "typeKey": "other"},
-            "startTimeGMT": "2022-01-01T07:00:00",
-            "startTimeLocal": "2022-01-01T00:00:00",
-            "endTimeGMT": "2022-01-01T08:30:00",
-            "deviceId": 123456789,
-            "manufacturer": "GARMIN",
-            "timeZoneId": 1,
-            "parent": False,
-            "purposeful": True,
-            "favorite": False,
-            "pr": False,
-            "hasPolyline": True,
-            "hasImages": False,
-            "hasVideo": False,
-            "hasSplits": True,
-            "hasHeatMap": False,
-            "elevationCorrected": True,
-            "atpActivity": False,
-            "manualActivity": False,
-            "autoCalcCalories": True,
-        }
-
         # Mock the return value with an Activity instance containing activity_id.
-        mock_activity_with_id = Activity()
-        mock_activity_with_id.activity_id = 987654321
-        mock_upsert.return_value = [mock_activity_with_id]
+        mock_upsert.return_value = [_activity_with_id(activity_data["activityId"])]
 
         # Act.
         processor.user_id = 1
-        result = processor._process_activity_base(activity_data, mock_session)
+        result = processor._process_activity_base(_clone(activity_data), stub_session)
 
         # Assert.
         mock_upsert.assert_called_once()
         call_args = mock_upsert.call_args
-        assert call_args[1]["session"] == mock_session
+        assert call_args[1]["session"] is stub_session
         assert call_args[1]["conflict_columns"] == ["activity_id"]
         assert call_args[1]["on_conflict_update"] is True
-        assert len(call_args[1]["model_instances"]) == 1
-        assert isinstance(call_args[1]["model_instances"][0], Activity)
-        assert result == 987654321  # Should return activity_id.
+        model_instances = call_args[1]["model_instances"]
+        assert len(model_instances) == 1
+        activity_instance = model_instances[0]
+        assert isinstance(activity_instance, Activity)
+        for attr, value in expected.items():
+            assert getattr(activity_instance, attr) == value, attr
+        assert result == activity_data["activityId"]  # Should return activity_id.
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_activity_base_preserves_ts_data_available_flag(
-        self, mock_upsert, processor, mock_session
+        self, mock_upsert, processor, stub_session
     ):
         """
         Test that _process_activity_base excludes ts_data_available from updates.
@@ -746,7 +1417,7 @@ class TestGarminProcessor:
 
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
+        :param stub_session: Stub session fixture.
         """
 
         # Arrange.
@@ -776,13 +1447,11 @@ class TestGarminProcessor:
             "autoCalcCalories": True,
         }
 
-        mock_activity_with_id = Activity()
-        mock_activity_with_id.activity_id = 987654321
-        mock_upsert.return_value = [mock_activity_with_id]
+        mock_upsert.return_value = [_activity_with_id(987654321)]
 
         # Act.
         processor.user_id = 1
-        processor._process_activity_base(activity_data, mock_session)
+        processor._process_activity_base(activity_data, stub_session)
 
         # Assert.
         mock_upsert.assert_called_once()
@@ -798,9 +1467,8 @@ class TestGarminProcessor:
         assert "activity_name" in update_columns
         assert "device_id" in update_columns
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_activity_base_handles_missing_end_time_gmt(
-        self, mock_upsert, processor, mock_session
+        self, mock_upsert, processor, stub_session
     ):
         """
         Test that _process_activity_base handles missing endTimeGMT by calculating from
@@ -809,7 +1477,7 @@ class TestGarminProcessor:
 
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
+        :param stub_session: Stub session fixture.
         """
         # Arrange - Historical activity data without endTimeGMT but with duration.
         activity_data = {
@@ -840,13 +1508,11 @@ class TestGarminProcessor:
         }
 
         # Mock the return value with an Activity instance containing activity_id.
-        mock_activity_with_id = Activity()
-        mock_activity_with_id.activity_id = 123456789
-        mock_upsert.return_value = [mock_activity_with_id]
+        mock_upsert.return_value = [_activity_with_id(123456789)]
 
         # Act.
         processor.user_id = 1
-        result = processor._process_activity_base(activity_data, mock_session)
+        result = processor._process_activity_base(activity_data, stub_session)
 
         # Assert.
         mock_upsert.assert_called_once()
@@ -881,234 +1547,8 @@ class TestGarminProcessor:
         # Verify the activity_id is correct.
         assert activity_instance.activity_id == 123456789
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
-    def test_process_activity_base_handles_missing_device_fields(
-        self, mock_upsert, processor, mock_session
-    ):
-        """
-        Test that _process_activity_base handles missing device-related fields. This
-        ensures that historical activity data files without deviceId, manufacturer, and
-        timeZoneId fields are processed correctly with NULL values.
-
-        :param mock_upsert: Mock upsert function.
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        """
-        # Arrange - Historical activity data without device fields.
-        activity_data = {
-            "activityId": 987654321,
-            "activityName": "Very Old Run",
-            "activityType": {"typeId": 1, "typeKey": "running"},
-            "eventType": {"typeId": 1, "typeKey": "other"},
-            "startTimeGMT": "2015-01-01T07:00:00",
-            "startTimeLocal": "2015-01-01T00:00:00",
-            "endTimeGMT": "2015-01-01T08:00:00",
-            # Note: deviceId, manufacturer, and timeZoneId are missing.
-            "parent": False,
-            "purposeful": True,
-            "favorite": False,
-            "pr": False,
-            "hasPolyline": True,
-            "hasImages": False,
-            "hasVideo": False,
-            "hasSplits": True,
-            "hasHeatMap": False,
-            "elevationCorrected": True,
-            "atpActivity": False,
-            "manualActivity": False,
-            "autoCalcCalories": True,
-        }
-
-        # Mock the return value with an Activity instance containing activity_id.
-        mock_activity_with_id = Activity()
-        mock_activity_with_id.activity_id = 987654321
-        mock_upsert.return_value = [mock_activity_with_id]
-
-        # Act.
-        processor.user_id = 1
-        result = processor._process_activity_base(activity_data, mock_session)
-
-        # Assert.
-        mock_upsert.assert_called_once()
-        call_args = mock_upsert.call_args
-
-        # Verify the Activity object was created with NULL device fields.
-        model_instances = call_args[1]["model_instances"]
-        assert len(model_instances) == 1
-        activity_instance = model_instances[0]
-
-        # Verify device fields are None.
-        assert activity_instance.device_id is None
-        assert activity_instance.manufacturer is None
-        assert activity_instance.time_zone_id is None
-
-        # Verify other fields are still processed correctly.
-        assert activity_instance.activity_id == 987654321
-        assert activity_instance.activity_name == "Very Old Run"
-
-        # Verify start and end timestamps are correct.
-        start_ts = activity_instance.start_ts
-        end_ts = activity_instance.end_ts
-
-        assert start_ts.year == 2015
-        assert start_ts.month == 1
-        assert start_ts.day == 1
-        assert start_ts.hour == 7
-        assert start_ts.minute == 0
-
-        assert end_ts.year == 2015
-        assert end_ts.month == 1
-        assert end_ts.day == 1
-        assert end_ts.hour == 8
-        assert end_ts.minute == 0
-
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
-    def test_process_activity_base_handles_missing_boolean_fields(
-        self, mock_upsert, processor, mock_session
-    ):
-        """
-        Test that _process_activity_base handles missing boolean fields from 2016 data.
-        This ensures that historical activity data files without hasSplits,
-        elevationCorrected, and atpActivity fields are processed correctly with NULL
-        values.
-
-        :param mock_upsert: Mock upsert function.
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        """
-        # Arrange - 2016 activity data without hasSplits, elevationCorrected, atpActivity.
-        activity_data = {
-            "activityId": 1021028774,
-            "activityName": "New York City Running",
-            "activityType": {"typeId": 1, "typeKey": "running"},
-            "eventType": {"typeId": 9, "typeKey": "uncategorized"},
-            "startTimeGMT": "2016-01-16 17:32:31",
-            "startTimeLocal": "2016-01-16 12:32:31",
-            "duration": 2077.619,
-            "distance": 7360.03,
-            "timeZoneId": 149,
-            "parent": False,
-            "purposeful": False,
-            "favorite": False,
-            "pr": False,
-            "hasPolyline": True,
-            "hasImages": False,
-            "hasVideo": False,
-            "hasHeatMap": False,
-            "manualActivity": False,
-            "autoCalcCalories": False,
-            # Note: hasSplits, elevationCorrected, atpActivity are missing.
-        }
-
-        # Mock the return value with an Activity instance containing activity_id.
-        mock_activity_with_id = Activity()
-        mock_activity_with_id.activity_id = 1021028774
-        mock_upsert.return_value = [mock_activity_with_id]
-
-        # Act.
-        processor.user_id = 1
-        result = processor._process_activity_base(activity_data, mock_session)
-
-        # Assert.
-        mock_upsert.assert_called_once()
-        call_args = mock_upsert.call_args
-
-        # Verify the Activity object was created with NULL boolean fields.
-        model_instances = call_args[1]["model_instances"]
-        assert len(model_instances) == 1
-        activity_instance = model_instances[0]
-
-        # Verify missing boolean fields are None.
-        assert activity_instance.has_splits is None
-        assert activity_instance.elevation_corrected is None
-        assert activity_instance.atp_activity is None
-
-        # Verify present boolean fields are processed correctly.
-        assert activity_instance.has_polyline is True
-        assert activity_instance.has_images is False
-        assert activity_instance.has_video is False
-        assert activity_instance.has_heat_map is False
-        assert activity_instance.parent is False
-        assert activity_instance.purposeful is False
-        assert activity_instance.favorite is False
-        assert activity_instance.pr is False
-        assert activity_instance.manual_activity is False
-        assert activity_instance.auto_calc_calories is False
-
-        # Verify other fields are still processed correctly.
-        assert activity_instance.activity_id == 1021028774
-        assert activity_instance.activity_name == "New York City Running"
-        assert activity_instance.duration == 2077.619
-        assert activity_instance.distance == 7360.03
-
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
-    def test_process_activity_base_handles_missing_activity_name(
-        self, mock_upsert, processor, mock_session
-    ):
-        """
-        Test that _process_activity_base handles missing activityName field. This
-        ensures that very old activity data files without activityName are processed
-        correctly with NULL value.
-
-        :param mock_upsert: Mock upsert function.
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        """
-        # Arrange - Very old activity data without activityName.
-        activity_data = {
-            "activityId": 999999999,
-            # Note: activityName is missing - this is the key test condition.
-            "activityType": {"typeId": 1, "typeKey": "running"},
-            "eventType": {"typeId": 9, "typeKey": "uncategorized"},
-            "startTimeGMT": "2014-01-01T10:00:00",
-            "startTimeLocal": "2014-01-01T05:00:00",
-            "endTimeGMT": "2014-01-01T11:00:00",
-            "duration": 3600,
-            "parent": False,
-            "purposeful": False,
-            "favorite": False,
-            "pr": False,
-            "hasPolyline": True,
-            "hasImages": False,
-            "hasVideo": False,
-            "hasHeatMap": False,
-            "manualActivity": False,
-            "autoCalcCalories": False,
-        }
-
-        # Mock the return value with an Activity instance containing activity_id.
-        mock_activity_with_id = Activity()
-        mock_activity_with_id.activity_id = 999999999
-        mock_upsert.return_value = [mock_activity_with_id]
-
-        # Act.
-        processor.user_id = 1
-        result = processor._process_activity_base(activity_data, mock_session)
-
-        # Assert.
-        mock_upsert.assert_called_once()
-        call_args = mock_upsert.call_args
-
-        # Verify the Activity object was created with NULL activity_name.
-        model_instances = call_args[1]["model_instances"]
-        assert len(model_instances) == 1
-        activity_instance = model_instances[0]
-
-        # Verify activity_name is None.
-        assert activity_instance.activity_name is None
-
-        # Verify other fields are still processed correctly.
-        assert activity_instance.activity_id == 999999999
-        assert activity_instance.duration == 3600
-
-        # Verify boolean fields are processed correctly.
-        assert activity_instance.parent is False
-        assert activity_instance.purposeful is False
-        assert activity_instance.favorite is False
-        assert activity_instance.pr is False
-
     def test_process_file_set(
-        self, processor, mock_session, temp_dir, sample_sleep_data
+        self, processor, mock_session, temp_dir, patched_ensure_user
     ):
         """
         Test process_file_set method.
@@ -1116,102 +1556,55 @@ class TestGarminProcessor:
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
         :param temp_dir: Temporary directory fixture.
-        :param sample_sleep_data: Sample sleep data fixture.
+        :param patched_ensure_user: Patched _ensure_user_exists mock.
         """
 
         # Arrange.
         sleep_file = temp_dir / "123456789_SLEEP_2022-01-01T00-00-00Z.json"
-        with open(sleep_file, "w", encoding="utf-8") as f:
-            json.dump(sample_sleep_data, f)
+        sleep_file.write_bytes(_SAMPLE_SLEEP_BYTES)
 
         # Create FileSet with files dict - using enum object as key.
         file_set = FileSet(files={GARMIN_FILE_TYPES.SLEEP: [sleep_file]})
 
-        # Mock user existence check.
-        mock_session.query.return_value.filter.return_value.first.return_value = None
-
         # Act.
-        with patch.object(
-            processor, "_process_sleep"
-        ) as mock_process_sleep, patch.object(
-            processor, "_ensure_user_exists", return_value=1
-        ) as mock_ensure_user:
-            processor.process_file_set(file_set, mock_session)
-
-        # Assert.
-        mock_process_sleep.assert_called_once_with(sleep_file, mock_session)
-        mock_ensure_user.assert_called_once_with("123456789", mock_session)
-
-    # Steps Processing Tests.
-    @pytest.fixture
-    def sample_steps_data(self) -> List[Dict]:
-        """
-        Create sample steps data based on provided JSON structure.
-
-        :return: Sample steps data list.
-        """
-
-        return [
-            {
-                "startGMT": "2025-08-07T07:00:00.0",
-                "endGMT": "2025-08-07T07:15:00.0",
-                "steps": 0,
-                "pushes": 0,
-                "primaryActivityLevel": "sleeping",
-                "activityLevelConstant": True,
-            },
-            {
-                "startGMT": "2025-08-07T07:15:00.0",
-                "endGMT": "2025-08-07T07:30:00.0",
-                "steps": 27,
-                "pushes": 0,
-                "primaryActivityLevel": "sleeping",
-                "activityLevelConstant": True,
-            },
-            {
-                "startGMT": "2025-08-07T14:15:00.0",
-                "endGMT": "2025-08-07T14:30:00.0",
-                "steps": 2206,
-                "pushes": 0,
-                "primaryActivityLevel": "highlyActive",
-                "activityLevelConstant": True,
-            },
-            {
-                "startGMT": "2025-08-07T15:00:00.0",
-                "endGMT": "2025-08-07T15:15:00.0",
-                "steps": 1307,
-                "pushes": 0,
-                "primaryActivityLevel": "active",
-                "activityLevelConstant": False,
-            },
-        ]
+        with patch.object(processor, "_process_sleep") as mock_process_sleep:
+            processor.process_file_set(file_set, mock_session)
+
+        # Assert.
+        mock_process_sleep.assert_called_once_with(sleep_file, mock_session)
+        patched_ensure_user.assert_called_once_with("123456789", mock_session)
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
-    def test_process_steps_file(
-        self, mock_upsert, processor, mock_session, temp_dir, sample_steps_data
+    # Steps Processing Tests.
+    @pytest.mark.parametrize("payload, expected_len", _STEPS_CASES)
+    def test_process_steps(
+        self, mock_upsert, processor, mock_session, payload, expected_len
     ):
         """
-        Test _process_steps with complete data.
+        Test _process_steps with complete, empty and partially invalid data (None
+        endGMT, None steps).
 
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
-        :param sample_steps_data: Sample steps data fixture.
+        :param payload: Steps JSON payload.
+        :param expected_len: Number of records expected to be upserted, or None if
+            the upsert should not be called.
         """
 
         # Arrange.
-        steps_file = temp_dir / "15007510_STEPS_2025-08-07T12:00:00Z.json"
-        with open(steps_file, "w", encoding="utf-8") as f:
-            json.dump(sample_steps_data, f)
+        steps_file = Path("/fake/15007510_STEPS_2025-08-07T12:00:00Z.json")
         # Act.
-        processor.user_id = 1
-        processor._process_steps(steps_file, mock_session)
+        with patch.object(processor, "_load_json_file", return_value=_clone(payload)):
+            processor.user_id = 1
+            processor._process_steps(steps_file, mock_session)
         # Assert.
+        if expected_len is None:
+            mock_upsert.assert_not_called()  # No records should be processed
+            return
         mock_upsert.assert_called_once()
         _, kwargs = mock_upsert.call_args
         model_instances = kwargs["model_instances"]
-        assert len(model_instances) == 4  # 4 step measurements
+        assert len(model_instances) == expected_len  # Only valid records processed
         assert all(isinstance(m, Steps) for m in model_instances)
         assert kwargs["conflict_columns"] == ["user_id", "timestamp"]
         assert kwargs["on_conflict_update"] is False
@@ -1227,105 +1620,31 @@ class TestGarminProcessor:
         assert active_record.activity_level == "highlyActive"
         assert active_record.activity_level_constant is True
 
-    def test_process_steps_missing_data(self, processor, mock_session, temp_dir):
-        """
-        Test _process_steps with empty data array.
-
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
-        """
-
-        # Arrange.
-        empty_data = []
-        steps_file = temp_dir / "15007510_STEPS_2025-08-07T12:00:00Z.json"
-        with open(steps_file, "w", encoding="utf-8") as f:
-            json.dump(empty_data, f)
-        # Act.
-        with patch(
-            "dags.pipelines.garmin.process.upsert_model_instances"
-        ) as mock_upsert:
-            processor.user_id = 1
-            processor._process_steps(steps_file, mock_session)
-        # Assert.
-        mock_upsert.assert_not_called()  # No records should be processed
-
-    def test_process_steps_invalid_values(
-        self, processor, mock_session, temp_dir, sample_steps_data
+    @pytest.mark.parametrize("file_type, method_name", _FILE_ROUTING_CASES)
+    def test_process_file_routing(
+        self, processor, mock_session, patched_ensure_user, file_type, method_name
     ):
         """
-        Test _process_steps filters out invalid values (None endGMT, None steps).
-
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
-        :param sample_steps_data: Sample steps data fixture.
-        """
-
-        # Arrange - add invalid values to the data.
-        modified_data = copy.deepcopy(sample_steps_data)
-        modified_data.extend(
-            [
-                {
-                    "startGMT": "2025-08-07T16:00:00.0",
-                    "endGMT": None,  # Invalid endGMT
-                    "steps": 100,
-                    "primaryActivityLevel": "active",
-                    "activityLevelConstant": False,
-                },
-                {
-                    "startGMT": "2025-08-07T16:15:00.0",
-                    "endGMT": "2025-08-07T16:30:00.0",
-                    "steps": None,  # Invalid steps
-                    "primaryActivityLevel": "sedentary",
-                    "activityLevelConstant": True,
-                },
-            ]
-        )
-        steps_file = temp_dir / "15007510_STEPS_2025-08-07T12:00:00Z.json"
-        with open(steps_file, "w", encoding="utf-8") as f:
-            json.dump(modified_data, f)
-        # Act.
-        with patch(
-            "dags.pipelines.garmin.process.upsert_model_instances"
-        ) as mock_upsert:
-            processor.user_id = 1
-            processor._process_steps(steps_file, mock_session)
-        # Assert.
-        mock_upsert.assert_called_once()
-        _, kwargs = mock_upsert.call_args
-        model_instances = kwargs["model_instances"]
-        assert len(model_instances) == 4  # Only valid records processed
-
-    def test_process_steps_file_routing(self, processor, mock_session, temp_dir):
-        """
-        Test that STEPS files are properly routed to processing method.
+        Test that each file type is routed to its processing method.
 
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
+        :param patched_ensure_user: Patched _ensure_user_exists mock.
+        :param file_type: Garmin file type of the file set.
+        :param method_name: Name of the processing method expected to be called.
         """
 
         # Arrange.
-        steps_file = temp_dir / "123456789_STEPS_2022-01-01T00:00:00Z.json"
-        steps_file.write_text(
-            '[{"endGMT": "2022-01-01T00:15:00.0", "steps": 50, '
-            '"primaryActivityLevel": "active", "activityLevelConstant": false}]'
-        )
-        # Create FileSet with STEPS files.
-        file_set = FileSet(files={GARMIN_FILE_TYPES.STEPS: [steps_file]})
-        # Mock user existence check.
-        mock_session.query.return_value.filter.return_value.first.return_value = None
+        file_path = Path(f"/fake/123456789_{file_type.name}_2022-01-01T00-00-00Z.json")
+        file_set = FileSet(files={file_type: [file_path]})
+
         # Act.
-        with patch.object(
-            processor, "_process_steps"
-        ) as mock_process_steps, patch.object(
-            processor, "_ensure_user_exists", return_value=1
-        ) as mock_ensure_user:
+        with patch.object(processor, method_name) as mock_process:
             processor.process_file_set(file_set, mock_session)
+
         # Assert.
-        mock_process_steps.assert_called_once_with(steps_file, mock_session)
-        mock_ensure_user.assert_called_once_with("123456789", mock_session)
+        mock_process.assert_called_once_with(file_path, mock_session)
+        patched_ensure_user.assert_called_once_with("123456789", mock_session)
 
     def test_process_sleep_file_missing_data(self, processor, mock_session, temp_dir):
         """
@@ -1339,8 +1658,7 @@ class TestGarminProcessor:
         # Arrange.
         invalid_data = {"otherData": "value"}
         sleep_file = temp_dir / "123456789_SLEEP_2022-01-01T00-00-00Z.json"
-        with open(sleep_file, "w", encoding="utf-8") as f:
-            json.dump(invalid_data, f)
+        sleep_file.write_bytes(orjson.dumps(invalid_data))
 
         # Act.
         # Should complete without error but not process any data.
@@ -1350,7 +1668,7 @@ class TestGarminProcessor:
         # Assert - no data should be processed, but no error should occur.
 
     # Training Status Processing Tests.
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_training_status_data(self) -> Dict:
         """
         Create sample training status data based on provided JSON structure.
@@ -1452,13 +1770,11 @@ class TestGarminProcessor:
             },
         }
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_training_status_file(
         self,
         mock_upsert,
         processor,
         mock_session,
-        temp_dir,
         sample_training_status_data,
     ):
         """
@@ -1467,30 +1783,32 @@ class TestGarminProcessor:
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         :param sample_training_status_data: Sample training status data fixture.
         """
 
         # Arrange.
-        training_status_file = (
-            temp_dir / "15007510_TRAINING_STATUS_2025-08-15T12-00-00Z.json"
+        training_status_file = Path(
+            "/fake/15007510_TRAINING_STATUS_2025-08-15T12-00-00Z.json"
         )
-        with open(training_status_file, "w", encoding="utf-8") as f:
-            json.dump(sample_training_status_data, f)
 
         # Act.
-        processor.user_id = 1
-        processor._process_training_status(training_status_file, mock_session)
+        with patch.object(
+            processor,
+            "_load_json_file",
+            return_value=_clone(sample_training_status_data),
+        ):
+            processor.user_id = 1
+            processor._process_training_status(training_status_file, mock_session)
 
         # Assert.
         # VO2Max, Acclimation, and TrainingLoad records are now processed via separate
         # upsert_model_instances calls.
         assert (
-            mock_upsert.call_count == 5
-        )  # VO2 max (2 calls) + Acclimation (1 call) + TrainingLoad records (2 calls).
+            mock_upsert.call_count == 4
+        )  # VO2 max (2 calls) + Acclimation (1 call) + TrainingLoad record (1 call).
         assert mock_session.merge.call_count == 0  # No more session.merge calls.
 
-        # Check upsert calls - first two should be VO2Max, last two should be
+        # Check upsert calls - first two should be VO2Max, last one should be
         # TrainingLoad.
         upsert_calls = mock_upsert.call_args_list
 
@@ -1514,24 +1832,13 @@ class TestGarminProcessor:
         assert len(acclimation_instances) == 1  # Acclimation record only.
         assert isinstance(acclimation_instances[0], Acclimation)
 
-        # Fourth upsert call should be TrainingLoad balance record.
-        balance_call = upsert_calls[3]
-        balance_instances = balance_call[1]["model_instances"]
-        assert len(balance_instances) == 1  # Balance record only.
-        assert isinstance(balance_instances[0], TrainingLoad)
-
-        # Fifth upsert call should be TrainingLoad status record (merged with
-        # balance due to same date).
-        status_call = upsert_calls[4]
-        status_instances = status_call[1]["model_instances"]
-        assert len(status_instances) == 1  # Status record (merged with balance).
-        assert isinstance(status_instances[0], TrainingLoad)
-
-        # No more session.merge calls since all processing now uses
-        # upsert_model_instances
-        assert mock_session.merge.call_count == 0
+        # Fourth upsert call should be TrainingLoad balance record, merged with the
+        # status data due to same date.
+        training_load_call = upsert_calls[3]
+        training_load_instances = training_load_call[1]["model_instances"]
+        assert len(training_load_instances) == 1  # Merged record only.
+        assert isinstance(training_load_instances[0], TrainingLoad)
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_vo2_max_and_acclimation_data(
         self, mock_upsert, processor, mock_session, sample_training_status_data
     ):
@@ -1548,7 +1855,7 @@ class TestGarminProcessor:
         # Act.
         processor.user_id = 1
         processor._process_vo2_max_and_acclimation(
-            sample_training_status_data, mock_session
+            _clone(sample_training_status_data), mock_session
         )
 
         # Assert.
@@ -1560,124 +1867,124 @@ class TestGarminProcessor:
         assert mock_session.merge.call_count == 0  # No more session.merge calls.
 
         # Check VO2 max records from upsert calls.
-        upsert_calls = mock_upsert.call_args_list
+        generic_call, cycling_call, acclimation_call = mock_upsert.call_args_list
 
         # First call should be generic VO2Max.
-        generic_call = upsert_calls[0]
-        generic_instances = generic_call[1]["model_instances"]
-        assert len(generic_instances) == 1
-        assert generic_call[1]["conflict_columns"] == ["user_id", "date"]
-        assert generic_call[1]["update_columns"] == ["vo2_max_generic"]
-        assert generic_call[1]["on_conflict_update"] is True
-
-        generic_record = generic_instances[0]
-        assert generic_record.user_id == 1
-        assert generic_record.date == "2025-08-09"
-        assert generic_record.vo2_max_generic == 58.9
+        generic_kwargs = generic_call.kwargs
+        (generic_record,) = generic_kwargs["model_instances"]
+        assert generic_kwargs["conflict_columns"] == ["user_id", "date"]
+        assert generic_kwargs["update_columns"] == ["vo2_max_generic"]
+        assert generic_kwargs["on_conflict_update"] is True
+
+        expected = {"user_id": 1, "date": "2025-08-09", "vo2_max_generic": 58.9}
+        assert {attr: getattr(generic_record, attr) for attr in expected} == expected
 
         # Second call should be cycling VO2Max.
-        cycling_call = upsert_calls[1]
-        cycling_instances = cycling_call[1]["model_instances"]
-        assert len(cycling_instances) == 1
-        assert cycling_call[1]["conflict_columns"] == ["user_id", "date"]
-        assert cycling_call[1]["update_columns"] == ["vo2_max_cycling"]
-        assert cycling_call[1]["on_conflict_update"] is True
-
-        cycling_record = cycling_instances[0]
-        assert cycling_record.user_id == 1
-        assert cycling_record.date == "2025-08-15"
-        assert cycling_record.vo2_max_cycling == 58.5
+        cycling_kwargs = cycling_call.kwargs
+        (cycling_record,) = cycling_kwargs["model_instances"]
+        assert cycling_kwargs["conflict_columns"] == ["user_id", "date"]
+        assert cycling_kwargs["update_columns"] == ["vo2_max_cycling"]
+        assert cycling_kwargs["on_conflict_update"] is True
+
+        expected = {"user_id": 1, "date": "2025-08-15", "vo2_max_cycling": 58.5}
+        assert {attr: getattr(cycling_record, attr) for attr in expected} == expected
 
         # Third call should be Acclimation.
-        acclimation_call = upsert_calls[2]
-        acclimation_instances = acclimation_call[1]["model_instances"]
-        assert len(acclimation_instances) == 1
-        assert acclimation_call[1]["conflict_columns"] == ["user_id", "date"]
-        assert acclimation_call[1]["on_conflict_update"] is True
-
-        acclimation_record = acclimation_instances[0]
-        assert acclimation_record.user_id == 1
-        assert acclimation_record.date == "2025-08-15"
-        assert acclimation_record.heat_acclimation_percentage == 23
-        assert acclimation_record.heat_trend == "DEACCLIMATIZING"
-        assert acclimation_record.altitude_acclimation == 0
-        assert acclimation_record.current_altitude == 8
-        assert acclimation_record.acclimation_percentage == 0
-        assert acclimation_record.altitude_trend is None
-
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
-    def test_process_training_load_data(
+        acclimation_kwargs = acclimation_call.kwargs
+        (acclimation_record,) = acclimation_kwargs["model_instances"]
+        assert acclimation_kwargs["conflict_columns"] == ["user_id", "date"]
+        assert acclimation_kwargs["on_conflict_update"] is True
+
+        assert {
+            attr: getattr(acclimation_record, attr) for attr in _EXPECTED_ACCLIMATION
+        } == _EXPECTED_ACCLIMATION
+
+    def test_process_vo2_max_same_date(
         self, mock_upsert, processor, mock_session, sample_training_status_data
     ):
         """
-        Test _process_training_load merges balance and status data with same date.
+        Test _process_vo2_max_and_acclimation merges generic and cycling VO2 max values
+        with the same date into a single upsert.
 
+        :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
         :param sample_training_status_data: Sample training status data fixture.
         """
 
+        # Arrange - move generic VO2 max to the cycling date.
+        modified_data = _clone(sample_training_status_data)
+        modified_data["mostRecentVO2Max"]["generic"]["calendarDate"] = "2025-08-15"
+
         # Act.
         processor.user_id = 1
-        processor._process_training_load(sample_training_status_data, mock_session)
+        processor._process_vo2_max_and_acclimation(modified_data, mock_session)
 
         # Assert.
-        # Should call upsert twice: once for balance, once for merged status data.
-        assert mock_upsert.call_count == 2
-        assert mock_session.merge.call_count == 0  # No immediate merge calls.
-
-        upsert_calls = mock_upsert.call_args_list
+        # VO2 max (1 merged call) + Acclimation (1 call).
+        vo2_max_call, acclimation_call = mock_upsert.call_args_list
+
+        vo2_max_kwargs = vo2_max_call.kwargs
+        (vo2_max_record,) = vo2_max_kwargs["model_instances"]
+        assert vo2_max_kwargs["conflict_columns"] == ["user_id", "date"]
+        assert vo2_max_kwargs["update_columns"] == [
+            "vo2_max_generic",
+            "vo2_max_cycling",
+        ]
+        expected = {
+            "user_id": 1,
+            "date": "2025-08-15",
+            "vo2_max_generic": 58.9,
+            "vo2_max_cycling": 58.5,
+        }
+        assert {attr: getattr(vo2_max_record, attr) for attr in expected} == expected
 
-        # First call: balance data only.
-        balance_call = upsert_calls[0]
-        assert balance_call[1]["session"] == mock_session
-        assert balance_call[1]["conflict_columns"] == ["user_id", "date"]
-        assert balance_call[1]["on_conflict_update"] is True
-        assert len(balance_call[1]["model_instances"]) == 1
-        assert "update_columns" in balance_call[1]
+        (acclimation_record,) = acclimation_call.kwargs["model_instances"]
+        assert isinstance(acclimation_record, Acclimation)
 
-        balance_record = balance_call[1]["model_instances"][0]
-        assert isinstance(balance_record, TrainingLoad)
-        assert balance_record.user_id == 1
-        assert balance_record.date == "2025-08-15"
+    def test_process_training_load_data(
+        self, mock_upsert, processor, mock_session, sample_training_status_data
+    ):
+        """
+        Test _process_training_load merges balance and status data with same date.
 
-        # Check training load balance fields.
-        assert balance_record.monthly_load_aerobic_low == 1540.738
-        assert balance_record.monthly_load_aerobic_high == 1366.2461
-        assert balance_record.monthly_load_anaerobic == 492.51825
-        assert balance_record.training_balance_feedback_phrase == "ABOVE_TARGETS"
+        :param processor: GarminProcessor fixture.
+        :param mock_session: Mock session fixture.
+        :param sample_training_status_data: Sample training status data fixture.
+        """
 
-        # Second call: merged record with status data (same date).
-        status_call = upsert_calls[1]
-        assert status_call[1]["session"] == mock_session
-        assert status_call[1]["conflict_columns"] == ["user_id", "date"]
-        assert status_call[1]["on_conflict_update"] is True
-        assert len(status_call[1]["model_instances"]) == 1
-        assert "update_columns" in status_call[1]
+        # Act.
+        processor.user_id = 1
+        processor._process_training_load(
+            _clone(sample_training_status_data), mock_session
+        )
 
-        status_record = status_call[1]["model_instances"][0]
-        assert isinstance(status_record, TrainingLoad)
-        assert status_record.user_id == 1
-        assert status_record.date == "2025-08-15"
-
-        # Check that status data is on the same record (merged because same date).
-        # Check ACWR fields.
-        assert status_record.acwr_percent == 38
-        assert status_record.acwr_status == "OPTIMAL"
-        assert status_record.acwr_status_feedback == "FEEDBACK_2"
-        assert status_record.daily_training_load_acute == 811
-        assert status_record.daily_training_load_chronic == 841
-        assert status_record.daily_acute_chronic_workload_ratio == 0.9
-
-        # Check training status fields.
-        assert status_record.training_status == 8
-        assert status_record.training_status_feedback_phrase == "STRAINED_1"
+        # Assert.
+        # Should call upsert once, with balance and status data merged (same date).
+        mock_upsert.assert_called_once()
+        assert mock_session.merge.call_count == 0  # No immediate merge calls.
 
-        # The merged record should also have the balance fields.
-        assert status_record.monthly_load_aerobic_low == 1540.738
-        assert status_record.monthly_load_aerobic_high == 1366.2461
+        kwargs = mock_upsert.call_args.kwargs
+        assert kwargs["session"] == mock_session
+        assert kwargs["conflict_columns"] == ["user_id", "date"]
+        assert kwargs["on_conflict_update"] is True
+
+        # Both balance and status columns are updated in the same statement.
+        update_columns = set(kwargs["update_columns"])
+        key_columns = set(kwargs["conflict_columns"])
+        assert update_columns >= _EXPECTED_TRAINING_LOAD_BALANCE.keys() - key_columns
+        assert update_columns >= _EXPECTED_TRAINING_LOAD_STATUS.keys() - key_columns
+
+        # Check that status data is on the balance record (merged because same date).
+        (record,) = kwargs["model_instances"]
+        assert isinstance(record, TrainingLoad)
+        assert {
+            attr: getattr(record, attr) for attr in _EXPECTED_TRAINING_LOAD_BALANCE
+        } == _EXPECTED_TRAINING_LOAD_BALANCE
+        assert {
+            attr: getattr(record, attr) for attr in _EXPECTED_TRAINING_LOAD_STATUS
+        } == _EXPECTED_TRAINING_LOAD_STATUS
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_training_load_data_different_dates(
         self, mock_upsert, processor, mock_session, sample_training_status_data
     ):
@@ -1690,7 +1997,7 @@ class TestGarminProcessor:
         """
 
         # Arrange - modify data to have different dates.
-        modified_data = copy.deepcopy(sample_training_status_data)
+        modified_data = _clone(sample_training_status_data)
         modified_data["mostRecentTrainingStatus"]["latestTrainingStatusData"][
             "3474921807"
         ]["calendarDate"] = "2025-08-16"
@@ -1721,7 +2028,6 @@ class TestGarminProcessor:
         # Status record should NOT have balance data (different date).
         assert status_record.monthly_load_aerobic_low is None
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_training_load_data_missing_sections(
         self, mock_upsert, processor, mock_session
     ):
@@ -1743,7 +2049,6 @@ class TestGarminProcessor:
         mock_upsert.assert_not_called()  # No upsert calls with empty data.
         assert mock_session.merge.call_count == 0  # No merge calls.
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_training_load_data_unexpected_data_types(
         self, mock_upsert, processor, mock_session, sample_training_status_data
     ):
@@ -1757,7 +2062,7 @@ class TestGarminProcessor:
         """
 
         # Arrange - add unexpected data types to balance data.
-        modified_data = copy.deepcopy(sample_training_status_data)
+        modified_data = _clone(sample_training_status_data)
         balance_data = modified_data["mostRecentTrainingLoadBalance"][
             "metricsTrainingLoadBalanceDTOMap"
         ]["3474921807"]
@@ -1775,66 +2080,17 @@ class TestGarminProcessor:
 
         # Assert.
         # Should still create training load records with the unexpected values as-is.
-        assert mock_upsert.call_count == 2  # Balance and status records.
-        call_args = mock_upsert.call_args
-        training_load_records = call_args[1]["model_instances"]
-
-        # Find the balance record.
-        balance_record = next(
-            (
-                r
-                for r in training_load_records
-                if r.training_balance_feedback_phrase is not None
-            ),
-            None,
-        )
-        assert balance_record is not None
+        mock_upsert.assert_called_once()  # Balance and status merged (same date).
+        # The single merged record carries the balance data.
+        (balance_record,) = mock_upsert.call_args.kwargs["model_instances"]
+        assert balance_record.training_balance_feedback_phrase is not None
 
         # The unexpected data types should be set as-is on the model
         # (SQLAlchemy will handle type conversion if possible)
         assert balance_record.monthly_load_aerobic_low == [1540.738]
         assert balance_record.monthly_load_aerobic_high == {"value": 1366.2461}
 
-    def test_process_training_status_file_routing(
-        self, processor, mock_session, temp_dir
-    ):
-        """
-        Test that TRAINING_STATUS files are properly routed to processing method.
-
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
-        """
-
-        # Arrange.
-        training_status_file = (
-            temp_dir / "123456789_TRAINING_STATUS_2022-01-01T00-00-00Z.json"
-        )
-        training_status_file.write_text('{"mostRecentVO2Max": {}}')
-
-        # Create FileSet with TRAINING_STATUS files.
-        file_set = FileSet(
-            files={GARMIN_FILE_TYPES.TRAINING_STATUS: [training_status_file]}
-        )
-
-        # Mock user existence check.
-        mock_session.query.return_value.filter.return_value.first.return_value = None
-
-        # Act.
-        with patch.object(
-            processor, "_process_training_status"
-        ) as mock_process_training_status, patch.object(
-            processor, "_ensure_user_exists", return_value=1
-        ) as mock_ensure_user:
-            processor.process_file_set(file_set, mock_session)
-
-        # Assert.
-        mock_process_training_status.assert_called_once_with(
-            training_status_file, mock_session
-        )
-        mock_ensure_user.assert_called_once_with("123456789", mock_session)
-
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_training_readiness_data(self) -> List[Dict]:
         """
         Create sample training readiness data based on provided JSON structure.
@@ -1842,125 +2098,53 @@ class TestGarminProcessor:
         :return: Sample training readiness data list.
         """
 
-        return [
-            {
-                "userProfilePK": 15007510,
-                "calendarDate": "2025-08-07",
-                "timestamp": "2025-08-07T18:56:58.0",
-                "timestampLocal": "2025-08-07T11:56:58.0",
-                "deviceId": 3474921807,
-                "level": "MODERATE",
-                "feedbackLong": "MOD_RT_MOD_SS_MOD",
-                "feedbackShort": "LISTEN_TO_YOUR_BODY",
-                "score": 50,
-                "sleepScore": 77,
-                "sleepScoreFactorPercent": 65,
-                "sleepScoreFactorFeedback": "MODERATE",
-                "recoveryTime": 1524,
-                "recoveryTimeFactorPercent": 59,
-                "recoveryTimeFactorFeedback": "MODERATE",
-                "acwrFactorPercent": 95,
-                "acwrFactorFeedback": "GOOD",
-                "acuteLoad": 730,
-                "stressHistoryFactorPercent": 77,
-                "stressHistoryFactorFeedback": "GOOD",
-                "hrvFactorPercent": 88,
-                "hrvFactorFeedback": "GOOD",
-                "hrvWeeklyAverage": 75,
-                "sleepHistoryFactorPercent": 69,
-                "sleepHistoryFactorFeedback": "MODERATE",
-                "validSleep": True,
-                "inputContext": "UPDATE_REALTIME_VARIABLES",
-                "primaryActivityTracker": True,
-                "recoveryTimeChangePhrase": None,
-                "sleepHistoryFactorFeedbackPhrase": None,
-                "hrvFactorFeedbackPhrase": None,
-                "stressHistoryFactorFeedbackPhrase": None,
-                "acwrFactorFeedbackPhrase": None,
-                "recoveryTimeFactorFeedbackPhrase": None,
-                "sleepScoreFactorFeedbackPhrase": None,
-            },
-            {
-                "userProfilePK": 15007510,
-                "calendarDate": "2025-08-07",
-                "timestamp": "2025-08-07T15:07:53.0",
-                "timestampLocal": "2025-08-07T08:07:53.0",
-                "deviceId": 3474921807,
-                "level": "LOW",
-                "feedbackLong": "LOW_RT_MOD_OR_LOW_SS_MOD",
-                "feedbackShort": "FOCUS_ON_ENERGY_LEVELS",
-                "score": 47,
-                "sleepScore": 77,
-                "sleepScoreFactorPercent": 65,
-                "sleepScoreFactorFeedback": "MODERATE",
-                "recoveryTime": 1752,
-                "recoveryTimeFactorPercent": 52,
-                "recoveryTimeFactorFeedback": "MODERATE",
-                "acwrFactorPercent": 95,
-                "acwrFactorFeedback": "GOOD",
-                "acuteLoad": 730,
-                "stressHistoryFactorPercent": 77,
-                "stressHistoryFactorFeedback": "GOOD",
-                "hrvFactorPercent": 88,
-                "hrvFactorFeedback": "GOOD",
-                "hrvWeeklyAverage": 75,
-                "sleepHistoryFactorPercent": 69,
-                "sleepHistoryFactorFeedback": "MODERATE",
-                "validSleep": True,
-                "inputContext": "AFTER_POST_EXERCISE_RESET",
-                "primaryActivityTracker": True,
-                "recoveryTimeChangePhrase": "REACHED_ZERO",
-                "sleepHistoryFactorFeedbackPhrase": None,
-                "hrvFactorFeedbackPhrase": None,
-                "stressHistoryFactorFeedbackPhrase": None,
-                "acwrFactorFeedbackPhrase": None,
-                "recoveryTimeFactorFeedbackPhrase": None,
-                "sleepScoreFactorFeedbackPhrase": None,
-            },
-        ]
+        return _SAMPLE_TRAINING_READINESS_DATA
 
     def test_process_training_readiness_file(
-        self, processor, mock_session, temp_dir, sample_training_readiness_data
+        self, mock_upsert, processor, mock_session, sample_training_readiness_data
     ):
         """
         Test _process_training_readiness with complete data.
 
+        :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         :param sample_training_readiness_data: Sample training readiness data fixture.
         """
 
         # Arrange.
-        training_readiness_file = (
-            temp_dir / "15007510_TRAINING_READINESS_2025-08-07T12:00:00Z.json"
+        training_readiness_file = Path(
+            "/fake/15007510_TRAINING_READINESS_2025-08-07T12:00:00Z.json"
         )
-        with open(training_readiness_file, "w", encoding="utf-8") as f:
-            json.dump(sample_training_readiness_data, f)
 
-        # Mock upsert_model_instances.
-        with patch(
-            "dags.pipelines.garmin.process.upsert_model_instances"
-        ) as mock_upsert:
-            # Act.
+        # Act.
+        with patch.object(
+            processor,
+            "_load_json_file",
+            return_value=_clone(sample_training_readiness_data),
+        ):
             processor.user_id = 1
             processor._process_training_readiness(training_readiness_file, mock_session)
 
-            # Assert.
-            mock_upsert.assert_called_once()
-            call_args = mock_upsert.call_args
+        # Assert.
+        mock_upsert.assert_called_once()
+        call_args = mock_upsert.call_args
 
-            # Verify the model instances passed to upsert.
-            model_instances = call_args[1]["model_instances"]
-            assert len(model_instances) == 2  # Two records in sample data.
+        # Verify the model instances passed to upsert.
+        model_instances = call_args[1]["model_instances"]
+        assert len(model_instances) == 2  # Two records in sample data.
+
+        # Verify all instances are TrainingReadiness models.
+        for instance in model_instances:
+            assert isinstance(instance, TrainingReadiness)
 
-            # Verify all instances are TrainingReadiness models.
-            for instance in model_instances:
-                assert isinstance(instance, TrainingReadiness)
+        # Verify timezone offsets (UTC-7 based on sample timestamps).
+        offsets = [instance.timezone_offset_hours for instance in model_instances]
+        assert offsets == [-7.0, -7.0]
 
-            # Verify conflict columns.
-            assert call_args[1]["conflict_columns"] == ["user_id", "timestamp"]
-            assert call_args[1]["on_conflict_update"] is True
+        # Verify conflict columns.
+        assert call_args[1]["conflict_columns"] == ["user_id", "timestamp"]
+        assert call_args[1]["on_conflict_update"] is True
 
     def test_process_training_readiness_field_extraction(
         self, processor, sample_training_readiness_data
@@ -1979,7 +2163,7 @@ class TestGarminProcessor:
         """
 
         # Arrange - use first record from sample data.
-        single_record = copy.deepcopy(sample_training_readiness_data[0])
+        single_record = _clone(sample_training_readiness_data[0])
 
         # Use the actual file processing logic to test field extraction.
         readiness_data = single_record
@@ -2014,6 +2198,10 @@ class TestGarminProcessor:
             snake_case_name = processor._convert_field_name(field_name)
             readiness_record[snake_case_name] = field_value
 
+        # Assert repeated field names are served from the conversion cache.
+        cached_name = processor._convert_field_name("feedbackLong")
+        assert processor._convert_field_name("feedbackLong") is cached_name
+
         # Assert timezone offset calculation.
         expected_offset = -7.0  # UTC-7 based on sample timestamps.
         assert readiness_record["timezone_offset_hours"] == expected_offset
@@ -2031,9 +2219,8 @@ class TestGarminProcessor:
         assert "input_context" in readiness_record
 
         # Assert values are correct.
-        assert readiness_record["level"] == "MODERATE"
-        assert readiness_record["score"] == 50
-        assert readiness_record["valid_sleep"] is True
+        expected = {"level": "MODERATE", "score": 50, "valid_sleep": True}
+        assert {key: readiness_record[key] for key in expected} == expected
 
         # Assert null values are included (not skipped).
         assert "recovery_time_change_phrase" in readiness_record
@@ -2041,10 +2228,13 @@ class TestGarminProcessor:
         assert "sleep_history_factor_feedback_phrase" in readiness_record
         assert readiness_record["sleep_history_factor_feedback_phrase"] is None
 
-    def test_process_training_readiness_empty_data(self, processor, mock_session):
+    def test_process_training_readiness_empty_data(
+        self, mock_upsert, processor, mock_session
+    ):
         """
         Test _process_training_readiness with empty data.
 
+        :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
         """
@@ -2053,22 +2243,20 @@ class TestGarminProcessor:
         empty_data = []
 
         # Act.
-        with patch(
-            "dags.pipelines.garmin.process.upsert_model_instances"
-        ) as mock_upsert:
-            with patch.object(processor, "_load_json_file", return_value=empty_data):
-                processor.user_id = 1
-                processor._process_training_readiness(Path("dummy"), mock_session)
+        with patch.object(processor, "_load_json_file", return_value=empty_data):
+            processor.user_id = 1
+            processor._process_training_readiness(Path("dummy"), mock_session)
 
         # Assert.
         mock_upsert.assert_not_called()  # No records to process.
 
     def test_process_training_readiness_missing_timestamp(
-        self, processor, mock_session
+        self, mock_upsert, processor, mock_session
     ):
         """
         Test _process_training_readiness skips records with missing timestamp.
 
+        :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
         """
@@ -2080,61 +2268,17 @@ class TestGarminProcessor:
         ]
 
         # Act.
-        with patch(
-            "dags.pipelines.garmin.process.upsert_model_instances"
-        ) as mock_upsert:
-            with patch.object(
-                processor, "_load_json_file", return_value=incomplete_data
-            ):
-                processor.user_id = 1
-                processor._process_training_readiness(Path("dummy"), mock_session)
-
-                # Assert.
-                mock_upsert.assert_called_once()
-                model_instances = mock_upsert.call_args[1]["model_instances"]
-                assert len(model_instances) == 1  # Only one valid record processed.
-
-    def test_process_training_readiness_file_routing(
-        self, processor, mock_session, temp_dir
-    ):
-        """
-        Test that TRAINING_READINESS files are properly routed to processing method.
-
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
-        """
-
-        # Arrange.
-        training_readiness_file = (
-            temp_dir / "123456789_TRAINING_READINESS_2022-01-01T00-00-00Z.json"
-        )
-        training_readiness_file.write_text('[{"timestamp": "2025-01-01T12:00:00.0"}]')
-
-        # Create FileSet with TRAINING_READINESS files.
-        file_set = FileSet(
-            files={GARMIN_FILE_TYPES.TRAINING_READINESS: [training_readiness_file]}
-        )
-
-        # Mock user existence check.
-        mock_session.query.return_value.filter.return_value.first.return_value = None
-
-        # Act.
-        with patch.object(
-            processor, "_process_training_readiness"
-        ) as mock_process_training_readiness, patch.object(
-            processor, "_ensure_user_exists", return_value=1
-        ) as mock_ensure_user:
-            processor.process_file_set(file_set, mock_session)
+        with patch.object(processor, "_load_json_file", return_value=incomplete_data):
+            processor.user_id = 1
+            processor._process_training_readiness(Path("dummy"), mock_session)
 
-        # Assert.
-        mock_process_training_readiness.assert_called_once_with(
-            training_readiness_file, mock_session
-        )
-        mock_ensure_user.assert_called_once_with("123456789", mock_session)
+            # Assert.
+            mock_upsert.assert_called_once()
+            model_instances = mock_upsert.call_args[1]["model_instances"]
+            assert len(model_instances) == 1  # Only one valid record processed.
 
     def test_process_training_readiness_null_value_handling(
-        self, processor, mock_session
+        self, mock_upsert, processor, mock_session
     ):
         """
         Test _process_training_readiness properly handles null values.
@@ -2142,6 +2286,7 @@ class TestGarminProcessor:
         Verifies that None/null values are included in the database record rather than
         being skipped, ensuring proper upsert functionality.
 
+        :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
         """
@@ -2160,46 +2305,41 @@ class TestGarminProcessor:
         ]
 
         # Act.
-        with patch(
-            "dags.pipelines.garmin.process.upsert_model_instances"
-        ) as mock_upsert:
-            with patch.object(
-                processor, "_load_json_file", return_value=data_with_nulls
-            ):
-                processor.user_id = 1
-                processor._process_training_readiness(Path("dummy"), mock_session)
-
-                # Assert.
-                mock_upsert.assert_called_once()
-                model_instances = mock_upsert.call_args[1]["model_instances"]
-                assert len(model_instances) == 1
-
-                # Get the TrainingReadiness instance.
-                readiness_instance = model_instances[0]
-
-                # Verify null values are included (not skipped).
-                assert hasattr(
-                    readiness_instance, "recovery_time_change_phrase"
-                ), "Null field should be present"
-                assert (
-                    readiness_instance.recovery_time_change_phrase is None
-                ), "Null value should be preserved"
-
-                assert hasattr(
-                    readiness_instance, "hrv_factor_feedback_phrase"
-                ), "Null field should be present"
-                assert (
-                    readiness_instance.hrv_factor_feedback_phrase is None
-                ), "Null value should be preserved"
-
-                # Verify non-null values are also present.
-                assert readiness_instance.level == "MODERATE"
-                assert readiness_instance.score == 50
-                assert readiness_instance.sleep_score == 77
-                assert readiness_instance.valid_sleep is True
+        with patch.object(processor, "_load_json_file", return_value=data_with_nulls):
+            processor.user_id = 1
+            processor._process_training_readiness(Path("dummy"), mock_session)
+
+            # Assert.
+            mock_upsert.assert_called_once()
+            model_instances = mock_upsert.call_args[1]["model_instances"]
+            assert len(model_instances) == 1
+
+            # Get the TrainingReadiness instance.
+            readiness_instance = model_instances[0]
+
+            # Verify null values are included (not skipped).
+            assert hasattr(
+                readiness_instance, "recovery_time_change_phrase"
+            ), "Null field should be present"
+            assert (
+                readiness_instance.recovery_time_change_phrase is None
+            ), "Null value should be preserved"
+
+            assert hasattr(
+                readiness_instance, "hrv_factor_feedback_phrase"
+            ), "Null field should be present"
+            assert (
+                readiness_instance.hrv_factor_feedback_phrase is None
+            ), "Null value should be preserved"
+
+            # Verify non-null values are also present.
+            assert readiness_instance.level == "MODERATE"
+            assert readiness_instance.score == 50
+            assert readiness_instance.sleep_score == 77
+            assert readiness_instance.valid_sleep is True
 
     # Stress and Body Battery Processing Tests.
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_stress_data(self) -> Dict:
         """
         Create sample stress data with both stress and body battery arrays.
@@ -2207,26 +2347,10 @@ class TestGarminProcessor:
         :return: Sample stress JSON data.
         """
 
-        return {
-            "stressValuesArray": [
-                [1754550000000, 25],  # Valid stress value.
-                [1754550180000, 40],  # Valid stress value.
-                [1754550360000, -1],  # Invalid stress value (negative).
-                [1754550540000, 55],  # Valid stress value.
-                [1754550720000],  # Incomplete entry.
-            ],
-            "bodyBatteryValuesArray": [
-                [1754550000000, 0, 75],  # Valid body battery value.
-                [1754550180000, 1, 72],  # Valid body battery value.
-                [1754550360000, 2, 68],  # Valid body battery value.
-                [1754550540000, 3],  # Incomplete entry.
-            ],
-            "otherData": "should be removed by pop",
-        }
+        return _SAMPLE_STRESS_DATA
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_stress_body_battery_file(
-        self, mock_upsert, processor, mock_session, temp_dir, sample_stress_data
+        self, mock_upsert, processor, mock_session, sample_stress_data
     ):
         """
         Test _process_stress_body_battery method with complete data.
@@ -2234,18 +2358,18 @@ class TestGarminProcessor:
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         :param sample_stress_data: Sample stress data fixture.
         """
 
         # Arrange.
-        stress_file = temp_dir / "123456789_STRESS_2022-01-01T00-00-00Z.json"
-        with open(stress_file, "w", encoding="utf-8") as f:
-            json.dump(sample_stress_data, f)
+        stress_file = Path("/fake/123456789_STRESS_2022-01-01T00-00-00Z.json")
 
         # Act.
-        processor.user_id = 1
-        processor._process_stress_body_battery(stress_file, mock_session)
+        with patch.object(
+            processor, "_load_json_file", return_value=_clone(sample_stress_data)
+        ):
+            processor.user_id = 1
+            processor._process_stress_body_battery(stress_file, mock_session)
 
         # Assert.
         # Verify upsert was called twice (stress and body battery).
@@ -2270,9 +2394,8 @@ class TestGarminProcessor:
         assert battery_call[1]["conflict_columns"] == ["user_id", "timestamp"]
         assert battery_call[1]["on_conflict_update"] is False
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_stress_values_filtering(
-        self, mock_upsert, processor, mock_session, temp_dir
+        self, mock_upsert, processor, mock_session
     ):
         """
         Test stress value filtering and timestamp conversion.
@@ -2280,7 +2403,6 @@ class TestGarminProcessor:
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         """
 
         # Arrange - data with negative and incomplete values.
@@ -2295,13 +2417,12 @@ class TestGarminProcessor:
             "bodyBatteryValuesArray": [],
         }
 
-        stress_file = temp_dir / "123456789_STRESS_2022-01-01T00-00-00Z.json"
-        with open(stress_file, "w", encoding="utf-8") as f:
-            json.dump(stress_data, f)
+        stress_file = Path("/fake/123456789_STRESS_2022-01-01T00-00-00Z.json")
 
         # Act.
-        processor.user_id = 1
-        processor._process_stress_body_battery(stress_file, mock_session)
+        with patch.object(processor, "_load_json_file", return_value=stress_data):
+            processor.user_id = 1
+            processor._process_stress_body_battery(stress_file, mock_session)
 
         # Assert.
         # Should have one call for stress (empty body battery skipped).
@@ -2311,20 +2432,20 @@ class TestGarminProcessor:
         assert len(stress_instances) == 3  # Only valid values.
 
         # Verify values and timestamps.
-        stress_levels = [instance.value for instance in stress_instances]
-        assert stress_levels == [30, 0, 100]
+        assert list(map(_get_value, stress_instances)) == [30, 0, 100]
+        timestamps = [instance.timestamp for instance in stress_instances]
+        assert timestamps == [
+            _EPOCH_MS_DATETIMES[epoch_ms]
+            for epoch_ms in (1640995200000, 1640995560000, 1640995740000)
+        ]
 
         # Verify first timestamp conversion.
         first_instance = stress_instances[0]
-        expected_timestamp = datetime.fromtimestamp(
-            1640995200000 / 1000, tz=timezone.utc
-        )
-        assert first_instance.timestamp == expected_timestamp
+        assert first_instance.timestamp == datetime(2022, 1, 1, tzinfo=timezone.utc)
         assert first_instance.user_id == 1
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_body_battery_values_extraction(
-        self, mock_upsert, processor, mock_session, temp_dir
+        self, mock_upsert, processor, mock_session
     ):
         """
         Test body battery value extraction from 3-element arrays.
@@ -2332,7 +2453,6 @@ class TestGarminProcessor:
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         """
 
         # Arrange - focus on body battery data.
@@ -2347,13 +2467,12 @@ class TestGarminProcessor:
             ],
         }
 
-        stress_file = temp_dir / "123456789_STRESS_2022-01-01T00-00-00Z.json"
-        with open(stress_file, "w", encoding="utf-8") as f:
-            json.dump(stress_data, f)
+        stress_file = Path("/fake/123456789_STRESS_2022-01-01T00-00-00Z.json")
 
         # Act.
-        processor.user_id = 1
-        processor._process_stress_body_battery(stress_file, mock_session)
+        with patch.object(processor, "_load_json_file", return_value=stress_data):
+            processor.user_id = 1
+            processor._process_stress_body_battery(stress_file, mock_session)
 
         # Assert.
         # Should have one call for body battery (empty stress skipped).
@@ -2363,20 +2482,16 @@ class TestGarminProcessor:
         assert len(battery_instances) == 4  # All complete entries.
 
         # Verify extracted values (third element from array).
-        battery_levels = [instance.value for instance in battery_instances]
-        assert battery_levels == [85, 80, 75, 70]
+        assert list(map(_get_value, battery_instances)) == [85, 80, 75, 70]
 
         # Verify timestamp conversion for first instance.
         first_instance = battery_instances[0]
-        expected_timestamp = datetime.fromtimestamp(
-            1640995200000 / 1000, tz=timezone.utc
-        )
+        expected_timestamp = _EPOCH_MS_DATETIMES[1640995200000]
         assert first_instance.timestamp == expected_timestamp
         assert first_instance.user_id == 1
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_stress_body_battery_empty_arrays(
-        self, mock_upsert, processor, mock_session, temp_dir
+        self, mock_upsert, processor, mock_session
     ):
         """
         Test processing with empty stress and body battery arrays.
@@ -2384,7 +2499,6 @@ class TestGarminProcessor:
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         """
 
         # Arrange - empty arrays.
@@ -2394,21 +2508,19 @@ class TestGarminProcessor:
             "otherFields": {"ignored": True},
         }
 
-        stress_file = temp_dir / "123456789_STRESS_2022-01-01T00-00-00Z.json"
-        with open(stress_file, "w", encoding="utf-8") as f:
-            json.dump(stress_data, f)
+        stress_file = Path("/fake/123456789_STRESS_2022-01-01T00-00-00Z.json")
 
         # Act.
-        processor.user_id = 1
-        processor._process_stress_body_battery(stress_file, mock_session)
+        with patch.object(processor, "_load_json_file", return_value=stress_data):
+            processor.user_id = 1
+            processor._process_stress_body_battery(stress_file, mock_session)
 
         # Assert.
         # No upsert calls should be made with empty data.
         mock_upsert.assert_not_called()
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_stress_body_battery_missing_arrays(
-        self, mock_upsert, processor, mock_session, temp_dir
+        self, mock_upsert, processor, mock_session
     ):
         """
         Test processing with missing stress and body battery arrays.
@@ -2416,92 +2528,50 @@ class TestGarminProcessor:
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         """
 
         # Arrange - missing arrays (pop should handle gracefully).
         stress_data = {"otherData": "no stress or body battery arrays"}
 
-        stress_file = temp_dir / "123456789_STRESS_2022-01-01T00-00-00Z.json"
-        with open(stress_file, "w", encoding="utf-8") as f:
-            json.dump(stress_data, f)
+        stress_file = Path("/fake/123456789_STRESS_2022-01-01T00-00-00Z.json")
 
         # Act.
-        processor.user_id = 1
-        processor._process_stress_body_battery(stress_file, mock_session)
+        with patch.object(processor, "_load_json_file", return_value=stress_data):
+            processor.user_id = 1
+            processor._process_stress_body_battery(stress_file, mock_session)
 
         # Assert.
         # No upsert calls should be made with missing data.
         mock_upsert.assert_not_called()
 
     def test_process_stress_body_battery_data_mutation(
-        self, processor, mock_session, temp_dir, sample_stress_data
+        self, processor, mock_session, sample_stress_data
     ):
         """
         Test that processing uses pop() to avoid data duplication.
 
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         :param sample_stress_data: Sample stress data fixture.
         """
 
-        # Arrange.
-        stress_file = temp_dir / "123456789_STRESS_2022-01-01T00-00-00Z.json"
-        with open(stress_file, "w", encoding="utf-8") as f:
-            json.dump(sample_stress_data, f)
-
-        # Act.
-        with patch.object(
-            processor, "_load_json_file", return_value=sample_stress_data.copy()
-        ) as mock_load:
-            processor.user_id = 1
-            processor._process_stress_body_battery(stress_file, mock_session)
-
-            # Get the data that was passed to load_json_file.
-            loaded_data = mock_load.return_value
-
-            # Verify that pop() was used (arrays should be removed).
-            assert "stressValuesArray" not in loaded_data
-            assert "bodyBatteryValuesArray" not in loaded_data
-            assert "otherData" in loaded_data  # Other data should remain.
-
-    def test_process_stress_body_battery_file_routing(
-        self, processor, mock_session, temp_dir
-    ):
-        """
-        Test that STRESS files are properly routed to processing method.
-
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
-        """
-
-        # Arrange.
-        stress_file = temp_dir / "123456789_STRESS_2022-01-01T00-00-00Z.json"
-        stress_file.write_text(
-            '{"stressValuesArray": [], "bodyBatteryValuesArray": []}'
-        )
-
-        # Create FileSet with STRESS files.
-        file_set = FileSet(files={GARMIN_FILE_TYPES.STRESS: [stress_file]})
-
-        # Mock user existence check.
-        mock_session.query.return_value.filter.return_value.first.return_value = None
+        # Arrange.
+        stress_file = Path("/fake/123456789_STRESS_2022-01-01T00-00-00Z.json")
 
         # Act.
         with patch.object(
-            processor, "_process_stress_body_battery"
-        ) as mock_process_stress_body_battery, patch.object(
-            processor, "_ensure_user_exists", return_value=1
-        ) as mock_ensure_user:
-            processor.process_file_set(file_set, mock_session)
+            processor, "_load_json_file", return_value=sample_stress_data.copy()
+        ) as mock_load:
+            processor.user_id = 1
+            processor._process_stress_body_battery(stress_file, mock_session)
 
-        # Assert.
-        mock_process_stress_body_battery.assert_called_once_with(
-            stress_file, mock_session
-        )
-        mock_ensure_user.assert_called_once_with("123456789", mock_session)
+            # Get the data that was passed to load_json_file.
+            loaded_data = mock_load.return_value
+
+            # Verify that pop() was used (arrays should be removed).
+            assert "stressValuesArray" not in loaded_data
+            assert "bodyBatteryValuesArray" not in loaded_data
+            assert "otherData" in loaded_data  # Other data should remain.
 
     def test_stress_body_battery_model_field_mapping(self):
         """
@@ -2509,7 +2579,7 @@ class TestGarminProcessor:
         """
 
         # Act - create model instances to verify field mappings.
-        test_timestamp = datetime.fromtimestamp(1640995200000 / 1000, tz=timezone.utc)
+        test_timestamp = _EPOCH_MS_DATETIMES[1640995200000]
 
         stress_instance = Stress(
             user_id=123,
@@ -2533,7 +2603,7 @@ class TestGarminProcessor:
         assert body_battery_instance.value == 75
 
     # Heart Rate Processing Tests.
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_heart_rate_data(self) -> Dict:
         """
         Create sample heart rate data based on provided JSON structure.
@@ -2541,30 +2611,10 @@ class TestGarminProcessor:
         :return: Sample heart rate data dictionary.
         """
 
-        return {
-            "userProfilePK": 15007510,
-            "calendarDate": "2025-08-07",
-            "startTimestampGMT": "2025-08-07T07:00:00.0",
-            "endTimestampGMT": "2025-08-08T07:00:00.0",
-            "startTimestampLocal": "2025-08-07T00:00:00.0",
-            "endTimestampLocal": "2025-08-08T00:00:00.0",
-            "maxHeartRate": 183,
-            "minHeartRate": 43,
-            "restingHeartRate": 45,
-            "lastSevenDaysAvgRestingHeartRate": 45,
-            "heartRateValues": [
-                [1754550000000, 49],  # Epoch timestamp in ms, heart rate value
-                [1754550120000, 49],
-                [1754550240000, 47],
-                [1754550360000, 48],
-                [1754550480000, 48],
-                [1754550600000, 48],
-            ],
-        }
+        return _SAMPLE_HEART_RATE_DATA
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_heart_rate_file(
-        self, mock_upsert, processor, mock_session, temp_dir, sample_heart_rate_data
+        self, mock_upsert, processor, mock_session, sample_heart_rate_data
     ):
         """
         Test _process_heart_rate with complete data.
@@ -2572,18 +2622,18 @@ class TestGarminProcessor:
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         :param sample_heart_rate_data: Sample heart rate data fixture.
         """
 
         # Arrange.
-        heart_rate_file = temp_dir / "15007510_HEART_RATE_2025-08-07T12:00:00Z.json"
-        with open(heart_rate_file, "w", encoding="utf-8") as f:
-            json.dump(sample_heart_rate_data, f)
+        heart_rate_file = Path("/fake/15007510_HEART_RATE_2025-08-07T12:00:00Z.json")
 
         # Act.
-        processor.user_id = 1
-        processor._process_heart_rate(heart_rate_file, mock_session)
+        with patch.object(
+            processor, "_load_json_file", return_value=_clone(sample_heart_rate_data)
+        ):
+            processor.user_id = 1
+            processor._process_heart_rate(heart_rate_file, mock_session)
 
         # Assert.
         mock_upsert.assert_called_once()
@@ -2599,18 +2649,18 @@ class TestGarminProcessor:
         assert first_record.user_id == 1
         assert first_record.value == 49
         # Verify timestamp conversion from epoch milliseconds.
-        expected_timestamp = datetime.fromtimestamp(
-            1754550000000 / 1000, tz=timezone.utc
-        )
+        expected_timestamp = _EPOCH_MS_DATETIMES[1754550000000]
         assert first_record.timestamp == expected_timestamp
 
-    def test_process_heart_rate_missing_values(self, processor, mock_session, temp_dir):
+    def test_process_heart_rate_missing_values(
+        self, mock_upsert, processor, mock_session
+    ):
         """
         Test _process_heart_rate with missing heartRateValues.
 
+        :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         """
 
         # Arrange.
@@ -2621,27 +2671,25 @@ class TestGarminProcessor:
             "minHeartRate": 43,
             # Missing heartRateValues
         }
-        heart_rate_file = temp_dir / "15007510_HEART_RATE_2025-08-07T12:00:00Z.json"
-        with open(heart_rate_file, "w", encoding="utf-8") as f:
-            json.dump(data_no_values, f)
+        heart_rate_file = Path("/fake/15007510_HEART_RATE_2025-08-07T12:00:00Z.json")
 
         # Act.
-        with patch(
-            "dags.pipelines.garmin.process.upsert_model_instances"
-        ) as mock_upsert:
+        with patch.object(processor, "_load_json_file", return_value=data_no_values):
             processor.user_id = 1
             processor._process_heart_rate(heart_rate_file, mock_session)
 
         # Assert.
         mock_upsert.assert_not_called()  # No records should be processed
 
-    def test_process_heart_rate_empty_values(self, processor, mock_session, temp_dir):
+    def test_process_heart_rate_empty_values(
+        self, mock_upsert, processor, mock_session
+    ):
         """
         Test _process_heart_rate with empty heartRateValues array.
 
+        :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         """
 
         # Arrange.
@@ -2650,14 +2698,10 @@ class TestGarminProcessor:
             "calendarDate": "2025-08-07",
             "heartRateValues": [],  # Empty array
         }
-        heart_rate_file = temp_dir / "15007510_HEART_RATE_2025-08-07T12:00:00Z.json"
-        with open(heart_rate_file, "w", encoding="utf-8") as f:
-            json.dump(data_empty_values, f)
+        heart_rate_file = Path("/fake/15007510_HEART_RATE_2025-08-07T12:00:00Z.json")
 
         # Act.
-        with patch(
-            "dags.pipelines.garmin.process.upsert_model_instances"
-        ) as mock_upsert:
+        with patch.object(processor, "_load_json_file", return_value=data_empty_values):
             processor.user_id = 1
             processor._process_heart_rate(heart_rate_file, mock_session)
 
@@ -2665,36 +2709,34 @@ class TestGarminProcessor:
         mock_upsert.assert_not_called()  # No records should be processed
 
     def test_process_heart_rate_invalid_values(
-        self, processor, mock_session, temp_dir, sample_heart_rate_data
+        self, mock_upsert, processor, mock_session, sample_heart_rate_data
     ):
         """
         Test _process_heart_rate filters out invalid values (None, null timestamps).
 
+        :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         :param sample_heart_rate_data: Sample heart rate data fixture.
         """
 
         # Arrange - add invalid values to the data.
-        modified_data = copy.deepcopy(sample_heart_rate_data)
-        modified_data["heartRateValues"] = [
-            [1754550000000, 49],  # Valid
-            [None, 50],  # Invalid timestamp
-            [1754550240000, None],  # Invalid heart rate
-            [1754550360000, 48],  # Valid
-            [None, None],  # Both invalid
-            [1754550480000, 47],  # Valid
-        ]
+        modified_data = {
+            **sample_heart_rate_data,
+            "heartRateValues": [
+                [1754550000000, 49],  # Valid
+                [None, 50],  # Invalid timestamp
+                [1754550240000, None],  # Invalid heart rate
+                [1754550360000, 48],  # Valid
+                [None, None],  # Both invalid
+                [1754550480000, 47],  # Valid
+            ],
+        }
 
-        heart_rate_file = temp_dir / "15007510_HEART_RATE_2025-08-07T12:00:00Z.json"
-        with open(heart_rate_file, "w", encoding="utf-8") as f:
-            json.dump(modified_data, f)
+        heart_rate_file = Path("/fake/15007510_HEART_RATE_2025-08-07T12:00:00Z.json")
 
         # Act.
-        with patch(
-            "dags.pipelines.garmin.process.upsert_model_instances"
-        ) as mock_upsert:
+        with patch.object(processor, "_load_json_file", return_value=modified_data):
             processor.user_id = 1
             processor._process_heart_rate(heart_rate_file, mock_session)
 
@@ -2706,41 +2748,9 @@ class TestGarminProcessor:
         assert all(isinstance(m, HeartRate) for m in model_instances)
 
         # Check that only valid records are included.
-        heart_rate_values = [record.value for record in model_instances]
-        assert heart_rate_values == [49, 48, 47]
-
-    def test_process_heart_rate_file_routing(self, processor, mock_session, temp_dir):
-        """
-        Test that HEART_RATE files are properly routed to processing method.
-
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
-        """
-
-        # Arrange.
-        heart_rate_file = temp_dir / "123456789_HEART_RATE_2022-01-01T00:00:00Z.json"
-        heart_rate_file.write_text('{"heartRateValues": [[1640995200000, 65]]}')
-
-        # Create FileSet with HEART_RATE files.
-        file_set = FileSet(files={GARMIN_FILE_TYPES.HEART_RATE: [heart_rate_file]})
-
-        # Mock user existence check.
-        mock_session.query.return_value.filter.return_value.first.return_value = None
-
-        # Act.
-        with patch.object(
-            processor, "_process_heart_rate"
-        ) as mock_process_heart_rate, patch.object(
-            processor, "_ensure_user_exists", return_value=1
-        ) as mock_ensure_user:
-            processor.process_file_set(file_set, mock_session)
+        assert list(map(_get_value, model_instances)) == [49, 48, 47]
 
-        # Assert.
-        mock_process_heart_rate.assert_called_once_with(heart_rate_file, mock_session)
-        mock_ensure_user.assert_called_once_with("123456789", mock_session)
-
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_respiration_data(self) -> Dict:
         """
         Create sample respiration data based on provided JSON structure.
@@ -2748,55 +2758,10 @@ class TestGarminProcessor:
         :return: Sample respiration data dictionary.
         """
 
-        return {
-            "userProfilePK": 15007510,
-            "calendarDate": "2025-08-07",
-            "startTimestampGMT": "2025-08-07T07:00:00.0",
-            "endTimestampGMT": "2025-08-08T07:00:00.0",
-            "startTimestampLocal": "2025-08-07T00:00:00.0",
-            "endTimestampLocal": "2025-08-08T00:00:00.0",
-            "sleepStartTimestampGMT": "2025-08-07T06:42:06.0",
-            "sleepEndTimestampGMT": "2025-08-07T13:23:06.0",
-            "sleepStartTimestampLocal": "2025-08-06T23:42:06.0",
-            "sleepEndTimestampLocal": "2025-08-07T06:23:06.0",
-            "lowestRespirationValue": 6.0,
-            "highestRespirationValue": 45.0,
-            "avgWakingRespirationValue": 15.0,
-            "avgSleepRespirationValue": 11.0,
-            "avgTomorrowSleepRespirationValue": 11.0,
-            "respirationValueDescriptorsDTOList": [
-                {"key": "timestamp", "index": 0},
-                {"key": "respiration", "index": 1},
-            ],
-            "respirationValuesArray": [
-                [1754550120000, 11.0],  # Epoch timestamp in ms, respiration value
-                [1754550240000, 12.0],
-                [1754550360000, 13.0],
-                [1754550480000, 11.0],
-                [1754557680000, -1.0],  # Negative value (should be skipped)
-                [1754557800000, 13.0],
-                [1754557920000, 10.0],
-            ],
-            "respirationAveragesValueDescriptorDTOList": [
-                {
-                    "respirationAveragesValueDescriptorIndex": 0,
-                    "respirationAveragesValueDescriptionKey": "timestamp",
-                },
-                {
-                    "respirationAveragesValueDescriptorIndex": 1,
-                    "respirationAveragesValueDescriptionKey": "averageRespirationValue",
-                },
-            ],
-            "respirationAveragesValuesArray": [
-                [1754553600000, 11.74, 17.0, 7.0],
-                [1754557200000, 11.05, 15.0, 7.0],
-            ],
-            "respirationVersion": 200,
-        }
+        return _SAMPLE_RESPIRATION_DATA
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_respiration_file(
-        self, mock_upsert, processor, mock_session, temp_dir, sample_respiration_data
+        self, mock_upsert, processor, mock_session, sample_respiration_data
     ):
         """
         Test _process_respiration with complete data.
@@ -2804,18 +2769,18 @@ class TestGarminProcessor:
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         :param sample_respiration_data: Sample respiration data fixture.
         """
 
         # Arrange.
-        respiration_file = temp_dir / "15007510_RESPIRATION_2025-08-07T12:00:00Z.json"
-        with open(respiration_file, "w", encoding="utf-8") as f:
-            json.dump(sample_respiration_data, f)
+        respiration_file = Path("/fake/15007510_RESPIRATION_2025-08-07T12:00:00Z.json")
 
         # Act.
-        processor.user_id = 1
-        processor._process_respiration(respiration_file, mock_session)
+        with patch.object(
+            processor, "_load_json_file", return_value=_clone(sample_respiration_data)
+        ):
+            processor.user_id = 1
+            processor._process_respiration(respiration_file, mock_session)
 
         # Assert.
         mock_upsert.assert_called_once()
@@ -2832,20 +2797,15 @@ class TestGarminProcessor:
         assert first_record.user_id == 1
         assert first_record.value == 11.0
         # Verify timestamp conversion from epoch milliseconds.
-        expected_timestamp = datetime.fromtimestamp(
-            1754550120000 / 1000, tz=timezone.utc
-        )
+        expected_timestamp = _EPOCH_MS_DATETIMES[1754550120000]
         assert first_record.timestamp == expected_timestamp
 
-    def test_process_respiration_missing_values(
-        self, processor, mock_session, temp_dir
-    ):
+    def test_process_respiration_missing_values(self, processor, mock_session):
         """
         Test _process_respiration with missing respirationValuesArray.
 
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         """
 
         # Arrange.
@@ -2857,23 +2817,22 @@ class TestGarminProcessor:
             # Missing respirationValuesArray
         }
 
-        respiration_file = temp_dir / "15007510_RESPIRATION_2025-08-07T12:00:00Z.json"
-        with open(respiration_file, "w", encoding="utf-8") as f:
-            json.dump(data_no_values, f)
+        respiration_file = Path("/fake/15007510_RESPIRATION_2025-08-07T12:00:00Z.json")
 
         # Act and Assert.
-        with patch("dags.lib.logging_utils.LOGGER.warning") as mock_logger:
+        with patch.object(
+            processor, "_load_json_file", return_value=data_no_values
+        ), patch("dags.lib.logging_utils.LOGGER.warning") as mock_logger:
             processor.user_id = 1
             processor._process_respiration(respiration_file, mock_session)
             mock_logger.assert_called_with("⚠️ No respiration data found.")
 
-    def test_process_respiration_empty_values(self, processor, mock_session, temp_dir):
+    def test_process_respiration_empty_values(self, processor, mock_session):
         """
         Test _process_respiration with empty respirationValuesArray.
 
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         """
 
         # Arrange.
@@ -2883,19 +2842,18 @@ class TestGarminProcessor:
             "respirationValuesArray": [],  # Empty array
         }
 
-        respiration_file = temp_dir / "15007510_RESPIRATION_2025-08-07T12:00:00Z.json"
-        with open(respiration_file, "w", encoding="utf-8") as f:
-            json.dump(data_empty_values, f)
+        respiration_file = Path("/fake/15007510_RESPIRATION_2025-08-07T12:00:00Z.json")
 
         # Act and Assert.
-        with patch("dags.lib.logging_utils.LOGGER.warning") as mock_logger:
+        with patch.object(
+            processor, "_load_json_file", return_value=data_empty_values
+        ), patch("dags.lib.logging_utils.LOGGER.warning") as mock_logger:
             processor.user_id = 1
             processor._process_respiration(respiration_file, mock_session)
             mock_logger.assert_called_with("⚠️ No respiration data found.")
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_respiration_invalid_values(
-        self, mock_upsert, processor, mock_session, temp_dir
+        self, mock_upsert, processor, mock_session
     ):
         """
         Test _process_respiration with invalid and negative respiration values.
@@ -2903,7 +2861,6 @@ class TestGarminProcessor:
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         """
 
         # Arrange.
@@ -2922,13 +2879,14 @@ class TestGarminProcessor:
             ],
         }
 
-        respiration_file = temp_dir / "15007510_RESPIRATION_2025-08-07T12:00:00Z.json"
-        with open(respiration_file, "w", encoding="utf-8") as f:
-            json.dump(data_invalid_values, f)
+        respiration_file = Path("/fake/15007510_RESPIRATION_2025-08-07T12:00:00Z.json")
 
         # Act.
-        processor.user_id = 1
-        processor._process_respiration(respiration_file, mock_session)
+        with patch.object(
+            processor, "_load_json_file", return_value=data_invalid_values
+        ):
+            processor.user_id = 1
+            processor._process_respiration(respiration_file, mock_session)
 
         # Assert.
         mock_upsert.assert_called_once()
@@ -2938,12 +2896,10 @@ class TestGarminProcessor:
         assert len(model_instances) == 4
 
         # Check values are as expected.
-        values = [record.value for record in model_instances]
-        assert values == [12.0, 15.0, 0.0, 13.5]
+        assert list(map(_get_value, model_instances)) == [12.0, 15.0, 0.0, 13.5]
 
-    @patch("dags.lib.sql_utils.upsert_model_instances")
     def test_process_respiration_no_valid_records(
-        self, mock_upsert, processor, mock_session, temp_dir
+        self, mock_upsert, processor, mock_session
     ):
         """
         Test _process_respiration when all values are invalid/negative.
@@ -2951,7 +2907,6 @@ class TestGarminProcessor:
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         """
 
         # Arrange.
@@ -2966,62 +2921,26 @@ class TestGarminProcessor:
             ],
         }
 
-        respiration_file = temp_dir / "15007510_RESPIRATION_2025-08-07T12:00:00Z.json"
-        with open(respiration_file, "w", encoding="utf-8") as f:
-            json.dump(data_no_valid_values, f)
+        respiration_file = Path("/fake/15007510_RESPIRATION_2025-08-07T12:00:00Z.json")
 
         # Act and Assert.
-        with patch("dags.lib.logging_utils.LOGGER.warning") as mock_logger:
+        with patch.object(
+            processor, "_load_json_file", return_value=data_no_valid_values
+        ), patch("dags.lib.logging_utils.LOGGER.warning") as mock_logger:
             processor.user_id = 1
             processor._process_respiration(respiration_file, mock_session)
             mock_logger.assert_called_with("⚠️ No respiration data found.")
             # upsert should not be called when no valid records.
             mock_upsert.assert_not_called()
 
-    def test_process_respiration_file_routing(self, processor, mock_session, temp_dir):
-        """
-        Test that RESPIRATION files are routed to _process_respiration.
-
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
-        """
-
-        # Arrange.
-        respiration_file = temp_dir / "123456789_RESPIRATION_2025-08-07T12:00:00Z.json"
-        minimal_data = {
-            "userProfilePK": 123456789,
-            "respirationValuesArray": [[1754550120000, 12.0]],
-        }
-        with open(respiration_file, "w", encoding="utf-8") as f:
-            json.dump(minimal_data, f)
-
-        file_set = FileSet(files={GARMIN_FILE_TYPES.RESPIRATION: [respiration_file]})
-
-        # Act.
-        with patch.object(
-            processor, "_process_respiration"
-        ) as mock_process_respiration, patch.object(
-            processor, "_ensure_user_exists", return_value=1
-        ) as mock_ensure_user:
-            processor.process_file_set(file_set, mock_session)
-
-        # Assert.
-        mock_process_respiration.assert_called_once_with(respiration_file, mock_session)
-        mock_ensure_user.assert_called_once_with("123456789", mock_session)
-
     # Intensity minutes tests.
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
-    def test_process_intensity_minutes_file(
-        self, mock_upsert, processor, mock_session, temp_dir
-    ):
+    def test_process_intensity_minutes_file(self, mock_upsert, processor, mock_session):
         """
         Test _process_intensity_minutes with complete data.
 
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         """
 
         # Arrange.
@@ -3044,15 +2963,14 @@ class TestGarminProcessor:
             ],
         }
 
-        intensity_file = (
-            temp_dir / "15007510_INTENSITY_MINUTES_2025-08-07T12:00:00Z.json"
+        intensity_file = Path(
+            "/fake/15007510_INTENSITY_MINUTES_2025-08-07T12:00:00Z.json"
         )
-        with open(intensity_file, "w", encoding="utf-8") as f:
-            json.dump(intensity_data, f)
 
         # Act.
-        processor.user_id = 1
-        processor._process_intensity_minutes(intensity_file, mock_session)
+        with patch.object(processor, "_load_json_file", return_value=intensity_data):
+            processor.user_id = 1
+            processor._process_intensity_minutes(intensity_file, mock_session)
 
         # Assert.
         # Should have 2 upsert calls: 1 for intensity minutes + 1 for training load.
@@ -3083,16 +3001,14 @@ class TestGarminProcessor:
         # No session.merge calls.
         assert mock_session.merge.call_count == 0
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_intensity_minutes_missing_values(
-        self, mock_upsert, processor, mock_session, temp_dir
+        self, mock_upsert, processor, mock_session
     ):
         """
         Test _process_intensity_minutes with missing imValuesArray.
 
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         """
 
         # Arrange.
@@ -3104,14 +3020,14 @@ class TestGarminProcessor:
             # Missing imValuesArray
         }
 
-        intensity_file = (
-            temp_dir / "15007510_INTENSITY_MINUTES_2025-08-07T12:00:00Z.json"
+        intensity_file = Path(
+            "/fake/15007510_INTENSITY_MINUTES_2025-08-07T12:00:00Z.json"
         )
-        with open(intensity_file, "w", encoding="utf-8") as f:
-            json.dump(data_no_values, f)
 
         # Act and Assert.
-        with patch("dags.lib.logging_utils.LOGGER.warning") as mock_logger:
+        with patch.object(
+            processor, "_load_json_file", return_value=data_no_values
+        ), patch("dags.lib.logging_utils.LOGGER.warning") as mock_logger:
             processor.user_id = 1
             processor._process_intensity_minutes(intensity_file, mock_session)
             mock_logger.assert_called_with("⚠️ No intensity minutes data found.")
@@ -3125,9 +3041,8 @@ class TestGarminProcessor:
         assert len(call_args[1]["model_instances"]) == 1
         assert mock_session.merge.call_count == 0  # No immediate merge calls.
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_intensity_minutes_invalid_values(
-        self, mock_upsert, processor, mock_session, temp_dir
+        self, mock_upsert, processor, mock_session
     ):
         """
         Test _process_intensity_minutes with invalid and negative intensity values.
@@ -3135,7 +3050,6 @@ class TestGarminProcessor:
         :param mock_upsert: Mock upsert function.
         :param processor: GarminProcessor fixture.
         :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
         """
 
         # Arrange.
@@ -3154,15 +3068,16 @@ class TestGarminProcessor:
             ],
         }
 
-        intensity_file = (
-            temp_dir / "15007510_INTENSITY_MINUTES_2025-08-07T12:00:00Z.json"
+        intensity_file = Path(
+            "/fake/15007510_INTENSITY_MINUTES_2025-08-07T12:00:00Z.json"
         )
-        with open(intensity_file, "w", encoding="utf-8") as f:
-            json.dump(data_invalid_values, f)
 
         # Act.
-        processor.user_id = 1
-        processor._process_intensity_minutes(intensity_file, mock_session)
+        with patch.object(
+            processor, "_load_json_file", return_value=data_invalid_values
+        ):
+            processor.user_id = 1
+            processor._process_intensity_minutes(intensity_file, mock_session)
 
         # Assert.
         # Should have 1 upsert call for intensity minutes only (no training load data).
@@ -3181,48 +3096,7 @@ class TestGarminProcessor:
         assert 0 in values
         assert 15 in values
 
-    def test_process_intensity_minutes_file_routing(
-        self, processor, mock_session, temp_dir
-    ):
-        """
-        Test that INTENSITY_MINUTES files are routed to _process_intensity_minutes.
-
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
-        """
-
-        # Arrange.
-        intensity_file = (
-            temp_dir / "123456789_INTENSITY_MINUTES_2025-08-07T12:00:00Z.json"
-        )
-        minimal_data = {
-            "userProfilePK": 123456789,
-            "imValuesArray": [[1754576100000, 12]],
-        }
-        with open(intensity_file, "w", encoding="utf-8") as f:
-            json.dump(minimal_data, f)
-
-        file_set = FileSet(
-            files={GARMIN_FILE_TYPES.INTENSITY_MINUTES: [intensity_file]}
-        )
-
-        # Act.
-        with patch.object(
-            processor, "_process_intensity_minutes"
-        ) as mock_process_intensity_minutes, patch.object(
-            processor, "_ensure_user_exists", return_value=1
-        ) as mock_ensure_user:
-            processor.process_file_set(file_set, mock_session)
-
-        # Assert.
-        mock_process_intensity_minutes.assert_called_once_with(
-            intensity_file, mock_session
-        )
-        mock_ensure_user.assert_called_once_with("123456789", mock_session)
-
     # Floors tests.
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_floors_file(self, mock_upsert, processor, mock_session, temp_dir):
         """
         Test _process_floors with complete data.
@@ -3253,8 +3127,7 @@ class TestGarminProcessor:
         }
 
         floors_file = temp_dir / "15007510_FLOORS_2025-08-07T12:00:00Z.json"
-        with open(floors_file, "w", encoding="utf-8") as f:
-            json.dump(floors_data, f)
+        floors_file.write_bytes(orjson.dumps(floors_data))
 
         # Act.
         processor.user_id = 1
@@ -3276,7 +3149,6 @@ class TestGarminProcessor:
         assert floors_records[1].ascended == 0
         assert floors_records[1].descended == 1
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_floors_missing_values(
         self, mock_upsert, processor, mock_session, temp_dir
     ):
@@ -3297,8 +3169,7 @@ class TestGarminProcessor:
         }
 
         floors_file = temp_dir / "15007510_FLOORS_2025-08-07T12:00:00Z.json"
-        with open(floors_file, "w", encoding="utf-8") as f:
-            json.dump(floors_data, f)
+        floors_file.write_bytes(orjson.dumps(floors_data))
 
         # Act.
         processor.user_id = 1
@@ -3307,7 +3178,6 @@ class TestGarminProcessor:
         # Assert.
         mock_upsert.assert_not_called()
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_floors_invalid_values(
         self, mock_upsert, processor, mock_session, temp_dir
     ):
@@ -3334,8 +3204,7 @@ class TestGarminProcessor:
         }
 
         floors_file = temp_dir / "15007510_FLOORS_2025-08-07T12:00:00Z.json"
-        with open(floors_file, "w", encoding="utf-8") as f:
-            json.dump(floors_data, f)
+        floors_file.write_bytes(orjson.dumps(floors_data))
 
         # Act.
         processor.user_id = 1
@@ -3346,102 +3215,8 @@ class TestGarminProcessor:
         call_args = mock_upsert.call_args
         assert len(call_args[1]["model_instances"]) == 1
 
-    def test_process_floors_file_routing(self, processor, mock_session, temp_dir):
-        """
-        Test that FLOORS files are routed to _process_floors.
-
-        :param processor: GarminProcessor fixture.
-        :param mock_session: Mock session fixture.
-        :param temp_dir: Temporary directory fixture.
-        """
-
-        # Arrange.
-        floors_file = temp_dir / "123456789_FLOORS_2025-08-07T12:00:00Z.json"
-        minimal_data = {
-            "userProfilePK": 123456789,
-            "floorValuesArray": [
-                ["2025-08-07T15:00:00.0", "2025-08-07T15:15:00.0", 1, 0]
-            ],
-        }
-        with open(floors_file, "w", encoding="utf-8") as f:
-            json.dump(minimal_data, f)
-
-        file_set = FileSet(files={GARMIN_FILE_TYPES.FLOORS: [floors_file]})
-
-        # Act.
-        with patch.object(
-            processor, "_process_floors"
-        ) as mock_process_floors, patch.object(
-            processor, "_ensure_user_exists", return_value=1
-        ) as mock_ensure_user:
-            processor.process_file_set(file_set, mock_session)
-
-        # Assert.
-        mock_process_floors.assert_called_once_with(floors_file, mock_session)
-        mock_ensure_user.assert_called_once_with("123456789", mock_session)
-
-    @pytest.fixture
-    def sample_personal_records_data(self) -> List[Dict]:
-        """
-        Sample personal records data for testing.
-        """
-
-        return [
-            {
-                "id": 2071637774,
-                "typeId": 3,
-                "status": "ACCEPTED",
-                "activityId": 8649918243,
-                "activityName": "TT 5k",
-                "activityType": "running",
-                "value": 1091.7960205078125,
-                "prStartTimeGmt": 1650114005000,
-                "prStartTimeGmtFormatted": "2022-04-16T13:00:05.0",
-                "prStartTimeLocal": None,
-                "prStartTimeLocalFormatted": None,
-                "prTypeLabelKey": None,
-                "poolLengthUnit": None,
-            },
-            {
-                "id": 1619773303,
-                "typeId": 4,
-                "status": "ACCEPTED",
-                "activityId": 4914160155,
-                "activityName": "Prog tempo",
-                "activityType": "running",
-                "value": 2441.117919921875,
-                "prStartTimeGmt": 1589158420000,
-                "prStartTimeGmtFormatted": "2020-05-11T00:53:40.0",
-                "prStartTimeLocal": None,
-                "prStartTimeLocalFormatted": None,
-                "prTypeLabelKey": None,
-                "poolLengthUnit": None,
-            },
-            {
-                "id": 2030060315,
-                "typeId": 7,
-                "status": "ACCEPTED",
-                "activityId": 8110297915,
-                "activityName": "Long run",
-                "activityType": "running",
-                "value": 21018.83984375,
-                "prStartTimeGmt": 1642071671000,
-                "prStartTimeGmtFormatted": "2022-01-13T11:01:11.0",
-                "prStartTimeLocal": None,
-                "prStartTimeLocalFormatted": None,
-                "prTypeLabelKey": None,
-                "poolLengthUnit": None,
-            },
-        ]
-
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_personal_records_file(
-        self,
-        mock_upsert,
-        processor,
-        mock_session,
-        temp_dir,
-        sample_personal_records_data,
+        self, mock_upsert, processor, mock_session, temp_dir
     ):
         """
         Test _process_personal_records with complete personal records data.
@@ -3449,8 +3224,7 @@ class TestGarminProcessor:
 
         # Arrange.
         pr_file = temp_dir / "123456789_PERSONAL_RECORDS_2025-08-07T12:00:00Z.json"
-        with open(pr_file, "w", encoding="utf-8") as f:
-            json.dump(sample_personal_records_data, f)
+        pr_file.write_bytes(_SAMPLE_PERSONAL_RECORDS_BYTES)
 
         user_id = 1
         processor.user_id = user_id
@@ -3495,9 +3269,7 @@ class TestGarminProcessor:
         assert first_record.latest is True
 
         # Check timestamp conversion.
-        expected_timestamp = datetime.fromtimestamp(
-            1650114005000 / 1000, tz=timezone.utc
-        )
+        expected_timestamp = _EPOCH_MS_DATETIMES[1650114005000]
         assert first_record.timestamp == expected_timestamp
 
         # Verify upsert parameters match new primary key.
@@ -3508,7 +3280,6 @@ class TestGarminProcessor:
         ]
         assert call_args["on_conflict_update"] is True
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_personal_records_with_latest_logic(
         self, mock_upsert, processor, mock_session, temp_dir
     ):
@@ -3527,8 +3298,7 @@ class TestGarminProcessor:
         ]
 
         pr_file = temp_dir / "123456789_PERSONAL_RECORDS_2025-08-07T12:00:00Z.json"
-        with open(pr_file, "w", encoding="utf-8") as f:
-            json.dump(sample_data, f)
+        pr_file.write_bytes(orjson.dumps(sample_data))
 
         user_id = 1
         processor.user_id = user_id
@@ -3576,8 +3346,7 @@ class TestGarminProcessor:
         ]
 
         pr_file = temp_dir / "123456789_PERSONAL_RECORDS_2025-08-07T12:00:00Z.json"
-        with open(pr_file, "w", encoding="utf-8") as f:
-            json.dump(incomplete_data, f)
+        pr_file.write_bytes(orjson.dumps(incomplete_data))
 
         user_id = 1
         processor.user_id = user_id
@@ -3595,8 +3364,7 @@ class TestGarminProcessor:
 
         # Arrange.
         pr_file = temp_dir / "123456789_PERSONAL_RECORDS_2025-08-07T12:00:00Z.json"
-        with open(pr_file, "w", encoding="utf-8") as f:
-            json.dump({"not": "a list"}, f)
+        pr_file.write_bytes(orjson.dumps({"not": "a list"}))
 
         user_id = 1
         processor.user_id = user_id
@@ -3606,7 +3374,7 @@ class TestGarminProcessor:
             processor._process_personal_records(pr_file, mock_session)
 
     def test_process_personal_records_unknown_type_id(
-        self, processor, mock_session, temp_dir
+        self, mock_upsert, processor, mock_session, temp_dir
     ):
         """
         Test _process_personal_records with unknown type_id.
@@ -3623,8 +3391,7 @@ class TestGarminProcessor:
         ]
 
         pr_file = temp_dir / "123456789_PERSONAL_RECORDS_2025-08-07T12:00:00Z.json"
-        with open(pr_file, "w", encoding="utf-8") as f:
-            json.dump(sample_data, f)
+        pr_file.write_bytes(orjson.dumps(sample_data))
 
         user_id = 1
         processor.user_id = user_id
@@ -3648,10 +3415,7 @@ class TestGarminProcessor:
         mock_session.query.side_effect = mock_query_side_effect
 
         # Act.
-        with patch(
-            "dags.pipelines.garmin.process.upsert_model_instances"
-        ) as mock_upsert:
-            processor._process_personal_records(pr_file, mock_session)
+        processor._process_personal_records(pr_file, mock_session)
 
         # Assert.
         assert mock_upsert.called
@@ -3661,32 +3425,6 @@ class TestGarminProcessor:
             model_instances[0].label is None
         )  # Unknown type_id should result in None label.
 
-    def test_process_personal_records_file_routing(
-        self, processor, mock_session, temp_dir
-    ):
-        """
-        Test that PERSONAL_RECORDS files are properly routed to processing method.
-        """
-
-        # Arrange.
-        pr_file = temp_dir / "123456789_PERSONAL_RECORDS_2025-08-07T12:00:00Z.json"
-        with open(pr_file, "w", encoding="utf-8") as f:
-            json.dump([], f)
-
-        file_set = FileSet(files={GARMIN_FILE_TYPES.PERSONAL_RECORDS: [pr_file]})
-
-        # Act.
-        with patch.object(
-            processor, "_process_personal_records"
-        ) as mock_process_pr, patch.object(
-            processor, "_ensure_user_exists", return_value=1
-        ) as mock_ensure_user:
-            processor.process_file_set(file_set, mock_session)
-
-        # Assert.
-        mock_process_pr.assert_called_once_with(pr_file, mock_session)
-        mock_ensure_user.assert_called_once_with("123456789", mock_session)
-
     def test_personal_record_label_mapping(self):
         """
         Test that personal record type labels are correctly mapped.
@@ -3699,7 +3437,6 @@ class TestGarminProcessor:
         assert PR_TYPE_LABELS[12] == "Steps: Most in a Day"
         assert PR_TYPE_LABELS[17] == "Swim: Longest"
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_personal_records_with_missing_activity(
         self, mock_upsert, processor, mock_session, temp_dir
     ):
@@ -3734,8 +3471,7 @@ class TestGarminProcessor:
         ]
 
         pr_file = temp_dir / "123456789_PERSONAL_RECORDS_2025-08-07T12:00:00Z.json"
-        with open(pr_file, "w", encoding="utf-8") as f:
-            json.dump(sample_data, f)
+        pr_file.write_bytes(orjson.dumps(sample_data))
 
         # Mock session queries.
         def mock_query_side_effect(model):
@@ -3796,7 +3532,6 @@ class TestGarminProcessor:
         ]
         assert len(info_calls) == 1
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_personal_records_all_activities_missing(
         self, mock_upsert, processor, mock_session, temp_dir
     ):
@@ -3826,8 +3561,7 @@ class TestGarminProcessor:
         ]
 
         pr_file = temp_dir / "123456789_PERSONAL_RECORDS_2025-08-07T12:00:00Z.json"
-        with open(pr_file, "w", encoding="utf-8") as f:
-            json.dump(sample_data, f)
+        pr_file.write_bytes(orjson.dumps(sample_data))
 
         # Mock session queries.
         def mock_query_side_effect(model):
@@ -3871,7 +3605,6 @@ class TestGarminProcessor:
         ]
         assert len(warning_calls) == 1
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_personal_records_with_steps_records(
         self, mock_upsert, processor, mock_session, temp_dir
     ):
@@ -3911,8 +3644,7 @@ class TestGarminProcessor:
         ]
 
         pr_file = temp_dir / "123456789_PERSONAL_RECORDS_2025-08-07T12:00:00Z.json"
-        with open(pr_file, "w", encoding="utf-8") as f:
-            json.dump(sample_data, f)
+        pr_file.write_bytes(orjson.dumps(sample_data))
 
         # Mock session queries.
         def mock_query_side_effect(model):
@@ -3980,31 +3712,8 @@ class TestGarminProcessor:
     # Race Predictions Processing Tests.
     # ==================================================================================
 
-    @pytest.fixture
-    def sample_race_predictions_data(self) -> Dict:
-        """
-        Sample race predictions data for testing.
-        """
-
-        return {
-            "userId": 15007510,
-            "fromCalendarDate": None,
-            "toCalendarDate": None,
-            "calendarDate": "2025-08-08",
-            "time5K": 1146,
-            "time10K": 2465,
-            "timeHalfMarathon": 5663,
-            "timeMarathon": 12644,
-        }
-
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_race_predictions_file(
-        self,
-        mock_upsert,
-        processor,
-        mock_session,
-        temp_dir,
-        sample_race_predictions_data,
+        self, mock_upsert, processor, mock_session, temp_dir
     ):
         """
         Test _process_race_predictions with complete race predictions data.
@@ -4012,8 +3721,7 @@ class TestGarminProcessor:
 
         # Arrange.
         rp_file = temp_dir / "123456789_RACE_PREDICTIONS_2025-08-07T12:00:00Z.json"
-        with open(rp_file, "w", encoding="utf-8") as f:
-            json.dump(sample_race_predictions_data, f)
+        rp_file.write_bytes(_SAMPLE_RACE_PREDICTIONS_BYTES)
 
         user_id = 1
         processor.user_id = user_id
@@ -4053,7 +3761,6 @@ class TestGarminProcessor:
         assert race_prediction.time_marathon == 12644
         assert race_prediction.latest is True
 
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_race_predictions_with_latest_logic(
         self, mock_upsert, processor, mock_session, temp_dir
     ):
@@ -4069,8 +3776,7 @@ class TestGarminProcessor:
         }
 
         rp_file = temp_dir / "123456789_RACE_PREDICTIONS_2025-08-07T12:00:00Z.json"
-        with open(rp_file, "w", encoding="utf-8") as f:
-            json.dump(sample_data, f)
+        rp_file.write_bytes(orjson.dumps(sample_data))
 
         user_id = 1
         processor.user_id = user_id
@@ -4118,8 +3824,7 @@ class TestGarminProcessor:
         }
 
         rp_file = temp_dir / "123456789_RACE_PREDICTIONS_2025-08-07T12:00:00Z.json"
-        with open(rp_file, "w", encoding="utf-8") as f:
-            json.dump(sample_data, f)
+        rp_file.write_bytes(orjson.dumps(sample_data))
 
         user_id = 1
         processor.user_id = user_id
@@ -4129,33 +3834,6 @@ class TestGarminProcessor:
         with pytest.raises(KeyError):
             processor._process_race_predictions(rp_file, mock_session)
 
-    def test_process_race_predictions_file_routing(
-        self, processor, mock_session, temp_dir
-    ):
-        """
-        Test that RACE_PREDICTIONS files are routed correctly.
-        """
-
-        # Arrange.
-        rp_file = temp_dir / "123456789_RACE_PREDICTIONS_2025-08-07T12:00:00Z.json"
-        with open(rp_file, "w", encoding="utf-8") as f:
-            json.dump({"calendarDate": "2025-08-08"}, f)
-
-        file_set = FileSet(files={GARMIN_FILE_TYPES.RACE_PREDICTIONS: [rp_file]})
-
-        # Act.
-        with patch.object(
-            processor, "_process_race_predictions"
-        ) as mock_process_rp, patch.object(
-            processor, "_ensure_user_exists", return_value=1
-        ) as mock_ensure_user:
-            processor.process_file_set(file_set, mock_session)
-
-        # Assert.
-        mock_process_rp.assert_called_once_with(rp_file, mock_session)
-        mock_ensure_user.assert_called_once_with("123456789", mock_session)
-
-    @patch("dags.pipelines.garmin.process.upsert_model_instances")
     def test_process_race_predictions_partial_data(
         self, mock_upsert, processor, mock_session, temp_dir
     ):
@@ -4171,8 +3849,7 @@ class TestGarminProcessor:
         }
 
         rp_file = temp_dir / "123456789_RACE_PREDICTIONS_2025-08-07T12:00:00Z.json"
-        with open(rp_file, "w", encoding="utf-8") as f:
-            json.dump(sample_data, f)
+        rp_file.write_bytes(orjson.dumps(sample_data))
 
         user_id = 1
         processor.user_id = user_id
@@ -4271,13 +3948,14 @@ class TestGarminProcessor:
                 processor._process_fit_file(fit_file, mock_session)
 
         # Assert.
-        mock_session.bulk_save_objects.assert_called_once()
-        ts_metrics = mock_session.bulk_save_objects.call_args[0][0]
+        mock_session.bulk_insert_mappings.assert_called_once()
+        model, ts_metrics = mock_session.bulk_insert_mappings.call_args[0]
+        assert model is ActivityTsMetric
         assert len(ts_metrics) == 1
-        assert ts_metrics[0].activity_id == activity_id
-        assert ts_metrics[0].name == "heart_rate"
-        assert ts_metrics[0].value == 150.0
-        assert ts_metrics[0].units == "bpm"
+        assert ts_metrics[0]["activity_id"] == activity_id
+        assert ts_metrics[0]["name"] == "heart_rate"
+        assert ts_metrics[0]["value"] == 150.0
+        assert ts_metrics[0]["units"] == "bpm"
         assert mock_activity.ts_data_available is True
 
     def test_process_fit_file_already_processed(
@@ -4303,6 +3981,7 @@ class TestGarminProcessor:
         processor._process_fit_file(fit_file, mock_session)
 
         # Assert - no processing should occur since ts_data_available is True.
+        mock_session.bulk_insert_mappings.assert_not_called()
         mock_session.bulk_save_objects.assert_not_called()
 
     def test_process_fit_file_activity_not_found(
@@ -4388,10 +4067,10 @@ class TestGarminProcessor:
                 processor._process_fit_file(fit_file, mock_session)
 
         # Assert - only valid field should be processed.
-        mock_session.bulk_save_objects.assert_called_once()
-        ts_metrics = mock_session.bulk_save_objects.call_args[0][0]
+        mock_session.bulk_insert_mappings.assert_called_once()
+        _, ts_metrics = mock_session.bulk_insert_mappings.call_args[0]
         assert len(ts_metrics) == 1
-        assert ts_metrics[0].name == "heart_rate"
+        assert ts_metrics[0]["name"] == "heart_rate"
 
     def test_process_fit_file_handles_fit_decode_error(
         self, processor, mock_session, temp_dir
@@ -4426,8 +4105,8 @@ class TestGarminProcessor:
 
         # Arrange.
         json_file = temp_dir / "15007510_USER_PROFILE_2025-08-07T12:00:00Z.json"
-        json_file.write_text(
-            json.dumps({"userData": {"gender": "MALE"}, "full_name": "Test User"})
+        json_file.write_bytes(
+            orjson.dumps({"userData": {"gender": "MALE"}, "full_name": "Test User"})
         )
 
         fit_file = temp_dir / "15007510_ACTIVITY_12345_2025-08-07T12:00:00Z.fit"
@@ -4441,7 +4120,8 @@ class TestGarminProcessor:
             }
         )
 
-        # Mock existing activity.
+        # Mock existing user and activity.
+        mock_session.execute.return_value.first.return_value = (False, "Test User")
         mock_activity = MagicMock()
         mock_activity.activity_id = 12345
         mock_activity.ts_data_available = False